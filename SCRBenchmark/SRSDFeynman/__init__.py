@@ -1,121 +1,145 @@
-from .feynman import FEYNMAN_EQUATION_CLASS_DICT as AllEquations
-from .feynman import FeynmanICh6Eq20
-from .feynman import FeynmanICh6Eq20a
-from .feynman import FeynmanICh6Eq20b
-from .feynman import FeynmanICh8Eq14
-from .feynman import FeynmanICh9Eq18
-from .feynman import FeynmanICh10Eq7
-from .feynman import FeynmanICh11Eq19
-from .feynman import FeynmanICh12Eq1
-from .feynman import FeynmanICh12Eq2
-from .feynman import FeynmanICh12Eq4
-from .feynman import FeynmanICh12Eq5
-from .feynman import FeynmanICh12Eq11
-from .feynman import FeynmanICh13Eq4
-from .feynman import FeynmanICh13Eq12
-from .feynman import FeynmanICh14Eq3
-from .feynman import FeynmanICh14Eq4
-from .feynman import FeynmanICh15Eq10
-from .feynman import FeynmanICh15Eq3t
-from .feynman import FeynmanICh15Eq3x
-from .feynman import FeynmanICh16Eq6
-from .feynman import FeynmanICh18Eq4
-from .feynman import FeynmanICh18Eq12
-from .feynman import FeynmanICh18Eq16
-from .feynman import FeynmanICh24Eq6
-from .feynman import FeynmanICh25Eq13
-from .feynman import FeynmanICh26Eq2
-from .feynman import FeynmanICh27Eq6
-from .feynman import FeynmanICh29Eq4
-from .feynman import FeynmanICh29Eq16
-from .feynman import FeynmanICh30Eq3
-from .feynman import FeynmanICh30Eq5
-from .feynman import FeynmanICh32Eq5
-from .feynman import FeynmanICh32Eq17
-from .feynman import FeynmanICh34Eq10
-from .feynman import FeynmanICh34Eq8
-from .feynman import FeynmanICh34Eq14
-from .feynman import FeynmanICh34Eq27
-from .feynman import FeynmanICh37Eq4
-from .feynman import FeynmanICh38Eq12
-from .feynman import FeynmanICh39Eq10
-from .feynman import FeynmanICh39Eq11
-from .feynman import FeynmanICh39Eq22
-from .feynman import FeynmanICh40Eq1
-from .feynman import FeynmanICh41Eq16
-from .feynman import FeynmanICh43Eq16
-from .feynman import FeynmanICh43Eq31
-from .feynman import FeynmanICh43Eq43
-from .feynman import FeynmanICh44Eq4
-from .feynman import FeynmanICh47Eq23
-from .feynman import FeynmanICh48Eq2
-from .feynman import FeynmanICh50Eq26
-from .feynman import FeynmanIICh2Eq42
-from .feynman import FeynmanIICh3Eq24
-from .feynman import FeynmanIICh4Eq23
-from .feynman import FeynmanIICh6Eq11
-from .feynman import FeynmanIICh6Eq15a
-from .feynman import FeynmanIICh6Eq15b
-from .feynman import FeynmanIICh8Eq7
-from .feynman import FeynmanIICh8Eq31
-from .feynman import FeynmanIICh10Eq9
-from .feynman import FeynmanIICh11Eq3
-from .feynman import FeynmanIICh11Eq17
-from .feynman import FeynmanIICh11Eq20
-from .feynman import FeynmanIICh11Eq27
-from .feynman import FeynmanIICh11Eq28
-from .feynman import FeynmanIICh13Eq17
-from .feynman import FeynmanIICh13Eq23
-from .feynman import FeynmanIICh13Eq34
-from .feynman import FeynmanIICh15Eq4
-from .feynman import FeynmanIICh15Eq5
-from .feynman import FeynmanIICh21Eq32
-from .feynman import FeynmanIICh24Eq17
-from .feynman import FeynmanIICh27Eq16
-from .feynman import FeynmanIICh27Eq18
-from .feynman import FeynmanIICh34Eq2a
-from .feynman import FeynmanIICh34Eq2
-from .feynman import FeynmanIICh34Eq11
-from .feynman import FeynmanIICh34Eq29a
-from .feynman import FeynmanIICh34Eq29b
-from .feynman import FeynmanIICh35Eq18
-from .feynman import FeynmanIICh35Eq21
-from .feynman import FeynmanIICh36Eq38
-from .feynman import FeynmanIICh37Eq1
-from .feynman import FeynmanIICh38Eq3
-from .feynman import FeynmanIICh38Eq14
-from .feynman import FeynmanIIICh4Eq32
-from .feynman import FeynmanIIICh4Eq33
-from .feynman import FeynmanIIICh7Eq38
-from .feynman import FeynmanIIICh8Eq54
-from .feynman import FeynmanIIICh9Eq52
-from .feynman import FeynmanIIICh10Eq19
-from .feynman import FeynmanIIICh12Eq43
-from .feynman import FeynmanIIICh13Eq18
-from .feynman import FeynmanIIICh14Eq14
-from .feynman import FeynmanIIICh15Eq12
-from .feynman import FeynmanIIICh15Eq14
-from .feynman import FeynmanIIICh15Eq27
-from .feynman import FeynmanIIICh17Eq37
-from .feynman import FeynmanIIICh19Eq51
-from .feynman import FeynmanIIICh21Eq20
-from .feynman import FeynmanBonus1
-from .feynman import FeynmanBonus2
-from .feynman import FeynmanBonus3
-from .feynman import FeynmanBonus4
-from .feynman import FeynmanBonus5
-from .feynman import FeynmanBonus6
-from .feynman import FeynmanBonus7
-from .feynman import FeynmanBonus8
-from .feynman import FeynmanBonus9
-from .feynman import FeynmanBonus10
-from .feynman import FeynmanBonus11
-from .feynman import FeynmanBonus12
-from .feynman import FeynmanBonus13
-from .feynman import FeynmanBonus14
-from .feynman import FeynmanBonus15
-from .feynman import FeynmanBonus16
-from .feynman import FeynmanBonus17
-from .feynman import FeynmanBonus18
-from .feynman import FeynmanBonus19
-from .feynman import FeynmanBonus20
\ No newline at end of file
+# the equation classes are defined in .feynman, which is imported on the first access of one of them
+# (or of AllEquations) through the module level __getattr__ (PEP 562), not when the package is imported
+import importlib
+
+EQUATION_CLASS_NAMES = [
+    'FeynmanICh6Eq20',
+    'FeynmanICh6Eq20a',
+    'FeynmanICh6Eq20b',
+    'FeynmanICh8Eq14',
+    'FeynmanICh9Eq18',
+    'FeynmanICh10Eq7',
+    'FeynmanICh11Eq19',
+    'FeynmanICh12Eq1',
+    'FeynmanICh12Eq2',
+    'FeynmanICh12Eq4',
+    'FeynmanICh12Eq5',
+    'FeynmanICh12Eq11',
+    'FeynmanICh13Eq4',
+    'FeynmanICh13Eq12',
+    'FeynmanICh14Eq3',
+    'FeynmanICh14Eq4',
+    'FeynmanICh15Eq10',
+    'FeynmanICh15Eq3t',
+    'FeynmanICh15Eq3x',
+    'FeynmanICh16Eq6',
+    'FeynmanICh18Eq4',
+    'FeynmanICh18Eq12',
+    'FeynmanICh18Eq16',
+    'FeynmanICh24Eq6',
+    'FeynmanICh25Eq13',
+    'FeynmanICh26Eq2',
+    'FeynmanICh27Eq6',
+    'FeynmanICh29Eq4',
+    'FeynmanICh29Eq16',
+    'FeynmanICh30Eq3',
+    'FeynmanICh30Eq5',
+    'FeynmanICh32Eq5',
+    'FeynmanICh32Eq17',
+    'FeynmanICh34Eq10',
+    'FeynmanICh34Eq8',
+    'FeynmanICh34Eq14',
+    'FeynmanICh34Eq27',
+    'FeynmanICh37Eq4',
+    'FeynmanICh38Eq12',
+    'FeynmanICh39Eq10',
+    'FeynmanICh39Eq11',
+    'FeynmanICh39Eq22',
+    'FeynmanICh40Eq1',
+    'FeynmanICh41Eq16',
+    'FeynmanICh43Eq16',
+    'FeynmanICh43Eq31',
+    'FeynmanICh43Eq43',
+    'FeynmanICh44Eq4',
+    'FeynmanICh47Eq23',
+    'FeynmanICh48Eq2',
+    'FeynmanICh50Eq26',
+    'FeynmanIICh2Eq42',
+    'FeynmanIICh3Eq24',
+    'FeynmanIICh4Eq23',
+    'FeynmanIICh6Eq11',
+    'FeynmanIICh6Eq15a',
+    'FeynmanIICh6Eq15b',
+    'FeynmanIICh8Eq7',
+    'FeynmanIICh8Eq31',
+    'FeynmanIICh10Eq9',
+    'FeynmanIICh11Eq3',
+    'FeynmanIICh11Eq17',
+    'FeynmanIICh11Eq20',
+    'FeynmanIICh11Eq27',
+    'FeynmanIICh11Eq28',
+    'FeynmanIICh13Eq17',
+    'FeynmanIICh13Eq23',
+    'FeynmanIICh13Eq34',
+    'FeynmanIICh15Eq4',
+    'FeynmanIICh15Eq5',
+    'FeynmanIICh21Eq32',
+    'FeynmanIICh24Eq17',
+    'FeynmanIICh27Eq16',
+    'FeynmanIICh27Eq18',
+    'FeynmanIICh34Eq2a',
+    'FeynmanIICh34Eq2',
+    'FeynmanIICh34Eq11',
+    'FeynmanIICh34Eq29a',
+    'FeynmanIICh34Eq29b',
+    'FeynmanIICh35Eq18',
+    'FeynmanIICh35Eq21',
+    'FeynmanIICh36Eq38',
+    'FeynmanIICh37Eq1',
+    'FeynmanIICh38Eq3',
+    'FeynmanIICh38Eq14',
+    'FeynmanIIICh4Eq32',
+    'FeynmanIIICh4Eq33',
+    'FeynmanIIICh7Eq38',
+    'FeynmanIIICh8Eq54',
+    'FeynmanIIICh9Eq52',
+    'FeynmanIIICh10Eq19',
+    'FeynmanIIICh12Eq43',
+    'FeynmanIIICh13Eq18',
+    'FeynmanIIICh14Eq14',
+    'FeynmanIIICh15Eq12',
+    'FeynmanIIICh15Eq14',
+    'FeynmanIIICh15Eq27',
+    'FeynmanIIICh17Eq37',
+    'FeynmanIIICh19Eq51',
+    'FeynmanIIICh21Eq20',
+    'FeynmanBonus1',
+    'FeynmanBonus2',
+    'FeynmanBonus3',
+    'FeynmanBonus4',
+    'FeynmanBonus5',
+    'FeynmanBonus6',
+    'FeynmanBonus7',
+    'FeynmanBonus8',
+    'FeynmanBonus9',
+    'FeynmanBonus10',
+    'FeynmanBonus11',
+    'FeynmanBonus12',
+    'FeynmanBonus13',
+    'FeynmanBonus14',
+    'FeynmanBonus15',
+    'FeynmanBonus16',
+    'FeynmanBonus17',
+    'FeynmanBonus18',
+    'FeynmanBonus19',
+    'FeynmanBonus20',
+]
+
+__all__ = ['AllEquations'] + EQUATION_CLASS_NAMES
+
+
+def __getattr__(name):
+    if name == 'feynman':
+        value = importlib.import_module('.feynman', __name__)
+    elif name == 'AllEquations':
+        value = importlib.import_module('.feynman', __name__).FEYNMAN_EQUATION_CLASS_DICT
+    elif name in EQUATION_CLASS_NAMES:
+        value = getattr(importlib.import_module('.feynman', __name__), name)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
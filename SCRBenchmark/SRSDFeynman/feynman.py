@@ -12,12 +12,15 @@
 from collections import OrderedDict
 
 import numpy as np
-import sympy
 
 from SCRBenchmark.Constants import StringKeys as sk
 from SCRBenchmark.base import KnownEquation
+from SCRBenchmark.lazy import lazy_import
 from SCRBenchmark.registry import register_eq_class
-from SCRBenchmark.sampling import DefaultSampling, IntegerSampling, SimpleSampling
+from SCRBenchmark.sampling import DefaultSampling, IntegerSampling, SimpleSampling, ValidityBound
+
+# only used by build_sympy_eq, loaded on first use
+sympy = lazy_import('sympy')
 
 FEYNMAN_EQUATION_CLASS_DICT = OrderedDict()
 GRAVITATIONAL_CONSTANT = 6.67430e-11
@@ -58,8 +61,10 @@ class FeynmanICh6Eq20(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-1, 1.0e1), DefaultSampling(1.0e-1, 1.0e1, uses_negative=False)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.exp(-(x[0] / x[1]) ** 2 / 2) / (sympy.sqrt(2 * sympy.pi) * x[1])
+        return sympy.exp(-(x[0] / x[1]) ** 2 / 2) / (sympy.sqrt(2 * sympy.pi) * x[1])
 
     def eq_func(self, x):
         return np.exp(-(x[0] / x[1]) ** 2 / 2) / (np.sqrt(2 * np.pi) * x[1])
@@ -83,8 +88,10 @@ class FeynmanICh6Eq20a(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-1, 1.0e1)]
         
         super().__init__(num_vars=1, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.exp(-x[0] ** 2 / 2) / sympy.sqrt(2 * sympy.pi)
+        return sympy.exp(-x[0] ** 2 / 2) / sympy.sqrt(2 * sympy.pi)
 
     def eq_func(self, x):
         return np.exp(-x[0] ** 2 / 2) / np.sqrt(2 * np.pi)
@@ -113,8 +120,10 @@ class FeynmanICh6Eq20b(KnownEquation):
             ]
         
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.exp(-((x[0] - x[1]) / x[2]) ** 2 / 2) / sympy.sqrt(2 * sympy.pi)
+        return sympy.exp(-((x[0] - x[1]) / x[2]) ** 2 / 2) / sympy.sqrt(2 * sympy.pi)
 
     def eq_func(self, x):
         return np.exp(-((x[0] - x[1]) / x[2]) ** 2 / 2)/(np.sqrt(2 * np.pi) * x[2])
@@ -142,8 +151,10 @@ class FeynmanICh8Eq14(KnownEquation):
             ]
         
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.sqrt((x[0] - x[1]) ** 2 + (x[2] - x[3]) ** 2)
+        return sympy.sqrt((x[0] - x[1]) ** 2 + (x[2] - x[3]) ** 2)
 
     def eq_func(self, x):
         return np.sqrt((x[0] - x[1]) ** 2 + (x[2] - x[3]) ** 2)
@@ -180,8 +191,10 @@ class FeynmanICh9Eq18(KnownEquation):
             ]
         
         super().__init__(num_vars=8, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = \
+        return \
             GRAVITATIONAL_CONSTANT * x[0] * x[1] / ((x[2] - x[3]) ** 2 + (x[4] - x[5]) ** 2 + (x[6] - x[7]) ** 2)
 
     def eq_func(self, x):
@@ -211,8 +224,10 @@ class FeynmanICh10Eq7(KnownEquation):
             ]
         
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
+        return x[0] / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
 
     def eq_func(self, x):
         return x[0] / np.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
@@ -243,8 +258,10 @@ class FeynmanICh11Eq19(KnownEquation):
             ]
         
         super().__init__(num_vars=6, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] + x[2] * x[3] + x[4] * x[5]
+        return x[0] * x[1] + x[2] * x[3] + x[4] * x[5]
 
     def eq_func(self, x):
         return x[0] * x[1] + x[2] * x[3] + x[4] * x[5]
@@ -271,8 +288,10 @@ class FeynmanICh12Eq1(KnownEquation):
             ]
         
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1]
+        return x[0] * x[1]
 
     def eq_func(self, x):
         return x[0] * x[1]
@@ -301,8 +320,10 @@ class FeynmanICh12Eq2(KnownEquation):
             ]
         
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] * x[2] / (4 * sympy.pi * ELECTRIC_CONSTANT * x[2] ** 3)
+        return x[0] * x[1] * x[2] / (4 * sympy.pi * ELECTRIC_CONSTANT * x[2] ** 3)
 
     def eq_func(self, x):
         return x[0] * x[1] * x[2] / (4 * np.pi * ELECTRIC_CONSTANT * x[2] ** 3)
@@ -327,8 +348,10 @@ class FeynmanICh12Eq4(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-1, 1.0e1), DefaultSampling(1.0e-1, 1.0e1, uses_negative=False)]
         
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] / (4 * sympy.pi * ELECTRIC_CONSTANT * x[1] ** 3)
+        return x[0] * x[1] / (4 * sympy.pi * ELECTRIC_CONSTANT * x[1] ** 3)
 
     def eq_func(self, x):
         return x[0] * x[1] / (4 * np.pi * ELECTRIC_CONSTANT * x[1] ** 3)
@@ -352,8 +375,10 @@ class FeynmanICh12Eq5(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-1, 1.0e1), DefaultSampling(1.0e-1, 1.0e1)]
         
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1]
+        return x[0] * x[1]
 
     def eq_func(self, x):
         return x[0] * x[1]
@@ -385,8 +410,10 @@ class FeynmanICh12Eq11(KnownEquation):
             ]
         
         super().__init__(num_vars=5, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * (x[1] + x[2] * x[3] * sympy.sin(x[4]))
+        return x[0] * (x[1] + x[2] * x[3] * sympy.sin(x[4]))
 
     def eq_func(self, x):
         return x[0] * (x[1] + x[2] * x[3] * np.sin(x[4]))
@@ -415,8 +442,10 @@ class FeynmanICh13Eq4(KnownEquation):
             ]
         
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / 2 * x[0] * (x[1] ** 2 + x[2] ** 2 + x[3] ** 2)
+        return 1 / 2 * x[0] * (x[1] ** 2 + x[2] ** 2 + x[3] ** 2)
 
     def eq_func(self, x):
         return 1 / 2 * x[0] * (x[1] ** 2 + x[2] ** 2 + x[3] ** 2)
@@ -447,8 +476,10 @@ class FeynmanICh13Eq12(KnownEquation):
             ]
         
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = GRAVITATIONAL_CONSTANT * x[0] * x[1] * (1 / x[2] - 1 / x[3])
+        return GRAVITATIONAL_CONSTANT * x[0] * x[1] * (1 / x[2] - 1 / x[3])
 
     def eq_func(self, x):
         return GRAVITATIONAL_CONSTANT * x[0] * x[1] * (1 / x[2] - 1 / x[3])
@@ -472,8 +503,10 @@ class FeynmanICh14Eq3(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-2, 1.0, uses_negative=False), DefaultSampling(1.0e-2, 1.0)]
         
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = GRAVITATIONAL_ACCELERATION * x[0] * x[1]
+        return GRAVITATIONAL_ACCELERATION * x[0] * x[1]
 
     def eq_func(self, x):
         return GRAVITATIONAL_ACCELERATION * x[0] * x[1]
@@ -497,8 +530,10 @@ class FeynmanICh14Eq4(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e2, 1.0e4, uses_negative=False), DefaultSampling(1.0e-2, 1.0)]
         
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / 2 * x[0] * x[1] ** 2
+        return 1 / 2 * x[0] * x[1] ** 2
 
     def eq_func(self, x):
         return 1 / 2 * x[0] * x[1] ** 2
@@ -523,8 +558,10 @@ class FeynmanICh15Eq10(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-2, 1.0, uses_negative=False), DefaultSampling(1.0e5, 1.0e7)]
         
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
+        return x[0] * x[1] / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
 
     def eq_func(self, x):
         return x[0] * x[1] / np.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
@@ -553,8 +590,10 @@ class FeynmanICh15Eq3t(KnownEquation):
             ]
         
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (x[0] - x[1] * x[2] / SPEED_OF_LIGHT ** 2) / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
+        return (x[0] - x[1] * x[2] / SPEED_OF_LIGHT ** 2) / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
 
     def eq_func(self, x):
         return (x[0] - x[1] * x[2] / SPEED_OF_LIGHT ** 2) / np.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
@@ -583,8 +622,10 @@ class FeynmanICh15Eq3x(KnownEquation):
             ]
         
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (x[0] - x[1] * x[2]) / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
+        return (x[0] - x[1] * x[2]) / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
 
     def eq_func(self, x):
         return (x[0] - x[1] * x[2]) / np.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
@@ -609,8 +650,10 @@ class FeynmanICh16Eq6(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e6, 1.0e8), DefaultSampling(1.0e6, 1.0e8)]
         
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (x[0] + x[1]) / (1 + x[0] * x[1] / SPEED_OF_LIGHT ** 2)
+        return (x[0] + x[1]) / (1 + x[0] * x[1] / SPEED_OF_LIGHT ** 2)
 
     def eq_func(self, x):
         return (x[0] + x[1]) / (1 + x[0] * x[1] / SPEED_OF_LIGHT ** 2)
@@ -640,8 +683,10 @@ class FeynmanICh18Eq4(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (x[0] * x[1] + x[2] * x[3]) / (x[0] + x[2])
+        return (x[0] * x[1] + x[2] * x[3]) / (x[0] + x[2])
 
     def eq_func(self, x):
         return (x[0] * x[1] + x[2] * x[3]) / (x[0] + x[2])
@@ -669,8 +714,10 @@ class FeynmanICh18Eq12(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] * sympy.sin(x[2])
+        return x[0] * x[1] * sympy.sin(x[2])
 
     def eq_func(self, x):
         return x[0] * x[1] * np.sin(x[2])
@@ -700,8 +747,10 @@ class FeynmanICh18Eq16(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] * x[2] * sympy.sin(x[3])
+        return x[0] * x[1] * x[2] * sympy.sin(x[3])
 
     def eq_func(self, x):
         return x[0] * x[1] * x[2] * np.sin(x[3])
@@ -730,8 +779,10 @@ class FeynmanICh24Eq6(KnownEquation):
             ]
         
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / 2 * x[0] * (x[1] ** 2 + x[2] ** 2) * 1/2 * x[3] ** 2
+        return 1 / 2 * x[0] * (x[1] ** 2 + x[2] ** 2) * 1/2 * x[3] ** 2
 
     def eq_func(self, x):
         return 1 / 2 * x[0] * (x[1] ** 2 + x[2] ** 2) * 1/2 * x[3] ** 2
@@ -756,8 +807,10 @@ class FeynmanICh25Eq13(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-5, 1.0e-3), DefaultSampling(1.0e-5, 1.0e-3, uses_negative=False)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / x[1]
+        return x[0] / x[1]
 
     def eq_func(self, x):
         return x[0] / x[1]
@@ -785,8 +838,10 @@ class FeynmanICh26Eq2(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.sin(x[0]) / sympy.sin(x[1])
+        return sympy.sin(x[0]) / sympy.sin(x[1])
 
     def eq_func(self, x):
         return np.sin(x[0]) / np.sin(x[1])
@@ -817,8 +872,10 @@ class FeynmanICh27Eq6(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / (1 / x[0] + x[1] / x[2])
+        return 1 / (1 / x[0] + x[1] / x[2])
 
     def eq_func(self, x):
         return 1 / (1 / x[0] + x[1] / x[2])
@@ -843,8 +900,10 @@ class FeynmanICh29Eq4(KnownEquation):
             ]
 
         super().__init__(num_vars=1, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / SPEED_OF_LIGHT
+        return x[0] / SPEED_OF_LIGHT
 
     def eq_func(self, x):
         return x[0] / SPEED_OF_LIGHT
@@ -874,8 +933,10 @@ class FeynmanICh29Eq16(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.sqrt(x[0] ** 2 + x[1] ** 2 + 2 * x[0] * x[1] * sympy.cos(x[2] - x[3]))
+        return sympy.sqrt(x[0] ** 2 + x[1] ** 2 + 2 * x[0] * x[1] * sympy.cos(x[2] - x[3]))
 
     def eq_func(self, x):
         return np.sqrt(x[0] ** 2 + x[1] ** 2 + 2 * x[0] * x[1] * np.cos(x[2] - x[3]))
@@ -904,8 +965,10 @@ class FeynmanICh30Eq3(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * sympy.sin(x[1] * x[2] / 2) ** 2 / sympy.sin(x[2] / 2) ** 2
+        return x[0] * sympy.sin(x[1] * x[2] / 2) ** 2 / sympy.sin(x[2] / 2) ** 2
 
     def eq_func(self, x):
         return x[0] * np.sin(x[1] * x[2] / 2) ** 2 / np.sin(x[2] / 2) ** 2
@@ -936,8 +999,10 @@ class FeynmanICh30Eq5(KnownEquation):
             ]
         
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / (x[1] * sympy.sin(x[2]))
+        return x[0] / (x[1] * sympy.sin(x[2]))
 
     def eq_func(self, x):
         return x[0] / (x[1] * np.sin(x[2]))
@@ -965,8 +1030,10 @@ class FeynmanICh32Eq5(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] ** 2 * x[1] ** 2 / (6 * sympy.pi * ELECTRIC_CONSTANT * SPEED_OF_LIGHT ** 3)
+        return x[0] ** 2 * x[1] ** 2 / (6 * sympy.pi * ELECTRIC_CONSTANT * SPEED_OF_LIGHT ** 3)
 
     def eq_func(self, x):
         return x[0] ** 2 * x[1] ** 2 / (6 * np.pi * ELECTRIC_CONSTANT * SPEED_OF_LIGHT ** 3)
@@ -996,8 +1063,10 @@ class FeynmanICh32Eq17(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (1 / 2 * ELECTRIC_CONSTANT * SPEED_OF_LIGHT * x[0] ** 2) \
+        return (1 / 2 * ELECTRIC_CONSTANT * SPEED_OF_LIGHT * x[0] ** 2) \
                         * (8 * sympy.pi * x[1] ** 2 / 3) * (x[2] ** 4 / (x[2] ** 2 - x[3] ** 2) ** 2)
 
     def eq_func(self, x):
@@ -1024,8 +1093,10 @@ class FeynmanICh34Eq10(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e9, 1.0e11, uses_negative=False), DefaultSampling(1.0e5, 1.0e7)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / (1 - x[1] / SPEED_OF_LIGHT)
+        return x[0] / (1 - x[1] / SPEED_OF_LIGHT)
 
     def eq_func(self, x):
         return x[0] / (1 - x[1] / SPEED_OF_LIGHT)
@@ -1055,8 +1126,10 @@ class FeynmanICh34Eq8(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] * x[2] / x[3]
+        return x[0] * x[1] * x[2] / x[3]
 
     def eq_func(self, x):
         return x[0] * x[1] * x[2] / x[3]
@@ -1082,8 +1155,10 @@ class FeynmanICh34Eq14(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e6, 1.0e8), DefaultSampling(1.0e9, 1.0e11, uses_negative=False)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (1 + x[0] / SPEED_OF_LIGHT) / sympy.sqrt(1 - x[0] ** 2 / SPEED_OF_LIGHT ** 2) * x[1]
+        return (1 + x[0] / SPEED_OF_LIGHT) / sympy.sqrt(1 - x[0] ** 2 / SPEED_OF_LIGHT ** 2) * x[1]
 
     def eq_func(self, x):
         return (1 + x[0] / SPEED_OF_LIGHT) / np.sqrt(1 - x[0] ** 2 / SPEED_OF_LIGHT ** 2) * x[1]
@@ -1106,8 +1181,10 @@ class FeynmanICh34Eq27(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e9, 1.0e11, uses_negative=False)]
 
         super().__init__(num_vars=1, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (PLANCK_CONSTANT / (2 * sympy.pi)) * x[0]
+        return (PLANCK_CONSTANT / (2 * sympy.pi)) * x[0]
 
     def eq_func(self, x):
         return (PLANCK_CONSTANT / (2 * np.pi)) * x[0]
@@ -1136,8 +1213,10 @@ class FeynmanICh37Eq4(KnownEquation):
             ]
         
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] + x[1] + 2 * sympy.sqrt(x[0] * x[1]) * sympy.cos(x[2])
+        return x[0] + x[1] + 2 * sympy.sqrt(x[0] * x[1]) * sympy.cos(x[2])
 
     def eq_func(self, x):
         return x[0] + x[1] + 2 * np.sqrt(x[0] * x[1]) * np.cos(x[2])
@@ -1166,8 +1245,10 @@ class FeynmanICh38Eq12(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 4 * sympy.pi * ELECTRIC_CONSTANT * (PLANCK_CONSTANT / (2 * sympy.pi)) ** 2 / (x[0] * x[1] ** 2)
+        return 4 * sympy.pi * ELECTRIC_CONSTANT * (PLANCK_CONSTANT / (2 * sympy.pi)) ** 2 / (x[0] * x[1] ** 2)
 
     def eq_func(self, x):
         return 4 * np.pi * ELECTRIC_CONSTANT * (PLANCK_CONSTANT / (2 * np.pi)) ** 2 / (x[0] * x[1] ** 2)
@@ -1193,8 +1274,10 @@ class FeynmanICh39Eq10(KnownEquation):
             ]
         
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 3 / 2 * x[0] * x[1]
+        return 3 / 2 * x[0] * x[1]
 
     def eq_func(self, x):
         return 3 / 2 * x[0] * x[1]
@@ -1223,8 +1306,10 @@ class FeynmanICh39Eq11(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / (x[0] - 1) * x[1] * x[2]
+        return 1 / (x[0] - 1) * x[1] * x[2]
 
     def eq_func(self, x):
         return 1 / (x[0] - 1) * x[1] * x[2]
@@ -1253,8 +1338,10 @@ class FeynmanICh39Eq22(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * BOLTZMANN_CONSTANT * x[1] / x[2]
+        return x[0] * BOLTZMANN_CONSTANT * x[1] / x[2]
 
     def eq_func(self, x):
         return x[0] * BOLTZMANN_CONSTANT * x[1] / x[2]
@@ -1285,8 +1372,10 @@ class FeynmanICh40Eq1(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * sympy.exp(-x[1] * GRAVITATIONAL_ACCELERATION * x[2] / (BOLTZMANN_CONSTANT * x[3]))
+        return x[0] * sympy.exp(-x[1] * GRAVITATIONAL_ACCELERATION * x[2] / (BOLTZMANN_CONSTANT * x[3]))
 
     def eq_func(self, x):
         return x[0] * np.exp(-x[1] * GRAVITATIONAL_ACCELERATION * x[2] / (BOLTZMANN_CONSTANT * x[3]))
@@ -1313,8 +1402,10 @@ class FeynmanICh41Eq16(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = PLANCK_CONSTANT / (2 * sympy.pi) * x[0] ** 3 / (sympy.pi ** 2 * SPEED_OF_LIGHT ** 2 * (sympy.exp((PLANCK_CONSTANT / (2 * sympy.pi)) * x[0] / (BOLTZMANN_CONSTANT * x[1])) - 1))
+        return PLANCK_CONSTANT / (2 * sympy.pi) * x[0] ** 3 / (sympy.pi ** 2 * SPEED_OF_LIGHT ** 2 * (sympy.exp((PLANCK_CONSTANT / (2 * sympy.pi)) * x[0] / (BOLTZMANN_CONSTANT * x[1])) - 1))
 
     def eq_func(self, x):
         return PLANCK_CONSTANT / (2 * np.pi) * x[0] ** 3 / (np.pi ** 2 * SPEED_OF_LIGHT ** 2 * (np.exp((PLANCK_CONSTANT / (2 * np.pi)) * x[0] / (BOLTZMANN_CONSTANT * x[1])) - 1))
@@ -1344,8 +1435,10 @@ class FeynmanICh43Eq16(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] * x[2] / x[3]
+        return x[0] * x[1] * x[2] / x[3]
 
     def eq_func(self, x):
         return x[0] * x[1] * x[2] / x[3]
@@ -1371,8 +1464,10 @@ class FeynmanICh43Eq31(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * BOLTZMANN_CONSTANT * x[1]
+        return x[0] * BOLTZMANN_CONSTANT * x[1]
 
     def eq_func(self, x):
         return x[0] * BOLTZMANN_CONSTANT * x[1]
@@ -1403,8 +1498,10 @@ class FeynmanICh43Eq43(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / (x[0] - 1) * BOLTZMANN_CONSTANT * x[1] / x[2]
+        return 1 / (x[0] - 1) * BOLTZMANN_CONSTANT * x[1] / x[2]
 
     def eq_func(self, x):
         return 1 / (x[0] - 1) * BOLTZMANN_CONSTANT * x[1] / x[2]
@@ -1436,8 +1533,10 @@ class FeynmanICh44Eq4(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * BOLTZMANN_CONSTANT * x[1] * sympy.log(x[2] / x[3])
+        return x[0] * BOLTZMANN_CONSTANT * x[1] * sympy.log(x[2] / x[3])
 
     def eq_func(self, x):
         return x[0] * BOLTZMANN_CONSTANT * x[1] * np.log(x[2] / x[3])
@@ -1467,8 +1566,10 @@ class FeynmanICh47Eq23(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.sqrt(x[0] * x[1] / x[2])
+        return sympy.sqrt(x[0] * x[1] / x[2])
 
     def eq_func(self, x):
         return np.sqrt(x[0] * x[1] / x[2])
@@ -1496,8 +1597,10 @@ class FeynmanICh48Eq2(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * SPEED_OF_LIGHT ** 2 / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
+        return x[0] * SPEED_OF_LIGHT ** 2 / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
 
     def eq_func(self, x):
         return x[0] * SPEED_OF_LIGHT ** 2 / np.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
@@ -1526,8 +1629,10 @@ class FeynmanICh50Eq26(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * (sympy.cos(x[1] * x[2]) + x[3] * sympy.cos(x[1] * x[2]) ** 2)
+        return x[0] * (sympy.cos(x[1] * x[2]) + x[3] * sympy.cos(x[1] * x[2]) ** 2)
 
     def eq_func(self, x):
         return x[0] * (np.cos(x[1] * x[2]) + x[3] * np.cos(x[1] * x[2]) ** 2)
@@ -1559,8 +1664,10 @@ class FeynmanIICh2Eq42(KnownEquation):
             ]
 
         super().__init__(num_vars=5, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * (x[1] - x[2]) * x[3] / x[4]
+        return x[0] * (x[1] - x[2]) * x[3] / x[4]
 
     def eq_func(self, x):
         return x[0] * (x[1] - x[2]) * x[3] / x[4]
@@ -1585,8 +1692,10 @@ class FeynmanIICh3Eq24(KnownEquation):
             sampling_objs = [DefaultSampling(1.0, 1.0e2), DefaultSampling(1.0e-2, 1.0, uses_negative=False)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / (4 * sympy.pi * x[1] ** 2)
+        return x[0] / (4 * sympy.pi * x[1] ** 2)
 
     def eq_func(self, x):
         return x[0] / (4 * np.pi * x[1] ** 2)
@@ -1611,8 +1720,10 @@ class FeynmanIICh4Eq23(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-3, 1.0e-1), DefaultSampling(1.0e-2, 1.0, uses_negative=False)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / (4 * sympy.pi * ELECTRIC_CONSTANT * x[1])
+        return x[0] / (4 * sympy.pi * ELECTRIC_CONSTANT * x[1])
 
     def eq_func(self, x):
         return x[0] / (4 * np.pi * ELECTRIC_CONSTANT * x[1])
@@ -1641,8 +1752,10 @@ class FeynmanIICh6Eq11(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / (4 * sympy.pi * ELECTRIC_CONSTANT) * x[0] * sympy.cos(x[1]) / x[2] ** 2
+        return 1 / (4 * sympy.pi * ELECTRIC_CONSTANT) * x[0] * sympy.cos(x[1]) / x[2] ** 2
 
     def eq_func(self, x):
         return 1 / (4 * np.pi * ELECTRIC_CONSTANT) * x[0] * np.cos(x[1]) / x[2] ** 2
@@ -1674,8 +1787,10 @@ class FeynmanIICh6Eq15a(KnownEquation):
             ]
 
         super().__init__(num_vars=5, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / (4 * sympy.pi * ELECTRIC_CONSTANT) \
+        return x[0] / (4 * sympy.pi * ELECTRIC_CONSTANT) \
                         * 3 * x[1] / x[2] ** 5 * sympy.sqrt(x[3] ** 2 + x[4] ** 2)
 
     def eq_func(self, x):
@@ -1705,8 +1820,10 @@ class FeynmanIICh6Eq15b(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / (4 * sympy.pi * ELECTRIC_CONSTANT) * 3 * sympy.cos(x[1]) * sympy.sin(x[1]) / x[2] ** 3
+        return x[0] / (4 * sympy.pi * ELECTRIC_CONSTANT) * 3 * sympy.cos(x[1]) * sympy.sin(x[1]) / x[2] ** 3
 
     def eq_func(self, x):
         return x[0] / (4 * np.pi * ELECTRIC_CONSTANT) * 3 * np.cos(x[1]) * np.sin(x[1]) / x[2] ** 3
@@ -1731,8 +1848,10 @@ class FeynmanIICh8Eq7(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-11, 1.0e-9), DefaultSampling(1.0e-12, 1.0e-10, uses_negative=False)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 3 / 5 * x[0] ** 2 / (4 * sympy.pi * ELECTRIC_CONSTANT * x[1])
+        return 3 / 5 * x[0] ** 2 / (4 * sympy.pi * ELECTRIC_CONSTANT * x[1])
 
     def eq_func(self, x):
         return 3 / 5 * x[0] ** 2 / (4 * np.pi * ELECTRIC_CONSTANT * x[1])
@@ -1755,8 +1874,10 @@ class FeynmanIICh8Eq31(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e1, 1.0e3, uses_negative=False)]
 
         super().__init__(num_vars=1, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = ELECTRIC_CONSTANT * x[0] ** 2 / 2
+        return ELECTRIC_CONSTANT * x[0] ** 2 / 2
 
     def eq_func(self, x):
         return ELECTRIC_CONSTANT * x[0] ** 2 / 2
@@ -1781,8 +1902,10 @@ class FeynmanIICh10Eq9(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-3, 1.0e-1), DefaultSampling(1.0, 1.0e2, uses_negative=False)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / ELECTRIC_CONSTANT * 1 / (1 + x[1])
+        return x[0] / ELECTRIC_CONSTANT * 1 / (1 + x[1])
 
     def eq_func(self, x):
         return x[0] / ELECTRIC_CONSTANT * 1 / (1 + x[1])
@@ -1815,8 +1938,10 @@ class FeynmanIICh11Eq3(KnownEquation):
             ]
 
         super().__init__(num_vars=5, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] / (x[2] * (x[3] ** 2 - x[4] ** 2))
+        return x[0] * x[1] / (x[2] * (x[3] ** 2 - x[4] ** 2))
 
     def eq_func(self, x):
         return x[0] * x[1] / (x[2] * (x[3] ** 2 - x[4] ** 2))
@@ -1848,8 +1973,10 @@ class FeynmanIICh11Eq17(KnownEquation):
             ]
 
         super().__init__(num_vars=5, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * (1 + x[1] * x[2] * sympy.cos(x[3]) / (BOLTZMANN_CONSTANT * x[4]))
+        return x[0] * (1 + x[1] * x[2] * sympy.cos(x[3]) / (BOLTZMANN_CONSTANT * x[4]))
 
     def eq_func(self, x):
         return x[0] * (1 + x[1] * x[2] * np.cos(x[3]) / (BOLTZMANN_CONSTANT * x[4]))
@@ -1879,8 +2006,10 @@ class FeynmanIICh11Eq20(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] ** 2 * x[2] / (3 * BOLTZMANN_CONSTANT * x[3])
+        return x[0] * x[1] ** 2 * x[2] / (3 * BOLTZMANN_CONSTANT * x[3])
 
     def eq_func(self, x):
         return x[0] * x[1] ** 2 * x[2] / (3 * BOLTZMANN_CONSTANT * x[3])
@@ -1910,8 +2039,10 @@ class FeynmanIICh11Eq27(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] / (1 - (x[0] * x[1] / 3)) * ELECTRIC_CONSTANT * x[2]
+        return x[0] * x[1] / (1 - (x[0] * x[1] / 3)) * ELECTRIC_CONSTANT * x[2]
 
     def eq_func(self, x):
         return x[0] * x[1] / (1 - (x[0] * x[1] / 3)) * ELECTRIC_CONSTANT * x[2]
@@ -1939,8 +2070,10 @@ class FeynmanIICh11Eq28(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 + x[0] * x[1] / (1 - (x[0] * x[1] / 3))
+        return 1 + x[0] * x[1] / (1 - (x[0] * x[1] / 3))
 
     def eq_func(self, x):
         return 1 + x[0] * x[1] / (1 - (x[0] * x[1] / 3))
@@ -1965,8 +2098,10 @@ class FeynmanIICh13Eq17(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-3, 1.0e-1), DefaultSampling(1.0e-3, 1.0e-1, uses_negative=False)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / (4 * sympy.pi * ELECTRIC_CONSTANT * SPEED_OF_LIGHT ** 2) * 2 * x[0] / x[1]
+        return 1 / (4 * sympy.pi * ELECTRIC_CONSTANT * SPEED_OF_LIGHT ** 2) * 2 * x[0] / x[1]
 
     def eq_func(self, x):
         return 1 / (4 * np.pi * ELECTRIC_CONSTANT * SPEED_OF_LIGHT ** 2) * 2 * x[0] / x[1]
@@ -1994,8 +2129,10 @@ class FeynmanIICh13Eq23(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
+        return x[0] / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
 
     def eq_func(self, x):
         return x[0] / np.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
@@ -2023,8 +2160,10 @@ class FeynmanIICh13Eq34(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
+        return x[0] * x[1] / sympy.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
 
     def eq_func(self, x):
         return x[0] * x[1] / np.sqrt(1 - x[1] ** 2 / SPEED_OF_LIGHT ** 2)
@@ -2052,8 +2191,10 @@ class FeynmanIICh15Eq4(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = -x[0] * x[1] * sympy.cos(x[2])
+        return -x[0] * x[1] * sympy.cos(x[2])
 
     def eq_func(self, x):
         return -x[0] * x[1] * np.cos(x[2])
@@ -2081,8 +2222,10 @@ class FeynmanIICh15Eq5(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = -x[0] * x[1] * sympy.cos(x[2])
+        return -x[0] * x[1] * sympy.cos(x[2])
 
     def eq_func(self, x):
         return -x[0] * x[1] * np.cos(x[2])
@@ -2112,8 +2255,10 @@ class FeynmanIICh21Eq32(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / (4 * sympy.pi * ELECTRIC_CONSTANT * x[1] * (1 - x[2] / SPEED_OF_LIGHT))
+        return x[0] / (4 * sympy.pi * ELECTRIC_CONSTANT * x[1] * (1 - x[2] / SPEED_OF_LIGHT))
 
     def eq_func(self, x):
         return x[0] / (4 * np.pi * ELECTRIC_CONSTANT * x[1] * (1 - x[2] / SPEED_OF_LIGHT))
@@ -2133,14 +2278,17 @@ class FeynmanIICh24Eq17(KnownEquation):
         - x[1] != 0
     """
     _eq_name = 'feynman-ii.24.17'
+    validity_domain = [ValidityBound(0, lower=lambda x: np.pi * SPEED_OF_LIGHT / x[1], magnitude=True)]
 
     def __init__(self, sampling_objs=None):
         if sampling_objs is None:
             sampling_objs = [DefaultSampling(1.0e9, 1.0e11), DefaultSampling(1.0e-3, 1.0e-1, uses_negative=False)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.sqrt(x[0] ** 2 / SPEED_OF_LIGHT ** 2 - sympy.pi ** 2 / x[1] ** 2)
+        return sympy.sqrt(x[0] ** 2 / SPEED_OF_LIGHT ** 2 - sympy.pi ** 2 / x[1] ** 2)
 
     def eq_func(self, x):
         return np.sqrt(x[0] ** 2 / SPEED_OF_LIGHT ** 2 - np.pi ** 2 / x[1] ** 2)
@@ -2163,8 +2311,10 @@ class FeynmanIICh27Eq16(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-1, 1.0e1, uses_negative=False)]
 
         super().__init__(num_vars=1, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = ELECTRIC_CONSTANT * SPEED_OF_LIGHT * x[0] ** 2
+        return ELECTRIC_CONSTANT * SPEED_OF_LIGHT * x[0] ** 2
 
     def eq_func(self, x):
         return ELECTRIC_CONSTANT * SPEED_OF_LIGHT * x[0] ** 2
@@ -2187,8 +2337,10 @@ class FeynmanIICh27Eq18(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-1, 1.0e1, uses_negative=False)]
 
         super().__init__(num_vars=1, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = ELECTRIC_CONSTANT * x[0] ** 2
+        return ELECTRIC_CONSTANT * x[0] ** 2
 
     def eq_func(self, x):
         return ELECTRIC_CONSTANT * x[0] ** 2
@@ -2217,8 +2369,10 @@ class FeynmanIICh34Eq2a(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] / (2 * sympy.pi * x[2])
+        return x[0] * x[1] / (2 * sympy.pi * x[2])
 
     def eq_func(self, x):
         return x[0] * x[1] / (2 * np.pi * x[2])
@@ -2246,8 +2400,10 @@ class FeynmanIICh34Eq2(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] * x[2] / 2
+        return x[0] * x[1] * x[2] / 2
 
     def eq_func(self, x):
         return x[0] * x[1] * x[2] / 2
@@ -2278,8 +2434,10 @@ class FeynmanIICh34Eq11(KnownEquation):
             ]
             
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] * x[2] / (2 * x[3])
+        return x[0] * x[1] * x[2] / (2 * x[3])
 
     def eq_func(self, x):
         return x[0] * x[1] * x[2] / (2 * x[3])
@@ -2304,8 +2462,10 @@ class FeynmanIICh34Eq29a(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-11, 1.0e-9), DefaultSampling(1.0e-30, 1.0e-28, uses_negative=False)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * PLANCK_CONSTANT / (4 * sympy.pi * x[1])
+        return x[0] * PLANCK_CONSTANT / (4 * sympy.pi * x[1])
 
     def eq_func(self, x):
         return x[0] * PLANCK_CONSTANT / (4 * np.pi * x[1])
@@ -2333,8 +2493,10 @@ class FeynmanIICh34Eq29b(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * BOHR_MAGNETON * x[1] * x[2] / (PLANCK_CONSTANT / (2 * sympy.pi))
+        return x[0] * BOHR_MAGNETON * x[1] * x[2] / (PLANCK_CONSTANT / (2 * sympy.pi))
 
     def eq_func(self, x):
         return x[0] * BOHR_MAGNETON * x[1] * x[2] / (PLANCK_CONSTANT / (2 * np.pi))
@@ -2365,8 +2527,10 @@ class FeynmanIICh35Eq18(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / (sympy.exp(x[1] * x[2] / (BOLTZMANN_CONSTANT * x[3]))
+        return x[0] / (sympy.exp(x[1] * x[2] / (BOLTZMANN_CONSTANT * x[3]))
                                 + sympy.exp(-x[1] * x[2] / (BOLTZMANN_CONSTANT * x[3])))
 
     def eq_func(self, x):
@@ -2399,8 +2563,10 @@ class FeynmanIICh35Eq21(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] * sympy.tanh(x[1] * x[2] / (BOLTZMANN_CONSTANT * x[3]))
+        return x[0] * x[1] * sympy.tanh(x[1] * x[2] / (BOLTZMANN_CONSTANT * x[3]))
 
     def eq_func(self, x):
         return x[0] * x[1] * np.tanh(x[1] * x[2] / (BOLTZMANN_CONSTANT * x[3]))
@@ -2432,8 +2598,10 @@ class FeynmanIICh36Eq38(KnownEquation):
             ]
 
         super().__init__(num_vars=5, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] / (BOLTZMANN_CONSTANT * x[2]) + (x[0] * x[3]) / (ELECTRIC_CONSTANT * SPEED_OF_LIGHT ** 2 * BOLTZMANN_CONSTANT * x[2]) * x[4]
+        return x[0] * x[1] / (BOLTZMANN_CONSTANT * x[2]) + (x[0] * x[3]) / (ELECTRIC_CONSTANT * SPEED_OF_LIGHT ** 2 * BOLTZMANN_CONSTANT * x[2]) * x[4]
 
     def eq_func(self, x):
         return x[0] * x[1] / (BOLTZMANN_CONSTANT * x[2]) + (x[0] * x[3]) / (ELECTRIC_CONSTANT * SPEED_OF_LIGHT ** 2 * BOLTZMANN_CONSTANT * x[2]) * x[4]
@@ -2461,8 +2629,10 @@ class FeynmanIICh37Eq1(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * (1 + x[1]) * x[2]
+        return x[0] * (1 + x[1]) * x[2]
 
     def eq_func(self, x):
         return x[0] * (1 + x[1]) * x[2]
@@ -2493,8 +2663,10 @@ class FeynmanIICh38Eq3(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] * x[2] / x[3]
+        return x[0] * x[1] * x[2] / x[3]
 
     def eq_func(self, x):
         return x[0] * x[1] * x[2] / x[3]
@@ -2522,8 +2694,10 @@ class FeynmanIICh38Eq14(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / (2 * (1 + x[1]))
+        return x[0] / (2 * (1 + x[1]))
 
     def eq_func(self, x):
         return x[0] / (2 * (1 + x[1]))
@@ -2552,8 +2726,10 @@ class FeynmanIIICh4Eq32(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / (sympy.exp((PLANCK_CONSTANT / (2 * sympy.pi)) * x[0] / (BOLTZMANN_CONSTANT * x[1])) - 1)
+        return 1 / (sympy.exp((PLANCK_CONSTANT / (2 * sympy.pi)) * x[0] / (BOLTZMANN_CONSTANT * x[1])) - 1)
 
     def eq_func(self, x):
         return 1 / (np.exp((PLANCK_CONSTANT / (2 * np.pi)) * x[0] / (BOLTZMANN_CONSTANT * x[1])) - 1)
@@ -2582,8 +2758,10 @@ class FeynmanIIICh4Eq33(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (PLANCK_CONSTANT / (2 * sympy.pi)) * x[0] / (sympy.exp((PLANCK_CONSTANT / (2 * sympy.pi)) * x[0] / (BOLTZMANN_CONSTANT * x[1])) - 1)
+        return (PLANCK_CONSTANT / (2 * sympy.pi)) * x[0] / (sympy.exp((PLANCK_CONSTANT / (2 * sympy.pi)) * x[0] / (BOLTZMANN_CONSTANT * x[1])) - 1)
 
     def eq_func(self, x):
         return (PLANCK_CONSTANT / (2 * np.pi)) * x[0] / (np.exp((PLANCK_CONSTANT / (2 * np.pi)) * x[0] / (BOLTZMANN_CONSTANT * x[1])) - 1)
@@ -2607,8 +2785,10 @@ class FeynmanIIICh7Eq38(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-11, 1.0e-9), DefaultSampling(1.0e-3, 1.0e-1)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 2 * x[0] * x[1] / (PLANCK_CONSTANT / (2 * sympy.pi))
+        return 2 * x[0] * x[1] / (PLANCK_CONSTANT / (2 * sympy.pi))
 
     def eq_func(self, x):
         return 2 * x[0] * x[1] / (PLANCK_CONSTANT / (2 * np.pi))
@@ -2632,8 +2812,10 @@ class FeynmanIIICh8Eq54(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-18, 1.0e-16), DefaultSampling(1.0e-18, 1.0e-16, uses_negative=False)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.sin(x[0] * x[1] / (PLANCK_CONSTANT / (2 * sympy.pi))) ** 2
+        return sympy.sin(x[0] * x[1] / (PLANCK_CONSTANT / (2 * sympy.pi))) ** 2
 
     def eq_func(self, x):
         return np.sin(x[0] * x[1] / (PLANCK_CONSTANT / (2 * np.pi))) ** 2
@@ -2666,8 +2848,10 @@ class FeynmanIIICh9Eq52(KnownEquation):
             ]
 
         super().__init__(num_vars=5, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (x[0] * x[1] * x[2] / (PLANCK_CONSTANT / (2 * sympy.pi))) * sympy.sin((x[3] - x[4]) * x[2] / 2) ** 2 / ((x[3] - x[4]) * x[2] / 2) ** 2
+        return (x[0] * x[1] * x[2] / (PLANCK_CONSTANT / (2 * sympy.pi))) * sympy.sin((x[3] - x[4]) * x[2] / 2) ** 2 / ((x[3] - x[4]) * x[2] / 2) ** 2
 
     def eq_func(self, x):
         return (x[0] * x[1] * x[2] / (PLANCK_CONSTANT / (2 * np.pi))) ** 2 * np.sin((x[3] - x[4]) * x[2] / 2) ** 2 / ((x[3] - x[4]) * x[2] / 2) ** 2
@@ -2696,8 +2880,10 @@ class FeynmanIIICh10Eq19(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * sympy.sqrt(x[1] ** 2 + x[2] ** 2 + x[3] ** 2)
+        return x[0] * sympy.sqrt(x[1] ** 2 + x[2] ** 2 + x[3] ** 2)
 
     def eq_func(self, x):
         return x[0] * np.sqrt(x[1] ** 2 + x[2] ** 2 + x[3] ** 2)
@@ -2720,8 +2906,10 @@ class FeynmanIIICh12Eq43(KnownEquation):
             sampling_objs = [IntegerSampling(1, 1.0e2, uses_negative=False)]
 
         super().__init__(num_vars=1, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * (PLANCK_CONSTANT / (2 * sympy.pi))
+        return x[0] * (PLANCK_CONSTANT / (2 * sympy.pi))
 
     def eq_func(self, x):
         return x[0] * (PLANCK_CONSTANT / (2 * np.pi))
@@ -2749,8 +2937,10 @@ class FeynmanIIICh13Eq18(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 2 * x[0] * x[1] ** 2 * x[2] / (PLANCK_CONSTANT / (2 * sympy.pi))
+        return 2 * x[0] * x[1] ** 2 * x[2] / (PLANCK_CONSTANT / (2 * sympy.pi))
 
     def eq_func(self, x):
         return 2 * x[0] * x[1] ** 2 * x[2] / (PLANCK_CONSTANT / (2 * np.pi))
@@ -2780,8 +2970,10 @@ class FeynmanIIICh14Eq14(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * (sympy.exp(x[1] * x[2] / (BOLTZMANN_CONSTANT * x[3])) - 1)
+        return x[0] * (sympy.exp(x[1] * x[2] / (BOLTZMANN_CONSTANT * x[3])) - 1)
 
     def eq_func(self, x):
         return x[0] * (np.exp(x[1] * x[2] / (BOLTZMANN_CONSTANT * x[3])) - 1)
@@ -2810,8 +3002,10 @@ class FeynmanIIICh15Eq12(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 2 * x[0] * (1 - sympy.cos(x[1] * x[2]))
+        return 2 * x[0] * (1 - sympy.cos(x[1] * x[2]))
 
     def eq_func(self, x):
         return 2 * x[0] * (1 - np.cos(x[1] * x[2]))
@@ -2840,8 +3034,10 @@ class FeynmanIIICh15Eq14(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (PLANCK_CONSTANT / (2 * sympy.pi)) ** 2 / (2 * x[0] * x[1] ** 2)
+        return (PLANCK_CONSTANT / (2 * sympy.pi)) ** 2 / (2 * x[0] * x[1] ** 2)
 
     def eq_func(self, x):
         return (PLANCK_CONSTANT / (2 * np.pi)) ** 2 / (2 * x[0] * x[1] ** 2)
@@ -2871,8 +3067,10 @@ class FeynmanIIICh15Eq27(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 2 * sympy.pi * x[0] / (x[1] * x[2])
+        return 2 * sympy.pi * x[0] / (x[1] * x[2])
 
     def eq_func(self, x):
         return 2 * np.pi * x[0] / (x[1] * x[2])
@@ -2900,8 +3098,10 @@ class FeynmanIIICh17Eq37(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * (1 + x[1] * sympy.cos(x[2]))
+        return x[0] * (1 + x[1] * sympy.cos(x[2]))
 
     def eq_func(self, x):
         return x[0] * (1 + x[1] * np.cos(x[2]))
@@ -2930,8 +3130,10 @@ class FeynmanIIICh19Eq51(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = -x[0] * x[1] ** 4 / (2 * (4 * sympy.pi * ELECTRIC_CONSTANT) ** 2 * (PLANCK_CONSTANT / (2 * sympy.pi)) ** 2) * (1 / x[2] ** 2)
+        return -x[0] * x[1] ** 4 / (2 * (4 * sympy.pi * ELECTRIC_CONSTANT) ** 2 * (PLANCK_CONSTANT / (2 * sympy.pi)) ** 2) * (1 / x[2] ** 2)
 
     def eq_func(self, x):
         return -x[0] * x[1] ** 4 / (2 * (4 * np.pi * ELECTRIC_CONSTANT) ** 2 * (PLANCK_CONSTANT / (2 * np.pi)) ** 2) * (1 / x[2] ** 2)
@@ -2962,8 +3164,10 @@ class FeynmanIIICh21Eq20(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = -x[0] * x[1] * x[2] / x[3]
+        return -x[0] * x[1] * x[2] / x[3]
 
     def eq_func(self, x):
         return -x[0] * x[1] * x[2] / x[3]
@@ -2995,8 +3199,10 @@ class FeynmanBonus1(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (x[0] * x[1] * FINE_STRUCTURE_CONSTANT * DIRAC_CONSTANT * SPEED_OF_LIGHT
+        return (x[0] * x[1] * FINE_STRUCTURE_CONSTANT * DIRAC_CONSTANT * SPEED_OF_LIGHT
                          / (4 * x[2] * sympy.sin(x[3] / 2) ** 2)) ** 2
 
     def eq_func(self, x):
@@ -3035,8 +3241,10 @@ class FeynmanBonus2(KnownEquation):
             ]
 
         super().__init__(num_vars=6, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * x[1] / x[2] ** 2 * (1 + sympy.sqrt(1 + 2 * x[3] * x[2] ** 2 / (x[0] * x[1] ** 2)) * sympy.cos(x[4] - x[5]))
+        return x[0] * x[1] / x[2] ** 2 * (1 + sympy.sqrt(1 + 2 * x[3] * x[2] ** 2 / (x[0] * x[1] ** 2)) * sympy.cos(x[4] - x[5]))
 
     def eq_func(self, x):
         return x[0] * x[1] / x[2] ** 2 * (1 + np.sqrt(1 + 2 * x[3] * x[2] ** 2 / (x[0] * x[1] ** 2)) * np.cos(x[4] - x[5]))
@@ -3066,8 +3274,10 @@ class FeynmanBonus3(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * (1 - x[1] ** 2) / (1 + x[1] * sympy.cos(x[2] - x[3]))
+        return x[0] * (1 - x[1] ** 2) / (1 + x[1] * sympy.cos(x[2] - x[3]))
 
     def eq_func(self, x):
         return x[0] * (1 - x[1] ** 2) / (1 + x[1] * np.cos(x[2] - x[3]))
@@ -3102,8 +3312,10 @@ class FeynmanBonus4(KnownEquation):
             ]
 
         super().__init__(num_vars=5, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.sqrt(2 / x[0] * (x[1] - x[2] - x[3] ** 2 / (2 * x[0] * x[4] ** 2)))
+        return sympy.sqrt(2 / x[0] * (x[1] - x[2] - x[3] ** 2 / (2 * x[0] * x[4] ** 2)))
 
     def eq_func(self, x):
         return np.sqrt(2 / x[0] * (x[1] - x[2] - x[3] ** 2 / (2 * x[0] * x[4] ** 2)))
@@ -3135,8 +3347,10 @@ class FeynmanBonus5(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 2 * sympy.pi * x[0] ** (3 / 2) / sympy.sqrt(GRAVITATIONAL_CONSTANT * (x[1] + x[2]))
+        return 2 * sympy.pi * x[0] ** (3 / 2) / sympy.sqrt(GRAVITATIONAL_CONSTANT * (x[1] + x[2]))
 
     def eq_func(self, x):
         return 2 * np.pi * x[0] ** (3 / 2) / np.sqrt(GRAVITATIONAL_CONSTANT * (x[1] + x[2]))
@@ -3178,8 +3392,10 @@ class FeynmanBonus6(KnownEquation):
             ]
 
         super().__init__(num_vars=7, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.sqrt(1+2*x[0]**2*x[1]*x[2]**2/(x[3]*(x[4]*x[5]*x[6]**2)**2))
+        return sympy.sqrt(1+2*x[0]**2*x[1]*x[2]**2/(x[3]*(x[4]*x[5]*x[6]**2)**2))
 
     def eq_func(self, x):
         return np.sqrt(1+2*x[0]**2*x[1]*x[2]**2/(x[3]*(x[4]*x[5]*x[6]**2)**2))
@@ -3200,6 +3416,7 @@ class FeynmanBonus7(KnownEquation):
         - 6.67430e-11 * x[0] * x[2] ** 2 / 3 >= x[1] * 2.99792458e8 ** 2
     """
     _eq_name = 'feynman-bonus.7'
+    validity_domain = [ValidityBound(1, upper=lambda x: 8 * np.pi * GRAVITATIONAL_CONSTANT * x[0] * x[2] ** 2 / (3 * SPEED_OF_LIGHT ** 2))]
 
     def __init__(self, sampling_objs=None):
         if sampling_objs is None:
@@ -3209,8 +3426,10 @@ class FeynmanBonus7(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.sqrt(8 * sympy.pi * GRAVITATIONAL_CONSTANT * x[0] / 3 - x[1] * SPEED_OF_LIGHT ** 2 / x[2] ** 2)
+        return sympy.sqrt(8 * sympy.pi * GRAVITATIONAL_CONSTANT * x[0] / 3 - x[1] * SPEED_OF_LIGHT ** 2 / x[2] ** 2)
 
     def eq_func(self, x):
         return np.sqrt(8 * np.pi * GRAVITATIONAL_CONSTANT * x[0] / 3 - x[1] * SPEED_OF_LIGHT ** 2 / x[2] ** 2)
@@ -3235,8 +3454,10 @@ class FeynmanBonus8(KnownEquation):
             sampling_objs = [DefaultSampling(1.0e-24, 1.0e-22, uses_negative=False), SimpleSampling(-np.pi, np.pi)]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / (1 + x[0] / (ELECTRON_MASS * SPEED_OF_LIGHT ** 2) * (1 - sympy.cos(x[1])))
+        return x[0] / (1 + x[0] / (ELECTRON_MASS * SPEED_OF_LIGHT ** 2) * (1 - sympy.cos(x[1])))
 
     def eq_func(self, x):
         return x[0] / (1 + x[0] / (ELECTRON_MASS * SPEED_OF_LIGHT ** 2) * (1 - np.cos(x[1])))
@@ -3266,8 +3487,10 @@ class FeynmanBonus9(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = -32 / 5 * GRAVITATIONAL_CONSTANT ** 4 / SPEED_OF_LIGHT ** 5 * (x[0] * x[1]) ** 2 * (x[0] + x[1]) / x[2] ** 5
+        return -32 / 5 * GRAVITATIONAL_CONSTANT ** 4 / SPEED_OF_LIGHT ** 5 * (x[0] * x[1]) ** 2 * (x[0] + x[1]) / x[2] ** 5
 
     def eq_func(self, x):
         return -32 / 5 * GRAVITATIONAL_CONSTANT ** 4 / SPEED_OF_LIGHT ** 5 * (x[0] * x[1]) ** 2 * (x[0] + x[1]) / x[2] ** 5
@@ -3297,8 +3520,10 @@ class FeynmanBonus10(KnownEquation):
             ]
 
         super().__init__(num_vars=2, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = (sympy.cos(x[0]) - x[1] / SPEED_OF_LIGHT) / (1 - x[1] / SPEED_OF_LIGHT * sympy.cos(x[0]))
+        return (sympy.cos(x[0]) - x[1] / SPEED_OF_LIGHT) / (1 - x[1] / SPEED_OF_LIGHT * sympy.cos(x[0]))
 
     def eq_func(self, x):
         return (np.cos(x[0]) - x[1] / SPEED_OF_LIGHT) / (1 - x[1] / SPEED_OF_LIGHT * np.cos(x[0]))
@@ -3328,8 +3553,10 @@ class FeynmanBonus11(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * (sympy.sin(x[1] / 2) * sympy.sin(x[2] * x[3] / 2) / (x[1] / 2 * sympy.sin(x[3] / 2))) ** 2
+        return x[0] * (sympy.sin(x[1] / 2) * sympy.sin(x[2] * x[3] / 2) / (x[1] / 2 * sympy.sin(x[3] / 2))) ** 2
 
     def eq_func(self, x):
         return x[0] * (np.sin(x[1] / 2) * np.sin(x[2] * x[3] / 2) / (x[1] / 2 * np.sin(x[3] / 2))) ** 2
@@ -3361,8 +3588,10 @@ class FeynmanBonus12(KnownEquation):
             ]
 
         super().__init__(num_vars=5, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] / (4 * sympy.pi * x[1] * x[2] ** 2) \
+        return x[0] / (4 * sympy.pi * x[1] * x[2] ** 2) \
                         * (4 * sympy.pi * x[1] * x[3] * x[4] - x[0] * x[4] * x[2] ** 3 / (x[2] ** 2 - x[4] ** 2) ** 2)
 
     def eq_func(self, x):
@@ -3394,8 +3623,10 @@ class FeynmanBonus13(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / (4 * sympy.pi * ELECTRIC_CONSTANT) * x[0] \
+        return 1 / (4 * sympy.pi * ELECTRIC_CONSTANT) * x[0] \
                         / sympy.sqrt(x[1] ** 2 + x[2] ** 2 - 2 * x[1] * x[2] * sympy.cos(x[3]))
 
     def eq_func(self, x):
@@ -3430,8 +3661,10 @@ class FeynmanBonus14(KnownEquation):
             ]
 
         super().__init__(num_vars=5, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = x[0] * sympy.cos(x[1]) * (-x[2] + x[3] ** 3 / x[2] ** 2 * (x[4] - 1) / (x[4] + 2))
+        return x[0] * sympy.cos(x[1]) * (-x[2] + x[3] ** 3 / x[2] ** 2 * (x[4] - 1) / (x[4] + 2))
 
     def eq_func(self, x):
         return x[0] * np.cos(x[1]) * (-x[2] + x[3] ** 3 / x[2] ** 2 * (x[4] - 1) / (x[4] + 2))
@@ -3461,8 +3694,10 @@ class FeynmanBonus15(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.sqrt(1 - x[0] ** 2 / SPEED_OF_LIGHT ** 2) * x[1] / (1 + x[0] / SPEED_OF_LIGHT * sympy.cos(x[2]))
+        return sympy.sqrt(1 - x[0] ** 2 / SPEED_OF_LIGHT ** 2) * x[1] / (1 + x[0] / SPEED_OF_LIGHT * sympy.cos(x[2]))
 
     def eq_func(self, x):
         return np.sqrt(1 - x[0] ** 2 / SPEED_OF_LIGHT ** 2) * x[1] / (1 + x[0] / SPEED_OF_LIGHT * np.cos(x[2]))
@@ -3493,8 +3728,10 @@ class FeynmanBonus16(KnownEquation):
             ]
 
         super().__init__(num_vars=5, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = sympy.sqrt((x[0] - x[1] * x[2]) ** 2 * SPEED_OF_LIGHT ** 2 + x[3] ** 2 * SPEED_OF_LIGHT ** 4) \
+        return sympy.sqrt((x[0] - x[1] * x[2]) ** 2 * SPEED_OF_LIGHT ** 2 + x[3] ** 2 * SPEED_OF_LIGHT ** 4) \
                         + x[1] * x[4]
 
     def eq_func(self, x):
@@ -3529,8 +3766,10 @@ class FeynmanBonus17(KnownEquation):
             ]
 
         super().__init__(num_vars=6, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / (2 * x[0]) * (x[1] ** 2 + x[0] ** 2 * x[2] ** 2 * x[3] ** 2 * (1 + x[4] * x[3] / x[5]))
+        return 1 / (2 * x[0]) * (x[1] ** 2 + x[0] ** 2 * x[2] ** 2 * x[3] ** 2 * (1 + x[4] * x[3] / x[5]))
 
     def eq_func(self, x):
         return 1 / (2 * x[0]) * (x[1] ** 2 + x[0] ** 2 * x[2] ** 2 * x[3] ** 2 * (1 + x[4] * x[3] / x[5]))
@@ -3559,8 +3798,10 @@ class FeynmanBonus18(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 3 / (8 * sympy.pi * GRAVITATIONAL_CONSTANT) * (SPEED_OF_LIGHT ** 2 * x[0] / x[1] ** 2 + x[2] ** 2)
+        return 3 / (8 * sympy.pi * GRAVITATIONAL_CONSTANT) * (SPEED_OF_LIGHT ** 2 * x[0] / x[1] ** 2 + x[2] ** 2)
 
     def eq_func(self, x):
         return 3 / (8 * np.pi * GRAVITATIONAL_CONSTANT) * (SPEED_OF_LIGHT ** 2 * x[0] / x[1] ** 2 + x[2] ** 2)
@@ -3590,8 +3831,10 @@ class FeynmanBonus19(KnownEquation):
             ]
 
         super().__init__(num_vars=4, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = -1 / (8 * sympy.pi * GRAVITATIONAL_CONSTANT) * (SPEED_OF_LIGHT ** 4 * x[0] / x[1] ** 2 + x[2] ** 2 * SPEED_OF_LIGHT ** 2 * (1 - 2 * x[3]))
+        return -1 / (8 * sympy.pi * GRAVITATIONAL_CONSTANT) * (SPEED_OF_LIGHT ** 4 * x[0] / x[1] ** 2 + x[2] ** 2 * SPEED_OF_LIGHT ** 2 * (1 - 2 * x[3]))
 
     def eq_func(self, x):
         return -1 / (8 * np.pi * GRAVITATIONAL_CONSTANT) * (SPEED_OF_LIGHT ** 4 * x[0] / x[1] ** 2 + x[2] ** 2 * SPEED_OF_LIGHT ** 2 * (1 - 2 * x[3]))
@@ -3620,8 +3863,10 @@ class FeynmanBonus20(KnownEquation):
             ]
 
         super().__init__(num_vars=3, sampling_objs=sampling_objs)
+
+    def build_sympy_eq(self):
         x = self.x
-        self.sympy_eq = 1 / (4 * sympy.pi) * FINE_STRUCTURE_CONSTANT ** 2 * PLANCK_CONSTANT ** 2 / (ELECTRON_MASS ** 2 * SPEED_OF_LIGHT ** 2) * (x[0] / x[1]) ** 2 * (x[0] / x[1] + x[1] / x[0] - sympy.sin(x[2]) ** 2)
+        return 1 / (4 * sympy.pi) * FINE_STRUCTURE_CONSTANT ** 2 * PLANCK_CONSTANT ** 2 / (ELECTRON_MASS ** 2 * SPEED_OF_LIGHT ** 2) * (x[0] / x[1]) ** 2 * (x[0] / x[1] + x[1] / x[0] - sympy.sin(x[2]) ** 2)
 
     def eq_func(self, x):
         return 1 / (4 * np.pi) * FINE_STRUCTURE_CONSTANT ** 2 * PLANCK_CONSTANT ** 2 / (ELECTRON_MASS ** 2 * SPEED_OF_LIGHT ** 2) * (x[0] / x[1]) ** 2 * (x[0] / x[1] + x[1] / x[0] - np.sin(x[2]) ** 2)
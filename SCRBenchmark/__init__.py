@@ -4,26 +4,50 @@
     SCRBenchmark
 """
 
+import importlib
 
 __version__ = "0.5.0"
 
-# import ApiClient
-from SCRBenchmark import SRSDFeynman
-from SCRBenchmark import Constants
-from SCRBenchmark import Data
-
-from .base import get_constraint_descriptor
-from .base import create_dataset_from_sampling_objectives
-from .base import KnownEquation
-from .benchmark import Benchmark
-from .suite import BenchmarkSuite
-from .seeds import SEEDS
-from .suite import HARD_NOISE_LEVELS, HARD_SAMPLE_SIZES,FEYNMAN_SRSD_HARD
-
-
-
-from SCRBenchmark.Constants import StringKeys
-
-from SCRBenchmark.Data.feynman_srsdf_constraint_info import SRSD_EQUATION_CONSTRAINTS
-from SCRBenchmark.Data.feynman_srsd_info import SRSD_EQUATION_CONFIG_DICT
-
+# the public names are imported on first access through the module level __getattr__ (PEP 562),
+# so `import SCRBenchmark` does not load sympy, pandas, JAX or the equation and constraint definitions;
+# name -> (module, attribute of the module or None for the module itself)
+_LAZY_ATTRIBUTES = {
+    'SRSDFeynman': ('SCRBenchmark.SRSDFeynman', None),
+    'Constants': ('SCRBenchmark.Constants', None),
+    'Data': ('SCRBenchmark.Data', None),
+
+    'get_constraint_descriptor': ('SCRBenchmark.base', 'get_constraint_descriptor'),
+    'ViolationStatistics': ('SCRBenchmark.base', 'ViolationStatistics'),
+    'create_dataset_from_sampling_objectives': ('SCRBenchmark.base', 'create_dataset_from_sampling_objectives'),
+    'SamplingDiagnostics': ('SCRBenchmark.base', 'SamplingDiagnostics'),
+    'KnownEquation': ('SCRBenchmark.base', 'KnownEquation'),
+    'Benchmark': ('SCRBenchmark.benchmark', 'Benchmark'),
+    'get_available_libraries': ('SCRBenchmark.benchmark', 'get_available_libraries'),
+    'BenchmarkSuite': ('SCRBenchmark.suite', 'BenchmarkSuite'),
+    'SEEDS': ('SCRBenchmark.seeds', 'SEEDS'),
+    'HARD_NOISE_LEVELS': ('SCRBenchmark.suite', 'HARD_NOISE_LEVELS'),
+    'HARD_SAMPLE_SIZES': ('SCRBenchmark.suite', 'HARD_SAMPLE_SIZES'),
+    'FEYNMAN_SRSD_HARD': ('SCRBenchmark.suite', 'FEYNMAN_SRSD_HARD'),
+
+    'StringKeys': ('SCRBenchmark.Constants.StringKeys', None),
+
+    'SRSD_EQUATION_CONSTRAINTS': ('SCRBenchmark.Data.feynman_srsdf_constraint_info', 'SRSD_EQUATION_CONSTRAINTS'),
+    'SRSD_EQUATION_CONFIG_DICT': ('SCRBenchmark.Data.feynman_srsd_info', 'SRSD_EQUATION_CONFIG_DICT'),
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    (module_name, attribute) = _LAZY_ATTRIBUTES[name]
+    value = importlib.import_module(module_name)
+    if attribute is not None:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -12,13 +12,16 @@
 import warnings
 
 import numpy as np
-import pandas as pd
-import sympy
-from sympy import Derivative, Matrix, Symbol, simplify, solve, lambdify
 import SCRBenchmark.Constants.StringKeys as sk
+from SCRBenchmark.lazy import lazy_import
+from SCRBenchmark.sampling import get_random_generator, SamplingPlan
 
 from SCRBenchmark.Data.feynman_srsd_info import SRSD_EQUATION_CONFIG_DICT as SRSDConfig
 
+# only needed for the symbolic parts (and dataframes), loaded on first use
+pd = lazy_import('pandas')
+sympy = lazy_import('sympy')
+
 
 FLOAT32_MAX = np.finfo(np.float32).max
 FLOAT32_MIN = np.finfo(np.float32).min
@@ -29,50 +32,272 @@ FLOAT64_MAX = np.finfo(np.float64).max
 FLOAT64_MIN = np.finfo(np.float64).min
 FLOAT64_TINY = np.finfo(np.float64).tiny
 
-
-
-def create_dataset_from_sampling_objectives(sampling_objs, sympy_eq,eq_func,check_if_valid, sample_size, patience=10, ):
+# (min, max, tiny) of the output values accepted by KnownEquation.check_if_valid per dataset dtype
+FLOAT_LIMITS = {
+    np.dtype(np.float32): (FLOAT32_MIN, FLOAT32_MAX, FLOAT32_TINY),
+    np.dtype(np.float64): (FLOAT64_MIN, FLOAT64_MAX, FLOAT64_TINY),
+}
+
+
+def get_float_limits(dtype):
+    dtype = np.dtype(dtype)
+    if dtype not in FLOAT_LIMITS:
+        raise ValueError(f'`{dtype}` is not a supported dtype, use one of {[str(dtype) for dtype in FLOAT_LIMITS]}')
+    return FLOAT_LIMITS[dtype]
+
+
+def get_near_zero_mask(values):
+    # values indistinguishable from zero at the precision of their dtype (relative to the largest finite
+    # magnitude) or not finite; their sign (or validity) may be an artifact of the rounding
+    magnitudes = np.abs(values)
+    finite = np.isfinite(magnitudes)
+    scale = np.max(magnitudes, where=finite, initial=0)
+    return ~finite | (magnitudes <= np.finfo(magnitudes.dtype).eps * scale)
+
+
+
+# number of rows per block of iter_dataset_blocks_from_sampling_objectives
+DEFAULT_DATASET_BLOCK_SIZE = 1_000_000
+
+# number of samples and largest relative error of the single precision check in get_evaluation_dtype
+SINGLE_PRECISION_PROBE_SIZE = 1024
+SINGLE_PRECISION_TOLERANCE = 1e-4
+
+# z-score of the lower confidence bound of the acceptance rate used to size the refill rounds
+ACCEPTANCE_RATE_CONFIDENCE_Z = 3.0
+# a refill round draws at most this many samples per missing sample
+MAX_OVERSAMPLING_FACTOR = 100
+# a refill round draws its samples in chunks of at most this many bytes (but at least the missing samples),
+# so a round after a low acceptance rate does not allocate MAX_OVERSAMPLING_FACTOR times the dataset at once
+MAX_REFILL_CHUNK_BYTES = 64 * 1024 ** 2
+
+class SamplingDiagnostics(object):
+    """
+    Statistics of the rejection sampling in `create_dataset_from_sampling_objectives`:
+    number of sampling rounds, total number of drawn and accepted (valid) samples.
+    """
+
+    def __init__(self, sample_size):
+        self.sample_size = sample_size
+        self.rounds = 0
+        self.total_draws = 0
+        self.accepted = 0
+
+    def add_round(self, draws, accepted):
+        self.rounds += 1
+        self.total_draws += draws
+        self.accepted += accepted
+
+    @property
+    def acceptance_rate(self):
+        if(self.total_draws == 0):
+            return 0.0
+        return self.accepted / self.total_draws
+
+    def get_acceptance_rate_lower_bound(self, z = ACCEPTANCE_RATE_CONFIDENCE_Z):
+        # Wilson score interval, stays informative for acceptance rates close to 0 or 1
+        n = self.total_draws
+        if(n == 0):
+            return 0.0
+        p = self.acceptance_rate
+        center = p + z * z / (2 * n)
+        margin = z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+        return max(0.0, (center - margin) / (1 + z * z / n))
+
+    def get_refill_size(self, missed_sample_size):
+        # enough draws to obtain the missing samples with high confidence given the acceptance observed so far
+        acceptance_rate = max(self.get_acceptance_rate_lower_bound(), 1 / MAX_OVERSAMPLING_FACTOR)
+        return int(np.ceil(missed_sample_size / acceptance_rate))
+
+    def __repr__(self):
+        return (f'SamplingDiagnostics(sample_size={self.sample_size}, rounds={self.rounds}, total_draws={self.total_draws}, '
+                f'accepted={self.accepted}, acceptance_rate={self.acceptance_rate})')
+
+
+def create_dataset_from_sampling_objectives(sampling_objs, sympy_eq,eq_func,check_if_valid, sample_size, patience=10, return_diagnostics=False, order='C', rng=None, dtype=np.float64):
     warnings.filterwarnings('ignore')
-    assert len(sampling_objs) > 0, f'There should be at least one variable provided in `{sympy_eq}`'
-    xs = [sampling_func(sample_size) for sampling_func in sampling_objs]
-    y = eq_func(xs)
-    # Check if y contains NaN, Infinity, etc
-    valid_sample_flags = check_if_valid(y)
-    valid_sample_size = sum(valid_sample_flags)
-    if valid_sample_size == sample_size:
-        return np.array([*xs, y]).T
-
-    valid_xs = [x[valid_sample_flags] for x in xs]
-    valid_y = y[valid_sample_flags]
-    missed_sample_size = sample_size - valid_sample_size
-    for i in range(patience):
-        # print(f'patience {i}/{patience} remaining size {missed_sample_size}')
-        xs = [sampling_func(missed_sample_size * 5) for sampling_func in sampling_objs]
-        y = eq_func(xs)
-        valid_sample_flags = check_if_valid(y)
-        valid_xs = [np.concatenate([xs[i][valid_sample_flags], valid_xs[i]]) for i in range(len(xs))]
-        valid_y = np.concatenate([y[valid_sample_flags], valid_y])
-        valid_sample_size = len(valid_y)
-        if valid_sample_size >= sample_size:
-            xs = [x[:sample_size] for x in valid_xs]
-            y = valid_y[:sample_size]
-            return np.array([*xs, y]).T
-    raise TimeoutError(f'number of valid samples (`{len(valid_y)}`) did not reach to '
-                        f'{sample_size} within {patience} trials')
+    # draws all input columns at once, sampling_objs can also be a prepared SamplingPlan
+    sampling_plan = sampling_objs if isinstance(sampling_objs, SamplingPlan) else SamplingPlan(sampling_objs)
+    num_vars = sampling_plan.num_vars
+    assert num_vars > 0, f'There should be at least one variable provided in `{sympy_eq}`'
+    diagnostics = SamplingDiagnostics(sample_size)
+    # all variables and refill rounds draw from this one generator (see sampling.get_random_generator)
+    rng = get_random_generator(rng)
+    # accepted samples are written in place into the final (sample_size, num_vars + 1) matrix,
+    # order='F' returns it column-major; dtype=np.float32 samples, evaluates and stores single precision values
+    dtype = np.dtype(dtype)
+    get_float_limits(dtype)
+    data = np.empty((sample_size, num_vars + 1), dtype=dtype, order=order)
+    evaluation_dtype = np.dtype(np.float64) if dtype == np.float64 else None
+    valid_sample_size = 0
+    for i in range(patience + 1):
+        if i == 0:
+            draw_sizes = [sample_size]
+        else:
+            # the refill size adapts to the acceptance rate observed so far; large refills are drawn in chunks
+            # of at most MAX_REFILL_CHUNK_BYTES (but at least the missing samples) until the dataset is complete
+            missed_sample_size = sample_size - valid_sample_size
+            refill_size = diagnostics.get_refill_size(missed_sample_size)
+            chunk_size = max(missed_sample_size, MAX_REFILL_CHUNK_BYTES // (dtype.itemsize * (num_vars + 1)))
+            draw_sizes = [min(chunk_size, refill_size - start) for start in range(0, refill_size, chunk_size)]
+        # print(f'patience {i}/{patience} remaining size {sample_size - valid_sample_size}')
+        round_draws = 0
+        round_valid = 0
+        for draw_size in draw_sizes:
+            samples = sampling_plan(draw_size, rng, dtype)
+            if evaluation_dtype is None:
+                evaluation_dtype = get_evaluation_dtype(eq_func, samples, dtype)
+            y = np.asarray(eq_func([samples[:, i].astype(evaluation_dtype, copy=False) for i in range(num_vars)]), dtype=dtype)
+            # Check if y contains NaN, Infinity, etc
+            valid_sample_flags = check_if_valid(y)
+            if evaluation_dtype != np.float64:
+                recheck_in_float64(samples, y, valid_sample_flags, eq_func, check_if_valid, dtype)
+            num_valid = np.count_nonzero(valid_sample_flags)
+            round_draws += draw_size
+            round_valid += num_valid
+
+            num_taken = min(num_valid, sample_size - valid_sample_size)
+            rows = slice(valid_sample_size, valid_sample_size + num_taken)
+            if num_taken == draw_size:
+                data[rows, :num_vars] = samples
+                data[rows, num_vars] = y
+            else:
+                valid_indices = np.flatnonzero(valid_sample_flags)[:num_taken]
+                data[rows, :num_vars] = samples[valid_indices]
+                data[rows, num_vars] = y[valid_indices]
+            valid_sample_size += num_taken
+            if valid_sample_size == sample_size:
+                break
+        diagnostics.add_round(round_draws, round_valid)
+
+        if valid_sample_size == sample_size:
+            return (data, diagnostics) if return_diagnostics else data
+    raise TimeoutError(f'number of valid samples (`{valid_sample_size}`) did not reach to '
+                        f'{sample_size} within {patience} trials ({diagnostics})')
+
+
+def get_evaluation_dtype(eq_func, samples, dtype):
+    # single precision samples are evaluated in single precision unless eq_func loses too much precision on
+    # the first SINGLE_PRECISION_PROBE_SIZE of them (e.g. subnormal intermediate results or cancellation),
+    # then the whole dataset is evaluated in double precision and only stored in `dtype`
+    probe = samples[:SINGLE_PRECISION_PROBE_SIZE]
+    y = np.asarray(eq_func([probe[:, i] for i in range(probe.shape[1])]), dtype=dtype)
+    y64 = np.asarray(eq_func([probe[:, i].astype(np.float64) for i in range(probe.shape[1])]), dtype=np.float64)
+    (_, max_value, tiny) = get_float_limits(dtype)
+    comparable = np.isfinite(y64) & (np.abs(y64) >= tiny) & (np.abs(y64) <= max_value)
+    errors = np.abs(y[comparable] - y64[comparable]) / np.abs(y64[comparable])
+    return np.dtype(dtype) if np.all(errors <= SINGLE_PRECISION_TOLERANCE) else np.dtype(np.float64)
+
+
+def recheck_in_float64(samples, y, valid_sample_flags, eq_func, check_if_valid, dtype):
+    # outputs close to zero or invalid in single precision (e.g. after cancellation or an underflowing
+    # intermediate result) are evaluated again in double precision; y and the flags are updated in place
+    rows = np.flatnonzero(get_near_zero_mask(y))
+    if len(rows) == 0:
+        return
+    samples64 = samples[rows].astype(np.float64)
+    y64 = np.asarray(eq_func([samples64[:, i] for i in range(samples64.shape[1])]), dtype=np.float64)
+    # the value has to be representable in `dtype`
+    valid_sample_flags[rows] = check_if_valid(y64, dtype)
+    y[rows] = y64
+
+
+def recheck_values_in_float64(values, evaluate, columns):
+    # `values` = evaluate(*columns) on single precision columns: the rows where any of the value arrays is close
+    # to zero (see get_near_zero_mask) are evaluated again on the columns converted to double precision,
+    # so the signs of small gradients do not depend on the rounding; returns float64 value arrays
+    rows = np.flatnonzero(np.logical_or.reduce([get_near_zero_mask(np.asarray(value)) for value in values]))
+    if len(rows) == 0:
+        return values
+    values64 = evaluate(*(np.asarray(column[rows], dtype=np.float64) for column in columns))
+    rechecked_values = []
+    for (value, value64) in zip(values, values64):
+        value = np.array(value, dtype=np.float64)
+        value[rows] = value64
+        rechecked_values.append(value)
+    return rechecked_values
+
+
+class RunningMoments(object):
+    """
+    Count, mean and (population) standard deviation of values added block by block,
+    combining the blocks with Welford's / Chan et al.'s update so no values need to be kept.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, values):
+        block_count = len(values)
+        if block_count == 0:
+            return
+        block_mean = np.mean(values)
+        block_m2 = np.sum((values - block_mean)**2)
+        count = self.count + block_count
+        delta = block_mean - self.mean
+        self.mean += delta * block_count / count
+        self.m2 += block_m2 + delta**2 * self.count * block_count / count
+        self.count = count
+
+    def get_std(self):
+        return np.sqrt(self.m2 / self.count) if self.count > 0 else 0.0
+
+
+def iter_dataset_blocks_from_sampling_objectives(sampling_objs, sympy_eq,eq_func,check_if_valid, sample_size, block_size=DEFAULT_DATASET_BLOCK_SIZE, patience=10, order='C', rng=None, dtype=np.float64):
+    # yields the dataset in blocks of at most block_size valid rows, every block is rejection sampled on its own,
+    # so memory is bounded by the block size; the blocks only depend on `rng` (not on the same rows as create_dataset)
+    assert block_size > 0, 'block_size must be positive'
+    rng = get_random_generator(rng)
+    for start in range(0, sample_size, block_size):
+        yield create_dataset_from_sampling_objectives(sampling_objs, sympy_eq, eq_func, check_if_valid,
+                                                      min(block_size, sample_size - start), patience, order=order, rng=rng, dtype=dtype)
 
 
 def get_constraint_descriptor( eq, local_dict, xs):
-    f = sympy.lambdify(local_dict, eq,"numpy")
-    #calculate gradient per data point
-    # gradients = np.array([ f(*row) for row in xs ])
-    # speedup of 5:
-    f_v = np.vectorize(f)
-    gradients = f_v(*(xs.T))
+    kernel = compile_constraint_kernel(eq, local_dict)
+    return get_constraint_descriptor_for_kernel(kernel, xs)
+
+def as_inexact_array(values):
+    # derivatives that simplify to an integer constant (e.g. 1 or 0) are evaluated as float arrays,
+    # float columns keep their precision
+    values = np.asarray(values)
+    return values if np.issubdtype(values.dtype, np.inexact) else values.astype(np.float64)
+
+def compile_constraint_kernel( eq, local_dict):
+    # array-native kernel: common subexpressions are assigned once (sympy.cse) and every
+    # statement is a NumPy ufunc call on whole columns instead of one Python call per row
+    f = sympy.lambdify(list(local_dict), eq, "numpy", cse=True)
+
+    def kernel(*xs):
+        # derivatives that simplify to a constant (or do not depend on every column)
+        # still yield one value per data point
+        return np.broadcast_to(as_inexact_array(f(*xs)), np.broadcast(*xs).shape)
+    return kernel
+
+def compile_constraint_kernels( eqs, local_dict):
+    # fused kernel evaluating several derivatives in one pass, subexpressions shared
+    # between the derivatives are computed only once; returns one array per derivative
+    f = sympy.lambdify(list(local_dict), list(eqs), "numpy", cse=True)
+
+    def kernel(*xs):
+        shape = np.broadcast(*xs).shape
+        return [np.broadcast_to(as_inexact_array(values), shape) for values in f(*xs)]
+    return kernel
+
+def get_constraint_descriptor_for_kernel( kernel, xs):
+    gradients = kernel(*(xs.T))
     return get_constraint_descriptor_for_gradients(gradients)
 
 def get_constraint_descriptor_for_gradients( gradients):
-    unique_gradient_signs = set(np.unique(np.sign(gradients)))
-    if((unique_gradient_signs ==  set([-1])) or (unique_gradient_signs ==  set([-1, 0]))):
+    return ViolationStatistics.from_gradients(gradients).get_descriptor()
+
+def get_constraint_descriptor_for_signs( unique_gradient_signs):
+    # NaN gradients (e.g. sqrt of a negative argument) do not describe any monotonicity
+    if(any(sign != sign for sign in unique_gradient_signs)):
+      descriptor = sk.EQUATION_CONSTRAINTS_DESCRIPTOR_UNKOWN_CONSTRAINT
+    elif((unique_gradient_signs ==  set([-1])) or (unique_gradient_signs ==  set([-1, 0]))):
       descriptor = sk.EQUATION_CONSTRAINTS_DESCRIPTOR_MONOTONIC_DECREASING_CONSTRAINT
     elif ((unique_gradient_signs ==  set([1])) or (unique_gradient_signs ==  set([0, 1]))):
         descriptor = sk.EQUATION_CONSTRAINTS_DESCRIPTOR_MONOTONIC_INCREASING_CONSTRAINT
@@ -81,11 +306,138 @@ def get_constraint_descriptor_for_gradients( gradients):
     elif (unique_gradient_signs ==  set([0])):
         descriptor = sk.EQUATION_CONSTRAINTS_DESCRIPTOR_CONSTANT_CONSTRAINT
     else:
-      raise "Unforseen sign values!"
+      raise ValueError(f'Unforseen sign values {unique_gradient_signs}!')
     return descriptor
 
+# a single gradient with one of these signs contradicts the constraint descriptor
+FORBIDDEN_GRADIENT_SIGNS = {
+    sk.EQUATION_CONSTRAINTS_DESCRIPTOR_MONOTONIC_INCREASING_CONSTRAINT: set([-1]),
+    sk.EQUATION_CONSTRAINTS_DESCRIPTOR_MONOTONIC_DECREASING_CONSTRAINT: set([1]),
+    sk.EQUATION_CONSTRAINTS_DESCRIPTOR_CONSTANT_CONSTRAINT: set([-1, 1]),
+}
+
+# gradients are classified in blocks of this size, so the boolean masks stay small
+SIGN_COUNTING_BLOCK_SIZE = 65_536
+
+class ViolationStatistics(object):
+    """
+    Sign histogram (negative, zero, positive and NaN counts) of the sampled gradients of a
+    constraint, gathered in a single pass without sorting. Relative to the expected descriptor
+    it reports the fraction of violating samples and the largest wrong-signed gradient.
+    """
+
+    def __init__(self, expected_descriptor = None):
+        self.expected_descriptor = expected_descriptor
+        self.negative = 0
+        self.zero = 0
+        self.positive = 0
+        self.nan = 0
+        self.min_negative = 0.0
+        self.max_positive = 0.0
+
+    @classmethod
+    def from_gradients(cls, gradients, expected_descriptor = None):
+        statistics = cls(expected_descriptor)
+        statistics.add_gradients(gradients)
+        return statistics
+
+    def add_gradients(self, gradients):
+        gradients = np.ravel(np.asarray(gradients))
+        if(len(gradients) == 0):
+            return self
+        block_size = min(len(gradients), SIGN_COUNTING_BLOCK_SIZE)
+        negative_mask = np.empty(block_size, dtype=bool)
+        zero_mask = np.empty(block_size, dtype=bool)
+        positive_mask = np.empty(block_size, dtype=bool)
+        for start in range(0, len(gradients), block_size):
+            block = gradients[start:start + block_size]
+            negative = np.less(block, 0, out=negative_mask[:len(block)])
+            zero = np.equal(block, 0, out=zero_mask[:len(block)])
+            positive = np.greater(block, 0, out=positive_mask[:len(block)])
+            num_negative = np.count_nonzero(negative)
+            num_zero = np.count_nonzero(zero)
+            num_positive = np.count_nonzero(positive)
+            # NaN is neither smaller than, equal to nor greater than zero
+            self.nan += len(block) - num_negative - num_zero - num_positive
+            self.negative += num_negative
+            self.zero += num_zero
+            self.positive += num_positive
+            if(num_negative > 0):
+                self.min_negative = min(self.min_negative, np.min(block, where=negative, initial=0))
+            if(num_positive > 0):
+                self.max_positive = max(self.max_positive, np.max(block, where=positive, initial=0))
+        return self
+
+    @property
+    def rows_evaluated(self):
+        return self.negative + self.zero + self.positive + self.nan
+
+    def get_unique_signs(self):
+        signs = set()
+        if(self.negative > 0):
+            signs.add(-1)
+        if(self.zero > 0):
+            signs.add(0)
+        if(self.positive > 0):
+            signs.add(1)
+        if(self.nan > 0):
+            signs.add(np.nan)
+        return signs
+
+    def get_descriptor(self):
+        return get_constraint_descriptor_for_signs(self.get_unique_signs())
+
+    def is_contradicted(self):
+        return self.violating_samples > 0
+
+    @property
+    def violating_samples(self):
+        forbidden_signs = FORBIDDEN_GRADIENT_SIGNS.get(self.expected_descriptor, set())
+        # a NaN gradient contradicts every expected descriptor
+        nan_violations = self.nan if self.expected_descriptor is not None else 0
+        return (self.negative if -1 in forbidden_signs else 0) + (self.positive if 1 in forbidden_signs else 0) + nan_violations
+
+    @property
+    def violation_fraction(self):
+        if(self.rows_evaluated == 0):
+            return 0.0
+        return self.violating_samples / self.rows_evaluated
+
+    @property
+    def max_violation(self):
+        # largest magnitude of a gradient with a forbidden sign
+        forbidden_signs = FORBIDDEN_GRADIENT_SIGNS.get(self.expected_descriptor, set())
+        magnitudes = [0.0]
+        if(-1 in forbidden_signs):
+            magnitudes.append(-self.min_negative)
+        if(1 in forbidden_signs):
+            magnitudes.append(self.max_positive)
+        return float(max(magnitudes))
+
+    def __repr__(self):
+        return (f'ViolationStatistics(negative={self.negative}, zero={self.zero}, positive={self.positive}, nan={self.nan}, '
+                f'violation_fraction={self.violation_fraction}, max_violation={self.max_violation})')
+
+def get_constraint_descriptors_chunked( evaluate_chunk, sample_size, expected_descriptors, chunk_size = None):
+    # evaluates the gradients of several constraints on the same dataset chunk by chunk:
+    # evaluate_chunk(start, stop) returns one gradient array per expected descriptor and the
+    # evaluation stops as soon as every expected descriptor is contradicted; returns one
+    # (descriptor, ViolationStatistics of the evaluated rows) per expected descriptor
+    if(chunk_size is None):
+      chunk_size = sample_size
+    statistics = [ViolationStatistics(expected_descriptor) for expected_descriptor in expected_descriptors]
+    for start in range(0, sample_size, chunk_size):
+      for (gradients, constraint_statistics) in zip(evaluate_chunk(start, min(start + chunk_size, sample_size)), statistics):
+        if(not constraint_statistics.is_contradicted()):
+          constraint_statistics.add_gradients(gradients)
+      if(all(constraint_statistics.is_contradicted() for constraint_statistics in statistics)):
+        break
+    return [(constraint_statistics.get_descriptor(), constraint_statistics) for constraint_statistics in statistics]
+
 class KnownEquation(object):
     _eq_name = None
+    # list of sampling.ValidityBound declaring the input values with valid outputs, sampled directly (see SamplingPlan)
+    validity_domain = None
 
     def __init__(self, num_vars, sampling_objs, kwargs_list=None):
         super().__init__()
@@ -95,8 +447,35 @@ class KnownEquation(object):
         assert len(sampling_objs) == num_vars
         assert len(kwargs_list) == num_vars
         self.sampling_objs = sampling_objs
-        self.x = [Symbol(f'x{i}', **kwargs) for i, kwargs in enumerate(kwargs_list)]
-        self.sympy_eq = None
+        # the symbols and the sympy expression are created on first use (see build_sympy_eq),
+        # so generating data through eq_func never builds sympy objects
+        self.kwargs_list = kwargs_list
+        self._x = None
+        self._sympy_eq = None
+        self._op_count = None
+        # SamplingPlan per use_validity_domain flag, built on first use (see get_sampling_plan)
+        self._sampling_plans = {}
+
+    @property
+    def x(self):
+        if self._x is None:
+            self._x = [sympy.Symbol(f'x{i}', **kwargs) for i, kwargs in enumerate(self.kwargs_list)]
+        return self._x
+
+    @property
+    def sympy_eq(self):
+        if self._sympy_eq is None:
+            self._sympy_eq = self.build_sympy_eq()
+        return self._sympy_eq
+
+    @sympy_eq.setter
+    def sympy_eq(self, sympy_eq):
+        self._sympy_eq = sympy_eq
+        self._op_count = None
+
+    def build_sympy_eq(self):
+        # returns the sympy expression of the equation in the symbols self.x
+        return None
 
     def calculate(self,xs):
         return self.eq_func(xs)
@@ -109,14 +488,16 @@ class KnownEquation(object):
         return prefix + self._eq_name + suffix
 
     def get_var_count(self):
-        return len(self.x)
+        return len(self.kwargs_list)
 
     def get_op_count(self):
-        return self.sympy_eq.count_ops()
+        if self._op_count is None:
+            self._op_count = self.sympy_eq.count_ops()
+        return self._op_count
 
     def check_num_vars_consistency(self, debug=False):
         num_vars = self.get_var_count()
-        num_vars_used = len(self.sympy_eq.atoms(Symbol))
+        num_vars_used = len(self.sympy_eq.atoms(sympy.Symbol))
         consistent = num_vars == num_vars_used
         if debug and not consistent:
             print(f'\tnumber of variables (`{num_vars}`) is not consistent with '
@@ -149,24 +530,38 @@ class KnownEquation(object):
     def eq_func(self, x):
         raise NotImplementedError()
 
-    def check_if_valid(self, values):
+    def check_if_valid(self, values, dtype=None):
+        # the thresholds are those of `dtype`, by default of the values (float64 unless they are float32)
+        (min_value, max_value, tiny) = get_float_limits(np.result_type(values, np.float32) if dtype is None else dtype)
         return ~np.isnan(values) * ~np.isinf(values) * \
-               (FLOAT64_MIN <= values) * (values <= FLOAT64_MAX) * (np.abs(values) >= FLOAT64_TINY)
+               (min_value <= values) * (values <= max_value) * (np.abs(values) >= tiny)
+
+    def get_sampling_plan(self, use_validity_domain=True):
+        # the plan (and the valid probabilities it estimates once) is reused by later datasets
+        # as long as the sampling objects are not replaced
+        (sampling_objs, plan) = self._sampling_plans.get(use_validity_domain, (None, None))
+        if sampling_objs is not self.sampling_objs:
+            plan = SamplingPlan(self.sampling_objs, self.validity_domain if use_validity_domain else None)
+            self._sampling_plans[use_validity_domain] = (self.sampling_objs, plan)
+        return plan
+
+    def create_dataset(self, sample_size, patience=10, return_diagnostics=False, order='C', rng=None, use_validity_domain=True, dtype=np.float64):
+        return create_dataset_from_sampling_objectives(self.get_sampling_plan(use_validity_domain), self.get_eq_name(), self.eq_func, self.check_if_valid, sample_size,patience, return_diagnostics, order, rng, dtype)
 
-    def create_dataset(self, sample_size, patience=10):
-        return create_dataset_from_sampling_objectives(self.sampling_objs, self.sympy_eq, self.eq_func, self.check_if_valid, sample_size,patience)
+    def iter_dataset_blocks(self, sample_size, block_size=DEFAULT_DATASET_BLOCK_SIZE, patience=10, order='C', rng=None, use_validity_domain=True, dtype=np.float64):
+        return iter_dataset_blocks_from_sampling_objectives(self.get_sampling_plan(use_validity_domain), self.get_eq_name(), self.eq_func, self.check_if_valid, sample_size, block_size, patience, order, rng, dtype)
 
     def find_stationary_points(self, excludes_saddle_points=False):
         if self.sympy_eq is None:
             raise ValueError('`sympy_eq` is None and should be initialized with sympy object')
 
         # 1st-order partial derivative
-        f_primes = [Derivative(self.sympy_eq, var).doit() for var in self.x]
+        f_primes = [sympy.Derivative(self.sympy_eq, var).doit() for var in self.x]
 
         # Find stationary points
         try:
-            stationary_points = solve(f_primes, self.x)
-            stationary_points = [sp for sp in map(lambda sp: simplify(sp), stationary_points)
+            stationary_points = sympy.solve(f_primes, self.x)
+            stationary_points = [sp for sp in map(lambda sp: sympy.simplify(sp), stationary_points)
                                  if isinstance(sp, sympy.core.containers.Tuple) and all([s.is_real for s in sp])]
             if len(stationary_points) == 0 or not excludes_saddle_points:
                 return stationary_points
@@ -175,10 +570,10 @@ class KnownEquation(object):
             return []
 
         # 2nd-order partial derivative
-        f_prime_mat = [[Derivative(f_prime, var).doit() for var in self.x] for f_prime in f_primes]
+        f_prime_mat = [[sympy.Derivative(f_prime, var).doit() for var in self.x] for f_prime in f_primes]
 
         # Hesse matrix
-        hesse_mat = Matrix(f_prime_mat)
+        hesse_mat = sympy.Matrix(f_prime_mat)
         det_hessian = hesse_mat.det()
 
         # Find saddle points
@@ -198,7 +593,7 @@ class KnownEquation(object):
         warnings.filterwarnings('ignore')
         variables = tuple(sympy_eq.free_symbols)
         if reindexes:
-            new_variables = tuple([Symbol(f'x{i}') for i in range(len(variables))])
+            new_variables = tuple([sympy.Symbol(f'x{i}') for i in range(len(variables))])
             for old_variable, new_variable in zip(variables, new_variables):
                 sympy_eq = sympy_eq.subs(old_variable, new_variable)
             variables = new_variables
@@ -206,22 +601,23 @@ class KnownEquation(object):
         assert len(sampling_objs) == len(variables)
         ds = cls(len(variables), sampling_objs)
         ds.sympy_eq = sympy_eq
-        eq_func = lambdify(variables, sympy_eq, modules='numpy')
+        eq_func = sympy.lambdify(variables, sympy_eq, modules='numpy')
         ds.eq_func = lambda x: eq_func(*x).T
         return ds
     
     def to_dataframe(self, data,use_display_name = False):
+        # the dataframe wraps `data` without copying it
         if(use_display_name):
-          return pd.DataFrame(data, columns= self.get_var_names() + [self.get_output_name()])
+          return pd.DataFrame(data, columns= self.get_var_names() + [self.get_output_name()], copy=False)
         else:
-          return pd.DataFrame(data, columns= self.get_vars() + [self.get_output_name()])
+          return pd.DataFrame(data, columns= self.get_vars() + [self.get_output_name()], copy=False)
     
-    def create_dataframe(self, sample_size, patience=10 ):
-        data = self.create_dataset(sample_size, patience)
+    def create_dataframe(self, sample_size, patience=10, rng=None ):
+        data = self.create_dataset(sample_size, patience, rng=rng)
         return self.to_dataframe(data)
     
-    def create_input_dataset (self, sample_size, patience=10):
-      dataset = self.create_dataset(sample_size, patience)
+    def create_input_dataset (self, sample_size, patience=10, rng=None):
+      dataset = self.create_dataset(sample_size, patience, rng=rng)
       return dataset[:,:-1]
     
     def get_inputs_from_dataset (self, dataset = None):
@@ -1,25 +1,73 @@
 import SCRBenchmark.base as base
-import sympy
 import numpy as np
-import pandas as pd
 import warnings
 import os
-import jax
+import hashlib
 import SCRBenchmark.Constants.StringKeys as sk
-from SCRBenchmark.Data.feynman_srsdf_constraint_info import SRSD_EQUATION_CONSTRAINTS as SRSDFConstraints
+from SCRBenchmark.lazy import lazy_import
+from SCRBenchmark.cache import DerivativeKernelCache, JaxFunctionCache, DEFAULT_KERNEL_CACHE_SIZE, DEFAULT_DISK_CACHE_MAX_SIZE, resolve_cache_dir, load_or_create_array
+from SCRBenchmark.seeds import SEEDS
+from SCRBenchmark.sampling import get_seed_sequence, sample_unit_design, UNIFORM_DESIGN, UNIT_DESIGNS
+from SCRBenchmark.storage import write_dataset_blocks
+from SCRBenchmark.derivatives import get_constraint_var, plan_derivatives
+sympy = lazy_import('sympy')
+pd = lazy_import('pandas')
 CONSTRAINT_SAMPLING_SIZE = 100_000
+CONSTRAINT_SAMPLING_SEED = SEEDS[0]
+# bump if the way constraint checking datasets are sampled changes, invalidates cached datasets
+CONSTRAINT_DATASET_VERSION = 2
+TWO_PASS_NOISE_STD_ESTIMATE = 'two_pass'
+STREAMING_NOISE_STD_ESTIMATE = 'streaming'
+NOISE_STD_ESTIMATES = [TWO_PASS_NOISE_STD_ESTIMATE, STREAMING_NOISE_STD_ESTIMATE]
+# values of the Library argument of check_constraints, JAX is optional (pip install SCRBenchmark[jax])
+SUPPORTED_LIBRARIES = ["SymPy", "JAX"]
+
+def get_available_libraries():
+    from SCRBenchmark import jax_backend
+    return [library for library in SUPPORTED_LIBRARIES if library != "JAX" or jax_backend.is_available()]
 
 class Benchmark(object):
     _eq_name = None
     
 
-    def __init__(self, equation, initialize_constraint_checking_datasets = True):
+    def __init__(self, equation, initialize_constraint_checking_datasets = True, kernel_cache_size = DEFAULT_KERNEL_CACHE_SIZE,
+                 jax_compilation_cache_dir = None,
+                 constraint_dataset_cache_dir = None,
+                 test_dataset_cache_dir = None,
+                 disk_cache_max_size = DEFAULT_DISK_CACHE_MAX_SIZE,
+                 constraint_sampling = UNIFORM_DESIGN, constraint_sampling_size = None,
+                 constraint_dtype = np.float64):
         super().__init__()
         assert issubclass(equation ,base.KnownEquation)
 
         self.equation = equation()
-        self.constraints = self.get_constraints()
+        # looked up on first use, generating data does not need the constraint definitions
+        self._constraints = None
         self.datasets = None
+        # constraint checking datasets are stored as .npy files in this folder (None: the user cache folder,
+        # resolved on use), False keeps them in memory only
+        self.constraint_dataset_cache_dir = constraint_dataset_cache_dir
+        # design of the constraint checking datasets (one of sampling.UNIT_DESIGNS) and their number of samples;
+        # the space-filling designs ('sobol', 'halton', 'lhs') cover the sample spaces with fewer samples;
+        # constraint_sampling_size = None uses the module's CONSTRAINT_SAMPLING_SIZE at construction time
+        assert constraint_sampling in UNIT_DESIGNS, f'constraint_sampling must be one of {UNIT_DESIGNS}'
+        self.constraint_sampling = constraint_sampling
+        self.constraint_sampling_size = CONSTRAINT_SAMPLING_SIZE if constraint_sampling_size is None else constraint_sampling_size
+        # dtype of the constraint checking datasets, np.float32 halves their size; in single precision
+        # the SymPy checks evaluate derivatives close to zero again in double precision
+        base.get_float_limits(constraint_dtype)
+        self.constraint_dtype = np.dtype(constraint_dtype)
+        # the parsed test set is stored as .npy file in this folder (None: the user cache folder, resolved on use),
+        # False parses the csv on every read
+        self.test_dataset_cache_dir = test_dataset_cache_dir
+        # bytes kept in each of the cache folders, the least recently used files are deleted beyond that (None: unbounded)
+        self.disk_cache_max_size = disk_cache_max_size
+        # parsed candidates, their derivatives and lambdified kernels of check_constraints_SymPy
+        self.kernel_cache = DerivativeKernelCache(kernel_cache_size)
+        # jitted and compiled derivative functions of check_constraints_JAX
+        # jax_compilation_cache_dir = False disables JAX's on-disk compilation cache
+        self.jax_cache = JaxFunctionCache(kernel_cache_size, jax_compilation_cache_dir, disk_cache_max_size)
+        self.derivative_plans = {}
         if(initialize_constraint_checking_datasets):
           self.read_datasets_for_constraint_checking()
 
@@ -27,59 +75,178 @@ class Benchmark(object):
       constraints = [c for c in self.constraints if c[sk.EQUATION_CONSTRAINTS_DESCRIPTOR_KEY]!=sk.EQUATION_CONSTRAINTS_DESCRIPTOR_NO_CONSTRAINT]
       if(len(constraints) == 0):
           warnings.warn( f"equation {self.equation._eq_name} has to have constraints to be checked. all checks will return true.")
+      # constraints with the same sample space share one dataset (the same array object)
       self.datasets = {}
+      self.dataset_groups = {}
       for constraint in constraints:
           sample_space = constraint[sk.EQUATION_CONSTRAINTS_SAMPLE_SPACE_KEY]
-          lows = [ space['low'] for space in sample_space]
-          highs = [ space['high'] for space in sample_space]
+          lows = [ float(space['low']) for space in sample_space]
+          highs = [ float(space['high']) for space in sample_space]
+
+          sample_space_key = (tuple(lows), tuple(highs))
+          if(sample_space_key not in self.dataset_groups):
+            self.dataset_groups[sample_space_key] = self.read_dataset_for_constraint_checking(lows, highs)
+          self.datasets[constraint[sk.EQUATION_CONSTRAINTS_ID_KEY]] = self.dataset_groups[sample_space_key]
+
+    def get_constraint_groups(self, constraints):
+      # groups the constraints by the dataset they are checked on, returns a list of (dataset, constraints)
+      groups = {}
+      for constraint in constraints:
+        #every constraint has a specific input range in which they apply
+        xs = self.datasets[constraint[sk.EQUATION_CONSTRAINTS_ID_KEY]]
+        groups.setdefault(id(xs), (xs, []))[1].append(constraint)
+      return list(groups.values())
+
+    def read_dataset_for_constraint_checking(self, lows, highs):
+      # the dataset is sampled from a seed derived from the sample space, so it is reproducible and
+      # identical in every process; the key changes with the sample space and the sampling settings
+      key = str((CONSTRAINT_DATASET_VERSION, CONSTRAINT_SAMPLING_SEED, self.constraint_sampling_size, self.constraint_sampling, list(lows), list(highs), str(self.constraint_dtype)))
+      digest = hashlib.sha256(key.encode('utf-8')).hexdigest()
 
-          self.datasets[constraint[sk.EQUATION_CONSTRAINTS_ID_KEY]] = np.random.uniform(lows,highs,(CONSTRAINT_SAMPLING_SIZE,self.equation.get_var_count()))
+      def create():
+        rng = np.random.default_rng(np.random.SeedSequence([CONSTRAINT_SAMPLING_SEED, int(digest[:16], 16)]))
+        unit_samples = sample_unit_design(self.constraint_sampling, self.constraint_sampling_size, len(lows), rng)
+        # column-major, so that the per-variable columns passed to the kernels are contiguous
+        return np.asfortranarray(np.asarray(lows) + unit_samples * (np.asarray(highs) - np.asarray(lows)), dtype = self.constraint_dtype)
+
+      cache_dir = resolve_cache_dir(self.constraint_dataset_cache_dir, 'constraint_datasets')
+      if(cache_dir is None):
+        return create()
+      return load_or_create_array(os.path.join(cache_dir, f'{digest}.npy'), create, self.disk_cache_max_size)
 
     def read_test_dataframe(self):
         file = os.path.join(os.path.dirname(__file__),f'Data/Test/{self.equation.get_eq_name()}.csv')
-        return pd.read_csv(file)
+        cache_dir = resolve_cache_dir(self.test_dataset_cache_dir, 'test_datasets')
+        if(cache_dir is None):
+          return pd.read_csv(file)
+        # the csv is parsed once, later reads load the binary copy (keyed on the file's size and modification time)
+        stat = os.stat(file)
+        cache_file = os.path.join(cache_dir, f'{self.equation.get_eq_name()}_{stat.st_size}_{stat.st_mtime_ns}.npy')
+        data = load_or_create_array(cache_file, lambda: pd.read_csv(file).to_numpy(), self.disk_cache_max_size)
+        return pd.DataFrame(np.array(data), columns = pd.read_csv(file, nrows = 0).columns, copy = False)
     
-    def create_dataset(self, sample_size,  noise_level = 0, seed = None, patience = 10 ):
-        assert (0<=noise_level and noise_level<=1), f'noise_level must be in [0,1]'
+    def create_dataset(self, sample_size,  noise_level = 0, seed = None, patience = 10, dtype = np.float64 ):
+        # dtype = np.float32 returns single precision training and test data
+        xs = self.create_training_dataset(sample_size, noise_level = noise_level, seed = seed, patience = patience, dtype = dtype)
+        return (xs, self.read_test_dataframe().to_numpy(dtype = dtype))
+
+    def create_training_dataset(self, sample_size,  noise_level = 0, seed = None, patience = 10, dtype = np.float64 ):
+        # same training data as create_dataset, without reading the test set
+        assert (0<=noise_level and noise_level<=1), 'noise_level must be in [0,1]'
 
-        if(not (seed is None)):
-          np.random.seed(seed)
+        # sampling and noise draw from independent streams spawned from `seed` (an integer,
+        # e.g. one of SEEDS, or a SeedSequence), so a dataset only depends on its seed and
+        # not on what was generated before it in the same process
+        (sampling_seed, noise_seed) = get_seed_sequence(seed).spawn(2)
 
-        xs = self.equation.create_dataset(sample_size,patience)
+        xs = self.equation.create_dataset(sample_size,patience, rng = np.random.default_rng(sampling_seed), dtype = dtype)
 
         if(noise_level>0):
           std_dev = np.std(xs[:,-1])
-          xs[:,-1] = xs[:,-1] + np.random.normal(0,std_dev*np.sqrt(noise_level),len(xs))
+          xs[:,-1] += np.random.default_rng(noise_seed).normal(0,std_dev*np.sqrt(noise_level),len(xs))
 
-        return (xs, self.read_test_dataframe().to_numpy())
+        return xs
     
-    def create_dataframe(self,sample_size, noise_level = 0, seed = None, patience = 10, use_display_name = False ):
+    def iter_training_dataset_blocks(self, sample_size, noise_level = 0, seed = None, patience = 10,
+                                     block_size = base.DEFAULT_DATASET_BLOCK_SIZE, noise_std_estimate = TWO_PASS_NOISE_STD_ESTIMATE):
+        # yields the training data in blocks of block_size rows, seeded like create_training_dataset
+        # (but not the same rows). the noise is scaled to the standard deviation of the output, either computed
+        # in a first pass over all blocks (TWO_PASS_NOISE_STD_ESTIMATE, samples the data twice) or the running
+        # estimate over the blocks generated so far (STREAMING_NOISE_STD_ESTIMATE, a single pass)
+        assert (0<=noise_level and noise_level<=1), 'noise_level must be in [0,1]'
+        assert noise_std_estimate in NOISE_STD_ESTIMATES, f'noise_std_estimate must be one of {NOISE_STD_ESTIMATES}'
+
+        (sampling_seed, noise_seed) = get_seed_sequence(seed).spawn(2)
+        def iter_blocks():
+          return self.equation.iter_dataset_blocks(sample_size, block_size, patience, rng = np.random.default_rng(sampling_seed))
+
+        if(noise_level == 0):
+          yield from iter_blocks()
+          return
+
+        moments = base.RunningMoments()
+        if(noise_std_estimate == TWO_PASS_NOISE_STD_ESTIMATE):
+          for block in iter_blocks():
+            moments.add(block[:,-1])
+        noise_rng = np.random.default_rng(noise_seed)
+        for block in iter_blocks():
+          if(noise_std_estimate == STREAMING_NOISE_STD_ESTIMATE):
+            moments.add(block[:,-1])
+          block[:,-1] += noise_rng.normal(0,moments.get_std()*np.sqrt(noise_level),len(block))
+          yield block
+
+    def write_training_dataset(self, file, sample_size, noise_level = 0, seed = None, patience = 10,
+                               block_size = base.DEFAULT_DATASET_BLOCK_SIZE, noise_std_estimate = TWO_PASS_NOISE_STD_ESTIMATE,
+                               format = None, use_display_name = False):
+        # streams the blocks of iter_training_dataset_blocks to `file` (csv, npy, parquet or feather, inferred from
+        # the file extension by default), memory is bounded by the block size
+        if(use_display_name):
+          columns = self.equation.get_var_names() + [self.equation.get_output_name()]
+        else:
+          columns = self.equation.get_vars() + [self.equation.get_output_name()]
+        blocks = self.iter_training_dataset_blocks(sample_size, noise_level = noise_level, seed = seed, patience = patience,
+                                                   block_size = block_size, noise_std_estimate = noise_std_estimate)
+        write_dataset_blocks(blocks, file, columns, sample_size, format)
+
+    def create_dataframe(self,sample_size, noise_level = 0, seed = None, patience = 10, use_display_name = False, dtype = np.float64 ):
        (train, test) = self.create_dataset(sample_size=sample_size,
                                            noise_level=noise_level,
                                            seed= seed,
-                                           patience = patience)
+                                           patience = patience,
+                                           dtype = dtype)
        train_df = self.equation.to_dataframe(train,use_display_name)
        test_df = self.equation.to_dataframe(test,use_display_name)
        return (train_df,test_df)
 
+    def get_derivative_plan (self, use_display_names = False):
+      if(use_display_names not in self.derivative_plans):
+        constraints = [c for c in self.constraints if c[sk.EQUATION_CONSTRAINTS_DESCRIPTOR_KEY]!=sk.EQUATION_CONSTRAINTS_DESCRIPTOR_NO_CONSTRAINT]
+        self.derivative_plans[use_display_names] = plan_derivatives(constraints, use_display_names)
+      return self.derivative_plans[use_display_names]
+
+    @property
+    def constraints (self):
+      if(self._constraints is None):
+        self._constraints = self.get_constraints()
+      return self._constraints
+
     def get_constraints (self):
+      from SCRBenchmark.Data.feynman_srsdf_constraint_info import SRSD_EQUATION_CONSTRAINTS as SRSDFConstraints
       if(self.equation.get_eq_source() == sk.SRSDF_SOURCE_QUALIFIER):
           return next(x[sk.EQUATION_CONSTRAINTS_CONSTRAINTS_KEY] for x in SRSDFConstraints if x[sk.EQUATION_EQUATION_NAME_KEY] == self.equation.get_eq_name())
           
-    def check_constraints (self, f, Library = "SymPy", use_display_names = False):
+    def check_constraints (self, f, Library = "SymPy", use_display_names = False, chunk_size = None, return_statistics = False, cache_key = None):
+      # with chunk_size set, every constraint dataset is evaluated in chunks of that many rows and the
+      # check of a constraint stops at the first chunk contradicting it
+      # with return_statistics, a dict of constraint id -> base.ViolationStatistics (sign counts of the
+      # evaluated rows, fraction of violating samples, largest wrong-signed derivative) is returned as third element
+      # cache_key identifies JAX callables that are recreated for every check (e.g. lambdas) in the jit cache
       if(Library == "SymPy"):
-        return self.check_constraints_SymPy (f, use_display_names)
+        return self.check_constraints_SymPy (f, use_display_names, chunk_size, return_statistics)
       elif(Library == "JAX"):
-        return self.check_constraints_JAX (f, use_display_names)
+        return self.check_constraints_JAX (f, use_display_names, chunk_size, return_statistics, cache_key)
       else:
         raise RuntimeError(f"Specified library '{Library}' is not supported.")
        
-    def check_constraints_SymPy (self, f, use_display_names = False):
+    def check_constraints_SymPy (self, f, use_display_names = False, chunk_size = None, return_statistics = False):
+      return self.check_constraints_batch_SymPy([f], use_display_names, chunk_size, return_statistics)[0]
+
+    def check_constraints_batch (self, expressions, Library = "SymPy", use_display_names = False, chunk_size = None, return_statistics = False, cache_keys = None):
+      # checks a whole population of candidates, returns one (bool, violated_constraints) tuple per candidate
+      # cache_keys (JAX only) gives one jit cache key per candidate, see check_constraints_batch_JAX
+      if(Library == "SymPy"):
+        return self.check_constraints_batch_SymPy (expressions, use_display_names, chunk_size, return_statistics)
+      elif(Library == "JAX"):
+        return self.check_constraints_batch_JAX (expressions, use_display_names, chunk_size, return_statistics, cache_keys)
+      else:
+        raise RuntimeError(f"Specified library '{Library}' is not supported.")
+
+    def check_constraints_batch_SymPy (self, expressions, use_display_names = False, chunk_size = None, return_statistics = False):
       constraints = self.get_constraints()
 
       constraints = [c for c in constraints if c[sk.EQUATION_CONSTRAINTS_DESCRIPTOR_KEY]!=sk.EQUATION_CONSTRAINTS_DESCRIPTOR_NO_CONSTRAINT]
       if(len(constraints) == 0):
-          return (True, []) #no constraints to check
+          return [(True, [], {}) if return_statistics else (True, []) for _ in expressions] #no constraints to check
       
       if(self.datasets is None):
           self.read_datasets_for_constraint_checking()
@@ -89,98 +256,63 @@ class Benchmark(object):
       if(use_display_names):
           local_dict = { c : sympy.Symbol(c) for c in self.equation.get_var_names()}
 
-      # parse the provided candidate expression
-      # will use display names if specified
-      expr = sympy.parse_expr(f, evaluate=False, local_dict= local_dict)
+      # identical candidates are checked only once
+      unique_expressions = list(dict.fromkeys(expressions))
 
-      #calculate all first order partial derivatives of the expression 
-      f_primes = [(sympy.Derivative(expr, var).doit(),var.name, 1) 
-                 for var
-                 in local_dict.values()]
-      
-      #calculate all second order partial derivatives of the expression (every possible combination [Hessian])
-      f_prime_mat = [[ (sympy.Derivative(f_prime, var).doit(), [prime_var_name,var.name], 2 ) 
-                        for var
-                        in local_dict.values()] 
-                     for (f_prime, prime_var_name, _) 
-                     in f_primes]
-      
-      #flatten 2d Hessian to 1d list and combine them 
-      f_prime_mat_flattened = [item for sublist in f_prime_mat for item in sublist]
-      derviatives = f_primes+f_prime_mat_flattened
-      
-      
-      violated_constraints = []
-      #check for all existing constraints if they are met
-      for constraint in constraints:
-        #every constraint has a specific input range in which they apply
-        xs = self.datasets[constraint[sk.EQUATION_CONSTRAINTS_ID_KEY]]
-
-        #the current constraint to be checked matches only one of derivatives (all possible combinations are derived)
-        if(use_display_names):
-          matches = [ derivative for (derivative, var, _) in derviatives if var == constraint[sk.EQUATION_CONSTRAINTS_VAR_DISPLAY_NAME_KEY]]
-        else:
-          matches = [ derivative for (derivative, var, _) in derviatives if var == constraint[sk.EQUATION_CONSTRAINTS_VAR_NAME_KEY]]
-
-        if(len(matches)>1):
-           raise "derivatives are not names uniquely"
-        if(len(matches)==0):
-           raise "derivative not available"
-        derivative = matches[0]
-
-        #does the calculated (sampled) gradient for the current derivative match the constraint description
-        descriptor = base.get_constraint_descriptor(derivative, local_dict.keys(), xs)
-        if(descriptor != constraint[sk.EQUATION_CONSTRAINTS_DESCRIPTOR_KEY]):
-            violated_constraints.append(constraint)
-
-      return (len(violated_constraints) == 0, violated_constraints)
-    
-    def check_constraints_JAX (self, f, use_display_names = False):
-      constraints = self.get_constraints()
-
-      constraints = [c for c in constraints if c[sk.EQUATION_CONSTRAINTS_DESCRIPTOR_KEY]!=sk.EQUATION_CONSTRAINTS_DESCRIPTOR_NO_CONSTRAINT]
-      if(len(constraints) == 0):
-          return (True, []) #no constraints to check
-      
-      if(self.datasets is None):
-          self.read_datasets_for_constraint_checking()
+      # parse the provided candidate expressions (or reuse them together with their derivatives and kernels)
+      # will use display names if specified
+      candidates = [self.kernel_cache.get_candidate(f, use_display_names, local_dict) for f in unique_expressions]
 
-      # replace the sympy local dictionary with the display names of variables if specified
-      var_names = [v.name for v in self.equation.get_vars()]
+      # only the partial derivatives referenced by the constraints are derived
+      plan = self.get_derivative_plan(use_display_names)
+      for candidate in candidates:
+        candidate.compute_derivatives(plan)
 
-      g = jax.jit(jax.grad(f))
-      hessian = jax.jit(jax.hessian(f))
-      
-      violated_constraints = []
+      violated_constraints = { f : [] for f in unique_expressions }
+      statistics = { f : {} for f in unique_expressions }
       #check for all existing constraints if they are met
-      for constraint in constraints:
-        #every constraint has a specific input range in which they apply
-        xs = self.datasets[constraint[sk.EQUATION_CONSTRAINTS_ID_KEY]]
-
-        var_name_constraint = constraint[sk.EQUATION_CONSTRAINTS_VAR_NAME_KEY]
-        descriptor = sk.EQUATION_CONSTRAINTS_DESCRIPTOR_UNKOWN_CONSTRAINT
-
-        # checking the different types of constraints supported
-        if(constraint[sk.EQUATION_CONSTRAINTS_ORDER_DERIVATIVE_KEY] == 1):
-          #constraint is defined for the first order derivative
-          # the signs of the functions gradient are to be checked for the input domain
-          var_index = var_names.index(var_name_constraint)
-          gradients = y = jax.vmap(g)(xs) 
-          var_gradients = gradients[:,var_index]
-          descriptor = base.get_constraint_descriptor_for_gradients(var_gradients)
-
-        elif(constraint[sk.EQUATION_CONSTRAINTS_ORDER_DERIVATIVE_KEY] == 2):
-          var1_index = var_names.index(var_name_constraint[0])
-          var2_index = var_names.index(var_name_constraint[1])
-          hessian_gradients = jax.vmap(hessian)(xs) 
-          var_gradients = hessian_gradients[:,var1_index,var2_index]
-          descriptor = base.get_constraint_descriptor_for_gradients(var_gradients)
-
-        else:
-          raise "constraint was available but it was not handled/checked"
+      for (xs, group) in self.get_constraint_groups(constraints):
+        #the input columns of a dataset are shared by all candidates and all constraints checked on it
+        columns = tuple(xs.T)
+        variables = [get_constraint_var(constraint, use_display_names) for constraint in group]
+        expected_descriptors = [constraint[sk.EQUATION_CONSTRAINTS_DESCRIPTOR_KEY] for constraint in group]
 
+        for (f, candidate) in zip(unique_expressions, candidates):
+          #does the calculated (sampled) gradient for the current derivatives match the constraint descriptions
+          #all derivatives needed on the dataset are evaluated in one fused pass
+          kernel = candidate.get_fused_kernel(variables)
+          if(xs.dtype == np.float64):
+            evaluate_chunk = lambda start, stop: kernel(*(column[start:stop] for column in columns))
+          else:
+            evaluate_chunk = lambda start, stop: base.recheck_values_in_float64(kernel(*(column[start:stop] for column in columns)),
+                                                                                 kernel, [column[start:stop] for column in columns])
+          results = base.get_constraint_descriptors_chunked(evaluate_chunk,
+                                                            len(xs),
+                                                            expected_descriptors,
+                                                            chunk_size)
+          for (constraint, (descriptor, constraint_statistics)) in zip(group, results):
+            statistics[f][constraint[sk.EQUATION_CONSTRAINTS_ID_KEY]] = constraint_statistics
+            if(descriptor != constraint[sk.EQUATION_CONSTRAINTS_DESCRIPTOR_KEY]):
+                violated_constraints[f].append(constraint)
 
-        if(descriptor != constraint[sk.EQUATION_CONSTRAINTS_DESCRIPTOR_KEY]):
-            violated_constraints.append(constraint)
+      if(return_statistics):
+        return [(len(violated_constraints[f]) == 0, violated_constraints[f], statistics[f]) for f in expressions]
+      return [(len(violated_constraints[f]) == 0, violated_constraints[f]) for f in expressions]
 
-      return (len(violated_constraints) == 0, violated_constraints)
+    def check_constraints_batch_JAX (self, expressions, use_display_names = False, chunk_size = None, return_statistics = False, cache_keys = None):
+      # cache_keys identifies the candidates in the jit cache (like cache_key of check_constraints), so a population
+      # of lambdas recreated for every generation reuses the compiled functions; candidates with the same key
+      # (by default the same callable) are checked only once, the constraint datasets are shared
+      if(cache_keys is None):
+        cache_keys = expressions
+      assert len(cache_keys) == len(expressions), 'one cache key per candidate is required'
+      results = {}
+      for (f, cache_key) in zip(expressions, cache_keys):
+        if(cache_key not in results):
+          results[cache_key] = self.check_constraints_JAX(f, use_display_names, chunk_size, return_statistics, cache_key)
+      return [results[cache_key] for cache_key in cache_keys]
+    
+    def check_constraints_JAX (self, f, use_display_names = False, chunk_size = None, return_statistics = False, cache_key = None):
+      # the JAX checker is an optional backend (pip install SCRBenchmark[jax]), see jax_backend.is_available
+      from SCRBenchmark import jax_backend
+      return jax_backend.check_constraints(self, f, use_display_names, chunk_size, return_statistics, cache_key)
@@ -0,0 +1,294 @@
+import importlib.util
+import os
+import tempfile
+import time
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+import SCRBenchmark.base as base
+from SCRBenchmark.derivatives import compute_derivative, get_derivative_key
+from SCRBenchmark.lazy import lazy_import
+
+sympy = lazy_import('sympy')
+
+DEFAULT_KERNEL_CACHE_SIZE = 1024
+# bytes kept in every on-disk cache folder, the least recently used files are deleted beyond that
+DEFAULT_DISK_CACHE_MAX_SIZE = 1024 ** 3
+
+KernelCacheInfo = namedtuple('KernelCacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+JaxCacheInfo = namedtuple('JaxCacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize',
+                                           'compilations', 'compile_seconds', 'evaluation_seconds'])
+
+
+def get_user_cache_dir(*subdirs):
+    # SCRBENCHMARK_CACHE_DIR overrides the platform default ($XDG_CACHE_HOME or ~/.cache)
+    cache_dir = os.environ.get('SCRBENCHMARK_CACHE_DIR')
+    if cache_dir is None:
+        base_dir = os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+        cache_dir = os.path.join(base_dir, 'SCRBenchmark')
+    return os.path.join(cache_dir, *subdirs)
+
+
+def resolve_cache_dir(cache_dir, *subdirs):
+    # None is resolved to the user cache folder when the cache is used (so SCRBENCHMARK_CACHE_DIR
+    # can still be changed after import), False disables the cache (returns None)
+    if cache_dir is False:
+        return None
+    if cache_dir is None:
+        return get_user_cache_dir(*subdirs)
+    return cache_dir
+
+
+def evict_cache_files(folder, max_size, keep=None):
+    # deletes the least recently used .npy files in `folder` until at most `max_size` bytes are left
+    entries = []
+    with os.scandir(folder) as scanned:
+        for entry in scanned:
+            if entry.name.endswith('.npy') and entry.is_file():
+                stat = entry.stat()
+                entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+    total_size = sum(size for (_, size, _) in entries)
+    for (_, size, path) in sorted(entries):
+        if total_size <= max_size:
+            break
+        if keep is not None and os.path.samefile(path, keep):
+            continue
+        try:
+            os.remove(path)
+        except OSError:
+            # removed by a concurrent process or still opened (Windows)
+            continue
+        total_size -= size
+
+
+def load_or_create_array(file, create, max_size=None):
+    # returns the array stored in `file` memory-mapped (read-only, shared by all processes using it)
+    # or creates it by calling `create()` and stores it; the file is written to a temporary file
+    # first and renamed afterwards, so concurrent processes never read a partially written array
+    # with max_size set, the folder of `file` is kept below max_size bytes (least recently used first)
+    if os.path.exists(file):
+        try:
+            # marks the file as recently used for the eviction
+            os.utime(file)
+        except OSError:
+            pass
+    else:
+        array = create()
+        folder = os.path.dirname(file)
+        os.makedirs(folder, exist_ok=True)
+        (handle, temporary_file) = tempfile.mkstemp(dir=folder, suffix='.npy.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as temporary:
+                np.save(temporary, array)
+            os.replace(temporary_file, file)
+        except BaseException:
+            os.remove(temporary_file)
+            raise
+        if max_size is not None:
+            evict_cache_files(folder, max_size, keep=file)
+    return np.load(file, mmap_mode='r')
+
+
+class CompiledCandidate(object):
+    """
+    Parsed candidate expression together with its symbolic derivatives and the
+    lambdified NumPy kernels evaluating them. Derivatives are computed lazily and keyed
+    by `derivatives.get_derivative_key`, e.g. 'x0' or ('x0', 'x1').
+    """
+
+    def __init__(self, expr, local_dict):
+        self.expr = expr
+        self.local_dict = local_dict
+        self.derivatives = {}
+        self.kernels = {}
+
+    def compute_derivatives(self, plan):
+        for key in plan:
+            compute_derivative(self.derivatives, self.expr, self.local_dict, key)
+
+    def get_derivative(self, var):
+        return compute_derivative(self.derivatives, self.expr, self.local_dict, get_derivative_key(var))
+
+    def get_fused_kernel(self, variables):
+        # one kernel evaluating the derivatives over all `variables` (one array per entry)
+        keys = [get_derivative_key(var) for var in variables]
+        unique_keys = tuple(dict.fromkeys(keys))
+        if unique_keys not in self.kernels:
+            self.kernels[unique_keys] = base.compile_constraint_kernels([self.get_derivative(key) for key in unique_keys],
+                                                                        self.local_dict.keys())
+        kernel = self.kernels[unique_keys]
+        positions = [unique_keys.index(key) for key in keys]
+
+        def fused_kernel(*xs):
+            values = kernel(*xs)
+            return [values[position] for position in positions]
+        return fused_kernel
+
+
+class DerivativeKernelCache(object):
+    """
+    Bounded LRU cache of `CompiledCandidate` objects keyed on the canonical form
+    of the parsed candidate expression and the `use_display_names` flag.
+    The raw candidate strings are kept as aliases of their canonical entry so that
+    repeated checks of the same string skip parsing entirely.
+    """
+
+    def __init__(self, maxsize=DEFAULT_KERNEL_CACHE_SIZE):
+        assert maxsize is None or maxsize > 0, 'maxsize must be positive or None (unbounded)'
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._aliases = {}
+        self._entry_aliases = {}
+
+    def get_candidate(self, f, use_display_names, local_dict):
+        alias = (f, use_display_names)
+        key = self._aliases.get(alias)
+        if key is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        expr = sympy.parse_expr(f, evaluate=False, local_dict=local_dict)
+        key = (sympy.srepr(expr), use_display_names)
+        if key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            self._add_alias(alias, key)
+            return self._entries[key]
+
+        self.misses += 1
+        candidate = CompiledCandidate(expr, local_dict)
+        self._entries[key] = candidate
+        self._entry_aliases[key] = []
+        self._add_alias(alias, key)
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._evict()
+        return candidate
+
+    def info(self):
+        return KernelCacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries))
+
+    def clear(self):
+        self._entries.clear()
+        self._aliases.clear()
+        self._entry_aliases.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _add_alias(self, alias, key):
+        self._aliases[alias] = key
+        self._entry_aliases[key].append(alias)
+
+    def _evict(self):
+        (key, _) = self._entries.popitem(last=False)
+        for alias in self._entry_aliases.pop(key):
+            del self._aliases[alias]
+        self.evictions += 1
+
+
+class CompiledJaxFunction(object):
+    """
+    Jitted JAX function together with its ahead-of-time compiled executables, one per input
+    shape and dtype. Compilation and evaluation time are accounted separately in the owning cache.
+    """
+
+    def __init__(self, jitted, cache):
+        self.jitted = jitted
+        self.cache = cache
+        self.executables = {}
+
+    def __call__(self, xs):
+        signature = (xs.shape, str(xs.dtype))
+        executable = self.executables.get(signature)
+        if executable is None:
+            start = time.perf_counter()
+            executable = self.jitted.lower(xs).compile()
+            self.cache.compile_seconds += time.perf_counter() - start
+            self.cache.compilations += 1
+            self.executables[signature] = executable
+
+        start = time.perf_counter()
+        result = executable(xs).block_until_ready()
+        self.cache.evaluation_seconds += time.perf_counter() - start
+        return result
+
+
+class JaxFunctionCache(object):
+    """
+    Bounded LRU cache of the jitted derivative functions of `Benchmark.check_constraints_JAX`.
+    Entries are keyed on the checked callable (or a user supplied key, e.g. for lambdas that
+    are recreated for every check) and the kind of derivative.
+    Unless `persistent_cache_dir` is False, JAX's on-disk compilation cache is enabled in that
+    directory (None: the user cache folder) on first use (unless it was configured before),
+    so new processes skip XLA compilation too.
+    """
+
+    def __init__(self, maxsize=DEFAULT_KERNEL_CACHE_SIZE, persistent_cache_dir=None,
+                 persistent_cache_max_size=DEFAULT_DISK_CACHE_MAX_SIZE):
+        assert maxsize is None or maxsize > 0, 'maxsize must be positive or None (unbounded)'
+        self.maxsize = maxsize
+        self.persistent_cache_dir = persistent_cache_dir
+        self.persistent_cache_max_size = persistent_cache_max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compilations = 0
+        self.compile_seconds = 0.0
+        self.evaluation_seconds = 0.0
+        self._entries = OrderedDict()
+        self._persistent_cache_initialized = False
+
+    def get_function(self, key, kind, build):
+        entry_key = (key, kind)
+        if entry_key in self._entries:
+            self.hits += 1
+            self._entries.move_to_end(entry_key)
+            return self._entries[entry_key]
+
+        self.misses += 1
+        function = CompiledJaxFunction(build(), self)
+        self._entries[entry_key] = function
+        if self.maxsize is not None and len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return function
+
+    def initialize_persistent_cache(self, jax_config):
+        if self._persistent_cache_initialized:
+            return
+        self._persistent_cache_initialized = True
+        persistent_cache_dir = resolve_cache_dir(self.persistent_cache_dir, 'jax')
+        if persistent_cache_dir is not None and jax_config.jax_compilation_cache_dir is None:
+            os.makedirs(persistent_cache_dir, exist_ok=True)
+            jax_config.update('jax_compilation_cache_dir', persistent_cache_dir)
+            # the derivative functions compile quickly, cache them regardless of their compile time
+            jax_config.update('jax_persistent_cache_min_compile_time_secs', 0)
+            # JAX evicts the least recently used executables beyond this size (older versions keep all);
+            # the eviction needs filelock, without it JAX would not write any entry
+            if (self.persistent_cache_max_size is not None and hasattr(jax_config, 'jax_compilation_cache_max_size')
+                    and importlib.util.find_spec('filelock') is not None):
+                jax_config.update('jax_compilation_cache_max_size', self.persistent_cache_max_size)
+
+    def info(self):
+        return JaxCacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._entries),
+                            self.compilations, self.compile_seconds, self.evaluation_seconds)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compilations = 0
+        self.compile_seconds = 0.0
+        self.evaluation_seconds = 0.0
+
+    def __len__(self):
+        return len(self._entries)
@@ -0,0 +1,63 @@
+import SCRBenchmark.Constants.StringKeys as sk
+from SCRBenchmark.lazy import lazy_import
+
+sympy = lazy_import('sympy')
+
+
+def get_derivative_key(var):
+    # first-order derivatives are keyed by the variable name, second-order ones by the
+    # sorted pair of names, as mixed partials are shared by symmetry (Schwarz's theorem)
+    if isinstance(var, str):
+        return var
+    return tuple(sorted(var))
+
+
+def get_constraint_var(constraint, use_display_names=False):
+    if use_display_names:
+        return constraint[sk.EQUATION_CONSTRAINTS_VAR_DISPLAY_NAME_KEY]
+    return constraint[sk.EQUATION_CONSTRAINTS_VAR_NAME_KEY]
+
+
+def plan_derivatives(constraints, use_display_names=False):
+    """
+    Returns the derivative keys needed to check `constraints` in the order they have to be
+    computed. Every second-order derivative is built from one of its first-order derivatives,
+    preferring a variable whose first-order derivative is constrained itself.
+    """
+    first_order = []
+    second_order = []
+    for constraint in constraints:
+        key = get_derivative_key(get_constraint_var(constraint, use_display_names))
+        order = constraint[sk.EQUATION_CONSTRAINTS_ORDER_DERIVATIVE_KEY]
+        if order == 1 and key not in first_order:
+            first_order.append(key)
+        elif order == 2 and key not in second_order:
+            second_order.append(key)
+        elif order not in (1, 2):
+            raise ValueError(f'derivatives of order {order} are not supported')
+
+    stepping_stones = []
+    for (var1, var2) in second_order:
+        if var1 in first_order or var1 in stepping_stones or var2 in first_order or var2 in stepping_stones:
+            continue
+        stepping_stones.append(var1)
+    return first_order + stepping_stones + second_order
+
+
+def compute_derivative(derivatives, expr, local_dict, key):
+    """
+    Computes the derivative `key` of `expr` and stores it in `derivatives`, reusing
+    (and computing if necessary) the first-order derivative a second-order one builds on.
+    """
+    if key in derivatives:
+        return derivatives[key]
+    if isinstance(key, str):
+        derivative = sympy.Derivative(expr, local_dict[key]).doit()
+    else:
+        (var1, var2) = key
+        if var1 not in derivatives and var2 in derivatives:
+            (var1, var2) = (var2, var1)
+        f_prime = compute_derivative(derivatives, expr, local_dict, var1)
+        derivative = sympy.Derivative(f_prime, local_dict[var2]).doit()
+    derivatives[key] = derivative
+    return derivative
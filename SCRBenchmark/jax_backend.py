@@ -0,0 +1,107 @@
+import importlib.util
+
+import SCRBenchmark.base as base
+import SCRBenchmark.Constants.StringKeys as sk
+
+# optional backend of Benchmark.check_constraints(..., Library = "JAX"); this module can be imported without JAX,
+# JAX itself is only imported when a check runs
+INSTALL_HINT = 'install it with `pip install SCRBenchmark[jax]`'
+
+
+def is_available():
+    # capability probe: JAX is installed (without importing it, which initializes XLA)
+    return importlib.util.find_spec('jax') is not None
+
+
+def import_jax():
+    if not is_available():
+        raise ImportError(f'checking constraints with Library = "JAX" requires jax, {INSTALL_HINT}')
+    import jax
+    return jax
+
+
+def get_derivative_indices(constraints, var_names):
+    # (i,) for first order and (i, j) for second order derivatives of the constraints
+    derivative_indices = []
+    for constraint in constraints:
+        var_name_constraint = constraint[sk.EQUATION_CONSTRAINTS_VAR_NAME_KEY]
+        if constraint[sk.EQUATION_CONSTRAINTS_ORDER_DERIVATIVE_KEY] == 1:
+            derivative_indices.append((var_names.index(var_name_constraint),))
+        elif constraint[sk.EQUATION_CONSTRAINTS_ORDER_DERIVATIVE_KEY] == 2:
+            derivative_indices.append((var_names.index(var_name_constraint[0]), var_names.index(var_name_constraint[1])))
+        else:
+            raise ValueError('constraint was available but it was not handled/checked')
+    return tuple(derivative_indices)
+
+
+def check_constraints(benchmark, f, use_display_names=False, chunk_size=None, return_statistics=False, cache_key=None):
+    # Benchmark.check_constraints_JAX, `f` is a JAX-traceable function of the input vector x
+    constraints = [c for c in benchmark.constraints if c[sk.EQUATION_CONSTRAINTS_DESCRIPTOR_KEY] != sk.EQUATION_CONSTRAINTS_DESCRIPTOR_NO_CONSTRAINT]
+    if len(constraints) == 0:
+        return (True, [], {}) if return_statistics else (True, [])  # no constraints to check
+
+    jax = import_jax()
+    if benchmark.datasets is None:
+        benchmark.read_datasets_for_constraint_checking()
+
+    var_names = [v.name for v in benchmark.equation.get_vars()]
+
+    # the jitted functions are reused across checks of the same callable (or cache_key)
+    benchmark.jax_cache.initialize_persistent_cache(jax.config)
+    if cache_key is None:
+        cache_key = f
+
+    violated_constraints = []
+    statistics = {}
+    # constraints sharing a dataset are checked in one pass over it
+    for (xs, group) in benchmark.get_constraint_groups(constraints):
+        derivative_indices = get_derivative_indices(group, var_names)
+        derivatives = benchmark.jax_cache.get_function(cache_key, derivative_indices,
+                                                       lambda: jax.jit(jax.vmap(get_JAX_derivatives_function(f, derivative_indices, len(var_names)), out_axes=1)))
+        results = base.get_constraint_descriptors_chunked(lambda start, stop: derivatives(xs[start:stop]),
+                                                          len(xs),
+                                                          [c[sk.EQUATION_CONSTRAINTS_DESCRIPTOR_KEY] for c in group],
+                                                          chunk_size)
+
+        for (constraint, (descriptor, constraint_statistics)) in zip(group, results):
+            statistics[constraint[sk.EQUATION_CONSTRAINTS_ID_KEY]] = constraint_statistics
+            if descriptor != constraint[sk.EQUATION_CONSTRAINTS_DESCRIPTOR_KEY]:
+                violated_constraints.append(constraint)
+
+    if return_statistics:
+        return (len(violated_constraints) == 0, violated_constraints, statistics)
+    return (len(violated_constraints) == 0, violated_constraints)
+
+
+def get_JAX_derivatives_function(f, derivative_indices, num_vars):
+    # returns x -> [d f/d x_i or d^2 f/(d x_i d x_j) for every (i,) or (i, j) in derivative_indices]
+    # a second order derivative is the i-th entry of the Hessian-vector product with the one-hot tangent e_j
+    # (forward-over-reverse: jvp of the gradient), so only the Hessian columns that are needed are computed
+    # instead of the full Hessian; the gradient is the primal output of the same jvp
+    jax = import_jax()
+    grad_f = jax.grad(f)
+
+    # Hessians are symmetric, so one tangent serves every pair containing its index
+    tangents = []
+    for indices in derivative_indices:
+        if len(indices) == 2 and indices[0] not in tangents and indices[1] not in tangents:
+            tangents.append(indices[1])
+
+    def derivatives(x):
+        hessian_columns = {}
+        if len(tangents) == 0:
+            gradient = grad_f(x)
+        else:
+            for j in tangents:
+                (gradient, hessian_columns[j]) = jax.jvp(grad_f, (x,), (jax.numpy.zeros(num_vars, dtype=x.dtype).at[j].set(1),))
+
+        outputs = []
+        for indices in derivative_indices:
+            if len(indices) == 1:
+                outputs.append(gradient[indices[0]])
+            elif indices[1] in hessian_columns:
+                outputs.append(hessian_columns[indices[1]][indices[0]])
+            else:
+                outputs.append(hessian_columns[indices[0]][indices[1]])
+        return jax.numpy.stack(outputs)
+    return derivatives
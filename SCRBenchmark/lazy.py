@@ -0,0 +1,19 @@
+import importlib.util
+import sys
+
+
+def lazy_import(name):
+    # returns the module `name`, its code is executed on the first attribute access (importlib.util.LazyLoader),
+    # so importing a module that uses e.g. sympy only in some functions does not pay for importing sympy;
+    # a module that is already imported is returned as it is
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f'No module named {name!r}', name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
@@ -9,87 +9,260 @@
   }
 """
 
+import inspect
+import warnings
+
 import numpy as np
 
 from .registry import get_sampling_obj, register_sampling_class, register_sampling_func
 
 
+def get_seed_sequence(seed=None):
+    # without an explicit seed the entropy is drawn from the global np.random state,
+    # so seeding it with np.random.seed(...) still makes the sampling reproducible
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if seed is None:
+        seed = np.random.randint(0, 2**32, size=4, dtype=np.uint64)
+    return np.random.SeedSequence(seed)
+
+
+def get_random_generator(rng=None):
+    # accepts a numpy Generator (returned as is), a SeedSequence, an integer seed or None
+    if rng is None:
+        rng = get_seed_sequence()
+    return np.random.default_rng(rng)
+
+
+# unit designs in [0, 1)^d, transformed to the value ranges by the sampling classes' `ppf`
+UNIFORM_DESIGN = 'uniform'
+SOBOL_DESIGN = 'sobol'
+HALTON_DESIGN = 'halton'
+LATIN_HYPERCUBE_DESIGN = 'lhs'
+UNIT_DESIGNS = [UNIFORM_DESIGN, SOBOL_DESIGN, HALTON_DESIGN, LATIN_HYPERCUBE_DESIGN]
+
+
+def get_primes(count):
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % prime != 0 for prime in primes):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def halton_design(sample_size, num_dims, rng):
+    # randomized Halton sequence: random start index and a random shift (modulo 1) per dimension
+    indices = np.arange(1, sample_size + 1, dtype=np.int64) + rng.integers(0, 2**20)
+    design = np.empty((sample_size, num_dims))
+    for (dim, prime) in enumerate(get_primes(num_dims)):
+        remaining = indices.copy()
+        factor = 1.0
+        radical_inverse = np.zeros(sample_size)
+        while remaining.any():
+            factor /= prime
+            radical_inverse += factor * (remaining % prime)
+            remaining //= prime
+        design[:, dim] = radical_inverse
+    return (design + rng.uniform(size=num_dims)) % 1.0
+
+
+def sobol_design(sample_size, num_dims, rng):
+    try:
+        from scipy.stats import qmc
+    except ImportError:
+        raise ImportError('Sobol designs require scipy (pip install scipy)')
+    with warnings.catch_warnings():
+        # sample sizes that are no power of 2 lose some of the balance properties, which is fine here
+        warnings.simplefilter('ignore')
+        try:
+            engine = qmc.Sobol(num_dims, scramble=True, rng=rng)
+        except TypeError:
+            engine = qmc.Sobol(num_dims, scramble=True, seed=rng)
+        return engine.random(sample_size)
+
+
+def latin_hypercube_design(sample_size, num_dims, rng):
+    # one sample per stratum of width 1/sample_size in every dimension, strata randomly paired across dimensions
+    strata = rng.permuted(np.tile(np.arange(sample_size), (num_dims, 1)), axis=1).T
+    return (strata + rng.uniform(size=(sample_size, num_dims))) / sample_size
+
+
+def sample_unit_design(design, sample_size, num_dims, rng=None):
+    rng = get_random_generator(rng)
+    if design == UNIFORM_DESIGN:
+        return rng.uniform(size=(sample_size, num_dims))
+    elif design == SOBOL_DESIGN:
+        return sobol_design(sample_size, num_dims, rng)
+    elif design == HALTON_DESIGN:
+        return halton_design(sample_size, num_dims, rng)
+    elif design == LATIN_HYPERCUBE_DESIGN:
+        return latin_hypercube_design(sample_size, num_dims, rng)
+    raise ValueError(f'`{design}` is not a supported design, use one of {UNIT_DESIGNS}')
+
+
+def transform_unit_samples(unit_samples, min_value, max_value, uses_positive, uses_negative, log_scale):
+    # inverse CDF of the sampling distributions: magnitudes are (log-)uniform in [min_value, max_value],
+    # with both signs the lower half of [0, 1) is mapped to the negative and the upper half to the positive values.
+    # the mapping is monotonic, so intervals of unit samples map to intervals of values (see get_unit_interval)
+    if uses_positive and uses_negative:
+        negative = unit_samples < 0.5
+        unit_samples = np.where(negative, 1 - 2 * unit_samples, 2 * unit_samples - 1)
+    elif uses_negative:
+        unit_samples = 1 - unit_samples
+    if log_scale:
+        log10_min = np.log10(min_value)
+        log10_max = np.log10(max_value)
+        magnitudes = 10.0 ** (log10_min + unit_samples * (log10_max - log10_min))
+    else:
+        magnitudes = min_value + unit_samples * (max_value - min_value)
+    if uses_positive and uses_negative:
+        return np.where(negative, -magnitudes, magnitudes)
+    elif uses_positive:
+        return magnitudes
+    elif uses_negative:
+        return -magnitudes
+    raise AttributeError(f'Either uses_positive ({uses_positive}) or '
+                         f'uses_negative({uses_negative}) must be True')
+
+
+def get_value_probabilities(values, min_value, max_value, uses_positive, uses_negative, log_scale):
+    # CDF P(X < values) of the distributions of transform_unit_samples
+    values = np.asarray(values, dtype=float)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        magnitudes = np.abs(values)
+        if log_scale:
+            below = (np.log(magnitudes) - np.log(min_value)) / (np.log(max_value) - np.log(min_value))
+        else:
+            below = (magnitudes - min_value) / (max_value - min_value)
+    # P(M < |values|) of the magnitudes M
+    below = np.clip(np.nan_to_num(below, nan=0.0), 0.0, 1.0)
+    if uses_positive and uses_negative:
+        return np.where(values > 0, 0.5 + 0.5 * below, 0.5 * (1 - below))
+    elif uses_positive:
+        return np.where(values > 0, below, 0.0)
+    elif uses_negative:
+        return np.where(values > 0, 1.0, 1 - below)
+    raise AttributeError(f'Either uses_positive ({uses_positive}) or '
+                         f'uses_negative({uses_negative}) must be True')
+
+
+def get_unit_interval(sampling_obj, low, high):
+    # interval of unit samples [P(X < low), P(X <= high)] mapped to values in [low, high] by the sampler's ppf
+    return (sampling_obj.cdf(low), sampling_obj.cdf(high, inclusive=True))
+
+
+class ValidityBound(object):
+    """
+    Declares the values of variable `var_index` that give valid equation outputs, as
+    lower(x) <= x[var_index] <= upper(x), or for the absolute value if `magnitude` is set.
+    `lower` and `upper` are functions of the list of input columns x, None is unbounded.
+    Bounds may only depend on variables without a bound of their own, see `SamplingPlan`.
+    """
+
+    def __init__(self, var_index, lower=None, upper=None, magnitude=False):
+        self.var_index = var_index
+        self.lower = lower
+        self.upper = upper
+        self.magnitude = magnitude
+
+    def get_bounds(self, xs, sample_size):
+        lows = np.full(sample_size, 0.0 if self.magnitude else -np.inf)
+        highs = np.full(sample_size, np.inf)
+        if self.lower is not None:
+            lows = np.broadcast_to(self.lower(xs), (sample_size,))
+        if self.upper is not None:
+            highs = np.broadcast_to(self.upper(xs), (sample_size,))
+        return (lows, highs)
+
+
 @register_sampling_func
-def default_sampling(sample_size, min_value=1.0e-1, max_value=1.0e1):
+def default_sampling(sample_size, min_value=1.0e-1, max_value=1.0e1, rng=None):
     # x ~ either U(0.1, 10.0) or U(-10.0, -0.1) with 50% chance
-    num_positives = sum(np.random.uniform(0.0, 1.0, size=sample_size) > 0.5)
+    rng = get_random_generator(rng)
+    num_positives = np.count_nonzero(rng.uniform(0.0, 1.0, size=sample_size) > 0.5)
     num_negatives = sample_size - num_positives
     log10_min = np.log10(min_value)
     log10_max = np.log10(max_value)
-    pos_samples = 10.0 ** np.random.uniform(log10_min, log10_max, size=num_positives)
-    neg_samples = -10.0 ** np.random.uniform(log10_min, log10_max, size=num_negatives)
+    pos_samples = 10.0 ** rng.uniform(log10_min, log10_max, size=num_positives)
+    neg_samples = -10.0 ** rng.uniform(log10_min, log10_max, size=num_negatives)
     all_samples = np.concatenate([pos_samples, neg_samples])
-    np.random.shuffle(all_samples)
+    rng.shuffle(all_samples)
     return all_samples
 
 
 @register_sampling_func
-def default_positive_sampling(sample_size, min_value=1.0e-1, max_value=1.0e1):
+def default_positive_sampling(sample_size, min_value=1.0e-1, max_value=1.0e1, rng=None):
     # x ~ U(0.1, 10.0)
+    rng = get_random_generator(rng)
     log10_min = np.log10(min_value)
     log10_max = np.log10(max_value)
-    return 10.0 ** np.random.uniform(log10_min, log10_max, size=sample_size)
+    return 10.0 ** rng.uniform(log10_min, log10_max, size=sample_size)
 
 
 @register_sampling_func
-def default_negative_sampling(sample_size, min_value=-1.0e1, max_value=-1.0e-1):
+def default_negative_sampling(sample_size, min_value=-1.0e1, max_value=-1.0e-1, rng=None):
     # x ~ U(-10.0, -0.1)
+    rng = get_random_generator(rng)
     log10_min = -np.log10(abs(min_value))
     log10_max = -np.log10(abs(max_value))
-    return -10.0 ** np.random.uniform(log10_min, log10_max, size=sample_size)
+    # the bounds are swapped if given as positive magnitudes; Generator.uniform requires low <= high
+    return -10.0 ** rng.uniform(min(log10_min, log10_max), max(log10_min, log10_max), size=sample_size)
 
 
 @register_sampling_func
-def simple_sampling(sample_size, min_value=0.0, max_value=1.0):
+def simple_sampling(sample_size, min_value=0.0, max_value=1.0, rng=None):
     # x ~ either U(0.0, 1.0) or U(-1.0, 0.) with 50% chance
-    num_positives = sum(np.random.uniform(0.0, 1.0, size=sample_size) > 0.5)
+    rng = get_random_generator(rng)
+    num_positives = np.count_nonzero(rng.uniform(0.0, 1.0, size=sample_size) > 0.5)
     num_negatives = sample_size - num_positives
-    pos_samples = np.random.uniform(min_value, max_value, size=num_positives)
-    neg_samples = -np.random.uniform(min_value, max_value, size=num_negatives)
+    pos_samples = rng.uniform(min_value, max_value, size=num_positives)
+    neg_samples = -rng.uniform(min_value, max_value, size=num_negatives)
     all_samples = np.concatenate([pos_samples, neg_samples])
-    np.random.shuffle(all_samples)
+    rng.shuffle(all_samples)
     return all_samples
 
 
 @register_sampling_func
-def simple_positive_sampling(sample_size, min_value=0.0, max_value=1.0):
+def simple_positive_sampling(sample_size, min_value=0.0, max_value=1.0, rng=None):
     # x ~ U(0.0, 1.0)
-    return np.random.uniform(min_value, max_value, size=sample_size)
+    rng = get_random_generator(rng)
+    return rng.uniform(min_value, max_value, size=sample_size)
 
 
 @register_sampling_func
-def simple_negative_sampling(sample_size, min_value=-1.0, max_value=0.0):
+def simple_negative_sampling(sample_size, min_value=-1.0, max_value=0.0, rng=None):
     # x ~ U(-1, 0.0)
-    return -np.random.uniform(min_value, max_value, size=sample_size)
+    rng = get_random_generator(rng)
+    return -rng.uniform(min_value, max_value, size=sample_size)
 
 
 @register_sampling_func
-def integer_sampling(sample_size, min_value=1, max_value=100):
+def integer_sampling(sample_size, min_value=1, max_value=100, rng=None):
     # x ~ either U(1, 100) or U(-100, -1) with 50% chance
-    num_positives = sum(np.random.uniform(0.0, 1.0, size=sample_size) > 0.5)
+    rng = get_random_generator(rng)
+    num_positives = np.count_nonzero(rng.uniform(0.0, 1.0, size=sample_size) > 0.5)
     num_negatives = sample_size - num_positives
-    pos_samples = np.random.randint(min_value, max_value, size=num_positives)
-    neg_samples = -np.random.randint(min_value, max_value, size=num_negatives)
+    pos_samples = rng.integers(min_value, max_value, size=num_positives)
+    neg_samples = -rng.integers(min_value, max_value, size=num_negatives)
     all_samples = np.concatenate([pos_samples, neg_samples])
-    np.random.shuffle(all_samples)
+    rng.shuffle(all_samples)
     return all_samples
 
 
 @register_sampling_func
-def integer_positive_sampling(sample_size, min_value=1, max_value=100):
+def integer_positive_sampling(sample_size, min_value=1, max_value=100, rng=None):
     # x ~ U(1, 100)
-    return np.random.randint(min_value, max_value, size=sample_size)
+    rng = get_random_generator(rng)
+    return rng.integers(min_value, max_value, size=sample_size)
 
 
 @register_sampling_func
-def integer_negative_sampling(sample_size, min_value=-100, max_value=-1):
+def integer_negative_sampling(sample_size, min_value=-100, max_value=-1, rng=None):
     # x ~ U(-100, -1)
-    return -np.random.randint(min_value, max_value, size=sample_size)
+    rng = get_random_generator(rng)
+    return -rng.integers(min_value, max_value, size=sample_size)
     
 
 @register_sampling_class
@@ -101,16 +274,35 @@ class DefaultSampling(object):
         self.uses_positive = uses_positive
         self.uses_negative = uses_negative
     
-    def __call__(self, sample_size):
+    def __call__(self, sample_size, rng=None):
         if self.uses_positive and self.uses_negative:
-            return default_sampling(sample_size, self.min_value, self.max_value)
+            return default_sampling(sample_size, self.min_value, self.max_value, rng)
         elif self.uses_positive:
-            return default_positive_sampling(sample_size, self.min_value, self.max_value)
+            return default_positive_sampling(sample_size, self.min_value, self.max_value, rng)
         elif self.uses_negative:
-            return default_negative_sampling(sample_size, self.min_value, self.max_value)
+            return default_negative_sampling(sample_size, self.min_value, self.max_value, rng)
         raise AttributeError(f'Either self.uses_positive ({self.uses_positive}) or '
                              f'self.uses_negative({self.uses_negative}) must be True')
     
+    def get_magnitude_range(self):
+        # default_negative_sampling negates the log10 bounds, so negative only columns draw their magnitudes
+        # from [1 / max_value, 1 / min_value]; the vectorized SamplingPlan and the ppf follow the callable
+        if self.uses_negative and not self.uses_positive:
+            return (1.0 / self.max_value, 1.0 / self.min_value)
+        return (self.min_value, self.max_value)
+
+    def ppf(self, unit_samples):
+        (min_value, max_value) = self.get_magnitude_range()
+        return transform_unit_samples(unit_samples, min_value, max_value, self.uses_positive, self.uses_negative, log_scale=True)
+
+    def cdf(self, values, inclusive=False):
+        (min_value, max_value) = self.get_magnitude_range()
+        return get_value_probabilities(values, min_value, max_value, self.uses_positive, self.uses_negative, log_scale=True)
+
+    def get_uniform_parameters(self):
+        # (min_value, max_value, uses_positive, uses_negative, log_scale, integer), see SamplingPlan
+        return self.get_magnitude_range() + (self.uses_positive, self.uses_negative, True, False)
+
     def get_value_range(self):
         if self.uses_positive and self.uses_negative:
             return (-self.max_value, self.max_value)
@@ -135,16 +327,25 @@ class SimpleSampling(object):
         self.uses_positive = uses_positive
         self.uses_negative = uses_negative
     
-    def __call__(self, sample_size):
+    def __call__(self, sample_size, rng=None):
         if self.uses_positive and self.uses_negative:
-            return simple_sampling(sample_size, self.min_value, self.max_value)
+            return simple_sampling(sample_size, self.min_value, self.max_value, rng)
         elif self.uses_positive:
-            return simple_positive_sampling(sample_size, self.min_value, self.max_value)
+            return simple_positive_sampling(sample_size, self.min_value, self.max_value, rng)
         elif self.uses_negative:
-            return simple_negative_sampling(sample_size, self.min_value, self.max_value)
+            return simple_negative_sampling(sample_size, self.min_value, self.max_value, rng)
         raise AttributeError(f'Either self.uses_positive ({self.uses_positive}) or '
                              f'self.uses_negative({self.uses_negative}) must be True')
 
+    def ppf(self, unit_samples):
+        return transform_unit_samples(unit_samples, self.min_value, self.max_value, self.uses_positive, self.uses_negative, log_scale=False)
+
+    def cdf(self, values, inclusive=False):
+        return get_value_probabilities(values, self.min_value, self.max_value, self.uses_positive, self.uses_negative, log_scale=False)
+
+    def get_uniform_parameters(self):
+        return (self.min_value, self.max_value, self.uses_positive, self.uses_negative, False, False)
+
     def get_value_range(self):
         if self.uses_positive and self.uses_negative:
             return (-self.max_value, self.max_value)
@@ -167,16 +368,40 @@ class IntegerSampling(object):
         self.uses_positive = uses_positive
         self.uses_negative = uses_negative
     
-    def __call__(self, sample_size):
+    def __call__(self, sample_size, rng=None):
         if self.uses_positive and self.uses_negative:
-            return integer_sampling(sample_size, self.min_value, self.max_value)
+            return integer_sampling(sample_size, self.min_value, self.max_value, rng)
         elif self.uses_positive:
-            return integer_positive_sampling(sample_size, self.min_value, self.max_value)
+            return integer_positive_sampling(sample_size, self.min_value, self.max_value, rng)
         elif self.uses_negative:
-            return integer_negative_sampling(sample_size, self.min_value, self.max_value)
+            return integer_negative_sampling(sample_size, self.min_value, self.max_value, rng)
         raise AttributeError(f'Either self.uses_positive ({self.uses_positive}) or '
                              f'self.uses_negative({self.uses_negative}) must be True')
 
+    def get_value_table(self):
+        # sorted values and their cumulative probabilities: integer_sampling draws from [min_value, max_value),
+        # negated with probability 1/2 if both signs are used
+        integers = np.arange(self.min_value, self.max_value)
+        weight = 0.5 if self.uses_positive and self.uses_negative else 1.0
+        values = np.concatenate([integers if self.uses_positive else [], -integers if self.uses_negative else []])
+        (values, inverse) = np.unique(values, return_inverse=True)
+        probabilities = np.bincount(inverse, minlength=len(values)) * weight / len(integers)
+        return (values, np.cumsum(probabilities))
+
+    def ppf(self, unit_samples):
+        (values, cumulative) = self.get_value_table()
+        indices = np.searchsorted(cumulative, unit_samples, side='right')
+        return values[np.minimum(indices, len(values) - 1)].astype(int)
+
+    def cdf(self, values, inclusive=False):
+        # P(X < values), or P(X <= values) if inclusive
+        (table, cumulative) = self.get_value_table()
+        indices = np.searchsorted(table, values, side='right' if inclusive else 'left')
+        return np.concatenate([[0.0], cumulative])[indices]
+
+    def get_uniform_parameters(self):
+        return (self.min_value, self.max_value, self.uses_positive, self.uses_negative, False, True)
+
     def get_value_range(self):
         if self.uses_positive and self.uses_negative:
             return (-self.max_value, self.max_value)
@@ -190,6 +415,197 @@ class IntegerSampling(object):
     def to_uniform_sampling(self):
         return self
 
+class DesignSampling(object):
+    """
+    Samples (log-)uniformly distributed values from a space-filling design, see the subclasses.
+    Called on its own, a column is stratified in one dimension; for one joint design over several
+    variables, map the columns of `sample_unit_design(design, sample_size, num_vars)` through their `ppf`.
+    """
+    design = None
+
+    def __init__(self, min_value, max_value, uses_positive=True, uses_negative=True, log_scale=False):
+        self.min_value = min_value
+        self.max_value = max_value
+        assert uses_positive or uses_negative
+        self.uses_positive = uses_positive
+        self.uses_negative = uses_negative
+        self.log_scale = log_scale
+
+    def __call__(self, sample_size, rng=None):
+        return self.ppf(sample_unit_design(self.design, sample_size, 1, rng)[:, 0])
+
+    def ppf(self, unit_samples):
+        return transform_unit_samples(unit_samples, self.min_value, self.max_value, self.uses_positive, self.uses_negative, self.log_scale)
+
+    def cdf(self, values, inclusive=False):
+        return get_value_probabilities(values, self.min_value, self.max_value, self.uses_positive, self.uses_negative, self.log_scale)
+
+    def get_value_range(self):
+        if self.uses_positive and self.uses_negative:
+            return (-self.max_value, self.max_value)
+        elif self.uses_positive:
+            return (self.min_value, self.max_value)
+        elif self.uses_negative:
+            return (-self.max_value, -self.min_value)
+        raise AttributeError(f'Either self.uses_positive ({self.uses_positive}) or '
+                             f'self.uses_negative({self.uses_negative}) must be True')
+
+    def to_uniform_sampling(self):
+        return self.__class__(self.min_value, self.max_value, self.uses_positive, self.uses_negative, log_scale=False)
+
+
+@register_sampling_class
+class SobolSampling(DesignSampling):
+    # scrambled Sobol sequence, requires scipy
+    design = SOBOL_DESIGN
+
+
+@register_sampling_class
+class HaltonSampling(DesignSampling):
+    # randomized Halton sequence
+    design = HALTON_DESIGN
+
+
+@register_sampling_class
+class LatinHypercubeSampling(DesignSampling):
+    design = LATIN_HYPERCUBE_DESIGN
+
+
+# number of rows and seed of the draw estimating the largest valid probability of bounded variables
+VALIDITY_MASS_PROBE_SIZE = 65_536
+VALIDITY_MASS_PROBE_SEED = 0
+
+
+class SamplingPlan(object):
+    """
+    Draws the (sample_size, num_vars) input matrix of an equation's `sampling_objs` at once.
+    Columns of the uniform sampling classes (those with `get_uniform_parameters`) are sampled in one
+    vectorized pass: magnitudes from a single (n, d) uniform draw scaled per column (in log space for
+    log-uniform columns), random signs applied by multiplication instead of concatenating and shuffling.
+    Any other sampling object (e.g. a custom callable) is still called per column.
+    The matrix is column-major, so its columns are contiguous.
+    With a `validity_domain` (list of `ValidityBound`), every bounded variable is drawn afterwards from its
+    distribution truncated to the valid values given the other variables of the row (conditional sampling).
+    A row is kept with probability P(valid | other variables) / max P(valid | other variables), the other
+    rows get a NaN and are discarded by the rejection sampling, so the accepted rows follow the same joint
+    distribution as plain rejection sampling; only the rejections due to the largest valid probability
+    below one are avoided. Bounds on variables whose sampler has no `cdf` are ignored.
+    """
+
+    def __init__(self, sampling_objs, validity_domain=None):
+        self.sampling_objs = list(sampling_objs)
+        self.validity_domain = [bound for bound in (validity_domain or [])
+                                if hasattr(self.sampling_objs[bound.var_index], 'cdf')]
+        self.num_vars = len(self.sampling_objs)
+        parameters = [sampling_obj.get_uniform_parameters() if hasattr(sampling_obj, 'get_uniform_parameters') else None
+                      for sampling_obj in self.sampling_objs]
+        self.vectorized_columns = np.array([i for (i, parameter) in enumerate(parameters) if parameter is not None], dtype=int)
+        self.fallback_columns = [i for (i, parameter) in enumerate(parameters) if parameter is None]
+        vectorized = [parameters[i] for i in self.vectorized_columns]
+
+        log_scale = np.array([log for (_, _, _, _, log, _) in vectorized], dtype=bool)
+        min_values = np.array([min_value for (min_value, _, _, _, _, _) in vectorized], dtype=float)
+        max_values = np.array([max_value for (_, max_value, _, _, _, _) in vectorized], dtype=float)
+        # log-uniform columns are sampled uniformly in natural log space and exponentiated
+        self.lows = np.where(log_scale, np.log(np.where(log_scale, min_values, 1.0)), min_values)
+        self.widths = np.where(log_scale, np.log(np.where(log_scale, max_values, 1.0)), max_values) - self.lows
+        self.log_columns = np.flatnonzero(log_scale)
+        self.integer_columns = np.flatnonzero([integer for (_, _, _, _, _, integer) in vectorized])
+        # columns sampling both signs use the upper half of their uniform draw for the sign: the draw is doubled,
+        # values >= 1 are positive (and reduced by one), the others negative. the other columns have a fixed sign
+        random_signs = np.array([positive and negative for (_, _, positive, negative, _, _) in vectorized], dtype=bool)
+        self.unit_scales = np.where(random_signs, 2.0, 1.0)
+        self.negative_signs = np.array([-1.0 if negative else 1.0 for (_, _, _, negative, _, _) in vectorized])
+        self.fallback_uses_rng = {i: accepts_rng(self.sampling_objs[i]) for i in self.fallback_columns}
+        self._max_valid_masses = None
+
+    def __call__(self, sample_size, rng=None, dtype=np.float64):
+        # dtype=np.float32 samples and returns single precision columns (fallback columns are cast)
+        rng = get_random_generator(rng)
+        samples = self.sample_unbounded(sample_size, rng, dtype)
+        if len(self.validity_domain) > 0:
+            for (bound, max_valid_mass) in zip(self.validity_domain, self.get_max_valid_masses()):
+                samples[:, bound.var_index] = self.sample_within_bound(samples, bound, max_valid_mass, rng)
+        return samples
+
+    def sample_unbounded(self, sample_size, rng, dtype=np.float64):
+        if len(self.fallback_columns) == 0:
+            samples = self.sample_vectorized_columns(sample_size, rng, dtype)
+        else:
+            samples = np.empty((sample_size, self.num_vars), dtype=dtype, order='F')
+            if len(self.vectorized_columns) > 0:
+                samples[:, self.vectorized_columns] = self.sample_vectorized_columns(sample_size, rng, dtype)
+            for i in self.fallback_columns:
+                sampling_obj = self.sampling_objs[i]
+                samples[:, i] = sampling_obj(sample_size, rng=rng) if self.fallback_uses_rng[i] else sampling_obj(sample_size)
+        return samples
+
+    def get_max_valid_masses(self):
+        # largest probability of a valid value of every bounded variable, estimated once on a fixed probe draw
+        # (independent of the sampled rows, so datasets do not depend on the size of the draws)
+        if self._max_valid_masses is None:
+            probe = self.sample_unbounded(VALIDITY_MASS_PROBE_SIZE, np.random.default_rng(VALIDITY_MASS_PROBE_SEED))
+            self._max_valid_masses = [float(np.max(self.get_valid_intervals(probe, bound)[2], initial=0.0))
+                                      for bound in self.validity_domain]
+        return self._max_valid_masses
+
+    def get_valid_intervals(self, samples, bound):
+        # unit intervals of the valid values of the bounded variable, their masses and the total mass per row
+        sample_size = len(samples)
+        sampling_obj = self.sampling_objs[bound.var_index]
+        (lows, highs) = bound.get_bounds([samples[:, i] for i in range(self.num_vars)], sample_size)
+        if bound.magnitude:
+            # [-high, -low] and [low, high], the value 0 belongs to the second interval only
+            negative_interval = (sampling_obj.cdf(-highs), np.where(lows > 0, sampling_obj.cdf(-lows, inclusive=True), sampling_obj.cdf(-lows)))
+            intervals = [negative_interval, get_unit_interval(sampling_obj, lows, highs)]
+        else:
+            intervals = [get_unit_interval(sampling_obj, lows, highs)]
+        masses = [np.maximum(upper - lower, 0.0) for (lower, upper) in intervals]
+        return (intervals, masses, sum(masses))
+
+    def sample_within_bound(self, samples, bound, max_valid_mass, rng):
+        sample_size = len(samples)
+        sampling_obj = self.sampling_objs[bound.var_index]
+        (intervals, masses, total_mass) = self.get_valid_intervals(samples, bound)
+        # rows are kept with probability total_mass / max_valid_mass (at most one for masses above the estimate)
+        accepted = rng.random(sample_size) * max_valid_mass < total_mass
+
+        # a uniform draw over the union of the unit intervals, mapped to values by the sampler's ppf
+        unit_samples = rng.random(sample_size) * total_mass
+        if len(intervals) == 1:
+            unit_samples = intervals[0][0] + unit_samples
+        else:
+            unit_samples = np.where(unit_samples < masses[0], intervals[0][0] + unit_samples,
+                                    intervals[1][0] + (unit_samples - masses[0]))
+        values = sampling_obj.ppf(np.clip(unit_samples, 0.0, np.nextafter(1.0, 0.0)))
+        return np.where(accepted, values, np.nan)
+
+    def sample_vectorized_columns(self, sample_size, rng, dtype=np.float64):
+        # (d, n) draws transposed, so every column of the result is contiguous
+        values = rng.random((len(self.vectorized_columns), sample_size), dtype=dtype).T
+        values *= self.unit_scales.astype(dtype, copy=False)
+        positive = values >= 1.0
+        values -= positive
+        signs = np.where(positive, 1.0, self.negative_signs).astype(dtype, copy=False)
+        values *= self.widths.astype(dtype, copy=False)
+        values += self.lows.astype(dtype, copy=False)
+        for column in self.log_columns:
+            np.exp(values[:, column], out=values[:, column])
+        # integers in [min_value, max_value) like integer_sampling, floor (not trunc) for negative min_values
+        for column in self.integer_columns:
+            np.floor(values[:, column], out=values[:, column])
+        values *= signs
+        return values
+
+
+def accepts_rng(sampling_obj):
+    try:
+        parameters = inspect.signature(sampling_obj).parameters.values()
+    except (TypeError, ValueError):
+        return False
+    return any(parameter.name == 'rng' or parameter.kind == inspect.Parameter.VAR_KEYWORD for parameter in parameters)
+
+
 def build_sampling_objs(sampling_obj_configs):
     sampling_obj_list = list()
     for sampling_obj_config in sampling_obj_configs:
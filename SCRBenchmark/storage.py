@@ -0,0 +1,201 @@
+import hashlib
+import importlib.util
+import json
+import os
+import tempfile
+import warnings
+
+import numpy as np
+
+from SCRBenchmark.lazy import lazy_import
+
+pd = lazy_import('pandas')
+
+# file formats of generated datasets; csv is the default and the fallback if a format is not available
+DATASET_FORMATS = ['csv', 'npz', 'npy', 'parquet', 'feather']
+DEFAULT_DATASET_FORMAT = 'csv'
+FILE_EXTENSIONS = {format: f'.{format}' for format in DATASET_FORMATS}
+# formats written and read through pyarrow
+ARROW_FORMATS = ['parquet', 'feather']
+# the split column of combined datasets is stored as one byte code (index into SPLITS) in npz and npy files
+SPLIT_COLUMN = 'split'
+SPLITS = ['training', 'test']
+
+
+def is_format_available(format):
+    if format in ARROW_FORMATS:
+        return importlib.util.find_spec('pyarrow') is not None
+    return format in DATASET_FORMATS
+
+
+def resolve_format(format):
+    if format not in DATASET_FORMATS:
+        raise ValueError(f'`{format}` is not a supported dataset format, use one of {DATASET_FORMATS}')
+    if not is_format_available(format):
+        warnings.warn(f'the {format} format requires pyarrow, falling back to {DEFAULT_DATASET_FORMAT}')
+        return DEFAULT_DATASET_FORMAT
+    return format
+
+
+def get_file_format(file):
+    extension = os.path.splitext(file)[1]
+    for (format, format_extension) in FILE_EXTENSIONS.items():
+        if extension == format_extension:
+            return format
+    raise ValueError(f'cannot infer the dataset format of `{file}`')
+
+
+def to_column_array(series):
+    # the split is stored as code into SPLITS, other string columns as fixed width unicode, so no pickling is needed
+    values = series.to_numpy()
+    if str(series.name) == SPLIT_COLUMN:
+        codes = pd.Categorical(values, categories=SPLITS).codes
+        if (codes >= 0).all():
+            return codes.astype(np.uint8)
+    if values.dtype == object:
+        return values.astype(str)
+    return values
+
+
+def from_column_array(name, values):
+    if name == SPLIT_COLUMN and values.dtype == np.uint8:
+        return np.asarray(SPLITS, dtype=object)[values]
+    return values
+
+
+def write_atomically(file, format, write):
+    # `write(temporary_file)` writes to a temporary file that is renamed to `file` afterwards,
+    # so an interrupted write never leaves a truncated dataset behind
+    (handle, temporary_file) = tempfile.mkstemp(dir=os.path.dirname(file) or '.', suffix=f'{FILE_EXTENSIONS.get(format, "")}.tmp')
+    os.close(handle)
+    try:
+        write(temporary_file)
+        os.replace(temporary_file, file)
+    except BaseException:
+        os.remove(temporary_file)
+        raise
+
+
+def write_dataframe(df, file, format=None):
+    format = get_file_format(file) if format is None else format
+    write_atomically(file, format, lambda temporary_file: write_dataframe_to(df, temporary_file, format))
+
+
+def write_dataframe_to(df, file, format):
+    # all binary formats store float64 columns bit-exact; csv writes the shortest repr that round-trips
+    if format == 'csv':
+        df.to_csv(file, index=False)
+    elif format == 'npz':
+        columns = {f'column{i}': to_column_array(df[column]) for (i, column) in enumerate(df.columns)}
+        with open(file, 'wb') as handle:
+            np.savez(handle, columns=np.asarray([str(column) for column in df.columns]), **columns)
+    elif format == 'npy':
+        records = np.rec.fromarrays([to_column_array(df[column]) for column in df.columns],
+                                    names=[str(column) for column in df.columns])
+        with open(file, 'wb') as handle:
+            np.save(handle, np.asarray(records))
+    elif format == 'parquet':
+        df.rename(columns=str).to_parquet(file, index=False)
+    elif format == 'feather':
+        df.rename(columns=str).reset_index(drop=True).to_feather(file)
+    else:
+        raise ValueError(f'`{format}` is not a supported dataset format, use one of {DATASET_FORMATS}')
+
+
+def write_dataset_blocks(blocks, file, columns, num_rows, format=None):
+    # appends the float64 row blocks (e.g. of Benchmark.iter_training_dataset_blocks) to `file` one after the
+    # other, so only one block is held in memory; the result is read like a dataset written by write_dataframe
+    format = get_file_format(file) if format is None else format
+    if format == 'npz':
+        raise ValueError('the npz format stores whole columns and cannot be written block by block')
+    if format in ARROW_FORMATS and not is_format_available(format):
+        raise ImportError(f'the {format} format requires pyarrow')
+    columns = [str(column) for column in columns]
+
+    def write(temporary_file):
+        rows = 0
+        if format == 'csv':
+            with open(temporary_file, 'w', newline='') as handle:
+                for block in blocks:
+                    pd.DataFrame(block, columns=columns, copy=False).to_csv(handle, header=(rows == 0), index=False)
+                    rows += len(block)
+        elif format == 'npy':
+            dtype = np.dtype([(column, np.float64) for column in columns])
+            with open(temporary_file, 'wb') as handle:
+                np.lib.format.write_array_header_1_0(handle, {'descr': np.lib.format.dtype_to_descr(dtype),
+                                                              'fortran_order': False,
+                                                              'shape': (num_rows,)})
+                for block in blocks:
+                    records = np.empty(len(block), dtype=dtype)
+                    for (i, column) in enumerate(columns):
+                        records[column] = block[:, i]
+                    handle.write(records.tobytes())
+                    rows += len(block)
+        else:
+            import pyarrow
+            import pyarrow.parquet
+            schema = pyarrow.schema([(column, pyarrow.float64()) for column in columns])
+            writer = (pyarrow.parquet.ParquetWriter(temporary_file, schema) if format == 'parquet'
+                      else pyarrow.ipc.new_file(temporary_file, schema))
+            with writer:
+                for block in blocks:
+                    writer.write_table(pyarrow.Table.from_arrays([block[:, i] for i in range(len(columns))], schema=schema))
+                    rows += len(block)
+        if rows != num_rows:
+            raise ValueError(f'expected {num_rows} rows but the blocks contained {rows}')
+
+    write_atomically(file, format, write)
+
+
+def read_dataframe(file, format=None):
+    format = get_file_format(file) if format is None else format
+    if format == 'csv':
+        return pd.read_csv(file, float_precision='round_trip')
+    elif format == 'npz':
+        with np.load(file) as arrays:
+            columns = [str(column) for column in arrays['columns']]
+            return pd.DataFrame({column: from_column_array(column, arrays[f'column{i}']) for (i, column) in enumerate(columns)})
+    elif format == 'npy':
+        records = np.load(file)
+        return pd.DataFrame({column: from_column_array(column, records[column]) for column in records.dtype.names})
+    elif format == 'parquet':
+        return pd.read_parquet(file)
+    elif format == 'feather':
+        return pd.read_feather(file)
+    raise ValueError(f'`{format}` is not a supported dataset format, use one of {DATASET_FORMATS}')
+
+
+def get_file_sha256(file):
+    sha256 = hashlib.sha256()
+    with open(file, 'rb') as handle:
+        for block in iter(lambda: handle.read(1 << 20), b''):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def read_manifest(file):
+    # the manifest is a JSON lines file with one entry per completed dataset; a line
+    # truncated by an interrupted append is ignored, later entries replace earlier ones
+    entries = []
+    if not os.path.exists(file):
+        return entries
+    with open(file, 'r') as handle:
+        for line in handle:
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return entries
+
+
+def append_manifest_entry(file, entry):
+    line = (json.dumps(entry) + '\n').encode()
+    with open(file, 'a+b') as handle:
+        # terminate a line truncated by an interrupted append first
+        if handle.seek(0, os.SEEK_END) > 0:
+            handle.seek(-1, os.SEEK_END)
+            if handle.read(1) != b'\n':
+                line = b'\n' + line
+        handle.write(line)
+        handle.flush()
+        os.fsync(handle.fileno())
@@ -1,14 +1,28 @@
 from .benchmark import Benchmark
 from .SRSDFeynman import AllEquations
-import pandas as pd
 import os
-import SCRBenchmark.Constants.StringKeys as sk
+import traceback
+import warnings
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from .seeds import SEEDS
+from .storage import DEFAULT_DATASET_FORMAT, FILE_EXTENSIONS, read_dataframe, resolve_format, write_dataframe
+from .storage import append_manifest_entry, get_file_sha256, read_manifest
+from SCRBenchmark import __version__
+from SCRBenchmark.lazy import lazy_import
+
+pd = lazy_import('pandas')
 
 SAMPLING_PATIENCE = 10
 HARD_SAMPLE_SIZES = [100,1000]
 HARD_NOISE_LEVELS = [0,0.05,0.1,0.15,0.2]
 
+COMBINED_LAYOUT = 'combined'
+SHARED_TEST_LAYOUT = 'shared_test'
+SUITE_LAYOUTS = [COMBINED_LAYOUT, SHARED_TEST_LAYOUT]
+DEFAULT_SUITE_LAYOUT = COMBINED_LAYOUT
+MANIFEST_FILE_NAME = 'manifest.jsonl'
+
 FEYNMAN_SRSD_HARD = [
 'FeynmanICh6Eq20a'
 ,'FeynmanICh6Eq20'
@@ -62,6 +76,62 @@ FEYNMAN_SRSD_HARD = [
 ,'FeynmanBonus20'
 ]
 
+DatasetJob = namedtuple('DatasetJob', ['equation_name', 'sample_size', 'noise_level', 'repetition', 'seed'])
+DatasetJobResult = namedtuple('DatasetJobResult', ['job', 'success', 'error', 'file', 'sha256'])
+
+# benchmarks are reused by all jobs of an equation running in the same (worker) process
+_BENCHMARKS = {}
+
+def get_suite_benchmark(equation_name):
+  if equation_name not in _BENCHMARKS:
+    _BENCHMARKS[equation_name] = Benchmark(AllEquations[equation_name],initialize_constraint_checking_datasets=False)
+  return _BENCHMARKS[equation_name]
+
+def run_dataset_job(target_folder, job, format = DEFAULT_DATASET_FORMAT, layout = DEFAULT_SUITE_LAYOUT):
+  # module-level so it can be pickled for the process pool;
+  # all randomness comes from job.seed, so the result does not depend on the process running it
+  try:
+    benchmark = get_suite_benchmark(job.equation_name)
+    file_suffix = '' if job.repetition is None else f'_repetition{job.repetition}'
+    if(BenchmarkSuite.create_individual_dataset(target_folder,
+                                                benchmark,
+                                                f'{target_folder}/{job.equation_name}',
+                                                job.noise_level,
+                                                job.sample_size,
+                                                seed = job.seed,
+                                                sampling_patience = 40,
+                                                file_prefix='',
+                                                file_suffix = file_suffix,
+                                                format = format,
+                                                layout = layout,
+                                                skip_existing = False)):
+      file = BenchmarkSuite.get_dataset_file(f'{target_folder}/{job.equation_name}', job.equation_name,
+                                             job.sample_size, job.noise_level, '', file_suffix, format)
+      return DatasetJobResult(job, True, None, file, get_file_sha256(file))
+    return DatasetJobResult(job, False, f"could not generate dataset for {job.equation_name} and sample_size {job.sample_size} noise_level {job.noise_level}", None, None)
+  except Exception:
+    return DatasetJobResult(job, False, traceback.format_exc(), None, None)
+
+def get_manifest_entry(target_folder, result, format, layout):
+  job = result.job
+  return {'equation': job.equation_name,
+          'sample_size': job.sample_size,
+          'noise_level': job.noise_level,
+          'repetition': job.repetition,
+          'seed': job.seed,
+          'format': format,
+          'layout': layout,
+          'version': __version__,
+          'file': os.path.relpath(result.file, target_folder),
+          'size': os.path.getsize(result.file),
+          'sha256': result.sha256}
+
+def report_progress(completed, total, result):
+  job = result.job
+  status = 'done' if result.success else 'FAILED'
+  repetition = '' if job.repetition is None else f' repetition {job.repetition}'
+  print(f'[{completed}/{total}] {job.equation_name} sample_size {job.sample_size} noise_level {job.noise_level}{repetition}: {status}')
+
 class BenchmarkSuite(object):
     _eq_name = None
 
@@ -72,15 +142,29 @@ class BenchmarkSuite(object):
                               Equations = FEYNMAN_SRSD_HARD,
                               sample_sizes = HARD_SAMPLE_SIZES,
                               noise_levels = HARD_NOISE_LEVELS,
-                              repetitions = None):
-      if repetitions > len(SEEDS):
+                              repetitions = None,
+                              workers = 1,
+                              progress = report_progress,
+                              format = DEFAULT_DATASET_FORMAT,
+                              layout = DEFAULT_SUITE_LAYOUT):
+      # runs one job per equation, sample size, noise level and repetition, on a process pool if workers > 1
+      # (workers = None uses all cores); every job is seeded from SEEDS, so the files are identical to a serial run.
+      # returns the results of the failed jobs, `progress(completed, total, result)` is called after every job.
+      # `format` is one of storage.DATASET_FORMATS, parquet and feather fall back to csv if pyarrow is not installed
+      # `layout` is one of SUITE_LAYOUTS: 'combined' writes the test rows into every dataset file,
+      # 'shared_test' writes them once per equation folder (see read_individual_dataset).
+      # every completed dataset is recorded in the suite's manifest (MANIFEST_FILE_NAME); a restarted
+      # run skips the jobs recorded there for the same seed, format, layout and package version
+      format = resolve_format(format)
+      if layout not in SUITE_LAYOUTS:
+        raise ValueError(f'`{layout}` is not a supported suite layout, use one of {SUITE_LAYOUTS}')
+      if repetitions is not None and repetitions > len(SEEDS):
         raise ValueError(f"Only {len(SEEDS)} seeds are predefined. If you change local settings, please report on this fact in your publication and publish the updated seeds in e.g. your repository.")   
 
       if not os.path.exists(target_folder):
         os.makedirs(target_folder)
       for equation_name in Equations:
-        print(equation_name)
-        benchmark = Benchmark(AllEquations[equation_name],initialize_constraint_checking_datasets=False)
+        benchmark = get_suite_benchmark(equation_name)
         equation_folder = f'{target_folder}/{equation_name}'
 
         if not os.path.exists(equation_folder):
@@ -97,35 +181,67 @@ class BenchmarkSuite(object):
           text_file.write('] , "Constraints" : ')
           text_file.write(str(benchmark.get_constraints()).replace('\'',"\""))
           text_file.write("}")
-          
+
+        if(layout == SHARED_TEST_LAYOUT):
+          test_file = BenchmarkSuite.get_test_dataset_file(equation_folder, equation_name, format)
+          if not os.path.exists(test_file):
+            test = benchmark.equation.to_dataframe(benchmark.read_test_dataframe().to_numpy())
+            write_dataframe(test, test_file, format)
+
+      manifest_file = f'{target_folder}/{MANIFEST_FILE_NAME}'
+      completed_jobs = BenchmarkSuite.get_completed_jobs(target_folder, format, layout)
+      jobs = [job for job in BenchmarkSuite.get_hard_instance_jobs(Equations, sample_sizes, noise_levels, repetitions)
+              if job not in completed_jobs]
+      failures = []
+      # the manifest entries are appended in job order (completed jobs wait for the earlier ones),
+      # so the manifest of a parallel run is identical to the serial one
+      pending_results = {}
+      next_index = 0
+      def collect(completed, index, result):
+        nonlocal next_index
+        pending_results[index] = result
+        while next_index in pending_results:
+          next_result = pending_results.pop(next_index)
+          if next_result.success:
+            append_manifest_entry(manifest_file, get_manifest_entry(target_folder, next_result, format, layout))
+          else:
+            failures.append(next_result)
+          next_index += 1
+        if progress is not None:
+          progress(completed, len(jobs), result)
+
+      if workers == 1:
+        for (i, job) in enumerate(jobs):
+          collect(i + 1, i, run_dataset_job(target_folder, job, format, layout))
+      else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+          futures = {executor.submit(run_dataset_job, target_folder, job, format, layout): index for (index, job) in enumerate(jobs)}
+          for (i, future) in enumerate(as_completed(futures)):
+            try:
+              result = future.result()
+            except Exception:
+              # e.g. a worker process that died
+              result = DatasetJobResult(jobs[futures[future]], False, traceback.format_exc(), None, None)
+            collect(i + 1, futures[future], result)
+
+      for failure in failures:
+        warnings.warn(f'{failure.job}: {failure.error}')
+      return failures
+
+    def get_hard_instance_jobs( Equations = FEYNMAN_SRSD_HARD,
+                              sample_sizes = HARD_SAMPLE_SIZES,
+                              noise_levels = HARD_NOISE_LEVELS,
+                              repetitions = None):
+      jobs = []
+      for equation_name in Equations:
         for sample_size in sample_sizes:
           for noise_level in noise_levels:
-              if(repetitions is None):
-                if(not BenchmarkSuite.create_individual_dataset(target_folder,
-                                                      benchmark,
-                                                      equation_folder,
-                                                      noise_level,
-                                                      sample_size,
-                                                      seed = SEEDS[0],
-                                                      sampling_patience = 40,
-                                                      )):
-                  raise Warning(f"could not generate dataset for {equation_name} and sample_size {sample_size} noise_level {noise_level}")
-              
-              else:
-                 for repetition in range(0,repetitions):
-                   
-                   if(not BenchmarkSuite.create_individual_dataset(target_folder,
-                                                      benchmark,
-                                                      equation_folder,
-                                                      noise_level,
-                                                      sample_size,
-                                                      seed = SEEDS[repetition],
-                                                      sampling_patience = 40,
-                                                      file_prefix='',
-                                                      file_suffix = f'_repetition{repetition}'
-                                                      )):
-                      raise Warning(f"could not generate dataset for {equation_name} and sample_size {sample_size} noise_level {noise_level}")   
-         
+            if(repetitions is None):
+              jobs.append(DatasetJob(equation_name, sample_size, noise_level, None, SEEDS[0]))
+            else:
+              for repetition in range(0,repetitions):
+                jobs.append(DatasetJob(equation_name, sample_size, noise_level, repetition, SEEDS[repetition]))
+      return jobs
 
     def create_individual_dataset(target_folder,
                                     benchmark,
@@ -135,14 +251,27 @@ class BenchmarkSuite(object):
                                     seed,
                                     sampling_patience = 40,
                                     file_prefix = '',
-                                    file_suffix = ''):
-        equation_name = benchmark._eq_name
-        target_file = f'{equation_folder}/{file_prefix}{equation_name}_sample_size{sample_size}_noise_level{noise_level}{file_suffix}.csv'
-        if os.path.exists(target_file):
+                                    file_suffix = '',
+                                    format = DEFAULT_DATASET_FORMAT,
+                                    layout = DEFAULT_SUITE_LAYOUT,
+                                    skip_existing = True):
+        equation_name = benchmark.equation.get_eq_name()
+        target_file = BenchmarkSuite.get_dataset_file(equation_folder, equation_name, sample_size, noise_level, file_prefix, file_suffix, format)
+        # files are written atomically, an existing file is complete
+        if skip_existing and os.path.exists(target_file):
            return True
         
         for i in range(1, sampling_patience):
           try:
+            if(layout == SHARED_TEST_LAYOUT):
+              # the test rows are stored once per equation folder by create_hard_instances
+              training = benchmark.equation.to_dataframe(benchmark.create_training_dataset(sample_size=sample_size,
+                                                                                           noise_level=noise_level,
+                                                                                           seed = seed,
+                                                                                           patience = sampling_patience))
+              write_dataframe(training, target_file, format)
+              return True
+
             (training, test) = benchmark.create_dataframe(sample_size=sample_size,
                                                                   noise_level=noise_level,
                                                                   seed = seed,
@@ -151,13 +280,61 @@ class BenchmarkSuite(object):
             training['split'] = ['training'] * len(training)
             test['split'] = ['test'] * len(test)
             combined = pd.concat([training,test])
-            combined.to_csv(target_file, index = False)
+            write_dataframe(combined, target_file, format)
             return True
-          except:
-              print(f'error in {equation_name} with try {i}/{sampling_patience}')
+          except Exception as e:
+              print(f'error in {equation_name} with try {i}/{sampling_patience}: {e!r}')
 
         return False
 
-         
+    def get_dataset_file(equation_folder,
+                         equation_name,
+                         sample_size,
+                         noise_level,
+                         file_prefix = '',
+                         file_suffix = '',
+                         format = DEFAULT_DATASET_FORMAT):
+        return f'{equation_folder}/{file_prefix}{equation_name}_sample_size{sample_size}_noise_level{noise_level}{file_suffix}{FILE_EXTENSIONS[format]}'
+
+    def read_individual_dataset(target_folder,
+                                equation_name,
+                                sample_size,
+                                noise_level,
+                                repetition = None,
+                                format = DEFAULT_DATASET_FORMAT,
+                                layout = DEFAULT_SUITE_LAYOUT):
+        # reads a dataset written by create_hard_instances (training and test rows with their 'split'),
+        # for the 'shared_test' layout the equation's test file is joined on read
+        equation_folder = f'{target_folder}/{equation_name}'
+        file_suffix = '' if repetition is None else f'_repetition{repetition}'
+        dataset = read_dataframe(BenchmarkSuite.get_dataset_file(equation_folder, equation_name,
+                                                                 sample_size, noise_level, '', file_suffix, format), format)
+        if(layout != SHARED_TEST_LAYOUT):
+          return dataset
+        test = read_dataframe(BenchmarkSuite.get_test_dataset_file(equation_folder, equation_name, format), format)
+        dataset['split'] = ['training'] * len(dataset)
+        test['split'] = ['test'] * len(test)
+        return pd.concat([dataset, test], ignore_index = True)
+
+    def get_test_dataset_file(equation_folder, equation_name, format = DEFAULT_DATASET_FORMAT):
+        return f'{equation_folder}/{equation_name}_test{FILE_EXTENSIONS[format]}'
+
+    def get_completed_jobs(target_folder, format = DEFAULT_DATASET_FORMAT, layout = DEFAULT_SUITE_LAYOUT):
+        # jobs recorded in the manifest whose file still exists with the recorded size
+        completed_jobs = set()
+        for entry in read_manifest(f'{target_folder}/{MANIFEST_FILE_NAME}'):
+          file = os.path.join(target_folder, entry['file'])
+          if (entry['format'] != format or entry['layout'] != layout or entry['version'] != __version__
+              or not os.path.exists(file) or os.path.getsize(file) != entry['size']):
+            continue
+          completed_jobs.add(DatasetJob(entry['equation'], entry['sample_size'], entry['noise_level'], entry['repetition'], entry['seed']))
+        return completed_jobs
 
-        
\ No newline at end of file
+    def verify_manifest(target_folder):
+        # returns the manifest entries whose file is missing or does not match the recorded checksum
+        corrupted = []
+        for entry in read_manifest(f'{target_folder}/{MANIFEST_FILE_NAME}'):
+          file = os.path.join(target_folder, entry['file'])
+          if not os.path.exists(file) or get_file_sha256(file) != entry['sha256']:
+            corrupted.append(entry)
+        return corrupted
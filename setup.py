@@ -20,6 +20,14 @@ REQUIRES = [
   "pandas==2.0.1",
 ]
 
+# optional dependencies, e.g. pip install SCRBenchmark[arrow]
+EXTRAS_REQUIRE = {
+  # parquet and feather dataset formats
+  "arrow": ["pyarrow"],
+  # Benchmark.check_constraints(..., Library = "JAX")
+  "jax": ["jax", "filelock"],
+}
+
 setup(
     name=NAME,
     version=VERSION,
@@ -28,8 +36,9 @@ setup(
     author_email="florian.bachinger@fh-hagenberg.at",
     url="",
     keywords=["Benchmark","Shape Constrained Regression", "Symbolic Regression", "SymReg"],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     install_requires=REQUIRES,
+    extras_require=EXTRAS_REQUIRE,
     packages=find_packages(exclude=["test", "tests","example","examples","generate",]),
     include_package_data=True,
     long_description="""\
@@ -26,4 +26,15 @@ print("JAX ICh9Eq18 Test:")
 print(ICh9Eq18.check_constraints(g, Library = "JAX"))
 
 print("SymPy ICh9Eq18 Test:")
-print(ICh9Eq18.check_constraints('6.67430e-11 * x0 * x1 / ((x2 - x3) ** 2 + (x4 - x5) ** 2 + (x6 - x7) ** 2)'))
\ No newline at end of file
+print(ICh9Eq18.check_constraints('6.67430e-11 * x0 * x1 / ((x2 - x3) ** 2 + (x4 - x5) ** 2 + (x6 - x7) ** 2)'))
+
+################ populations of lambdas ################
+# lambdas recreated for every generation hit the jit cache through their cache keys
+def population():
+  return [lambda x: jnp.exp(-(x[0] / x[1]) ** 2 / 2) / (jnp.sqrt(2 * jnp.pi) * x[1]), lambda x: x[0] * x[1]]
+
+first_generation = ICh6Eq20.check_constraints_batch(population(), Library = "JAX", cache_keys = ['gaussian', 'product'])
+misses = ICh6Eq20.jax_cache.info().misses
+second_generation = ICh6Eq20.check_constraints_batch(population(), Library = "JAX", cache_keys = ['gaussian', 'product'])
+assert ICh6Eq20.jax_cache.info().misses == misses
+assert [result[0] for result in first_generation] == [result[0] for result in second_generation] == [True, False]
@@ -19,11 +19,13 @@ BenchmarkSuite.create_hard_instances(target_folder=folder1
                                      , noise_levels=HARD_NOISE_LEVELS
                                      , repetitions= 2 )
 
+# the parallel run has to produce the same files as the serial one
 BenchmarkSuite.create_hard_instances(target_folder=folder2
                                      , Equations=FEYNMAN_SRSD_HARD
                                      , sample_sizes= HARD_SAMPLE_SIZES
                                      , noise_levels=HARD_NOISE_LEVELS
-                                     , repetitions= 2 )
+                                     , repetitions= 2
+                                     , workers= 4 )
 
 for subdir, dirs, files in os.walk(folder1):
   for file in files:
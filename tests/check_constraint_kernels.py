@@ -0,0 +1,35 @@
+import numpy as np
+import sympy
+
+import SCRBenchmark.SRSDFeynman as srsdf
+import SCRBenchmark.base as base
+
+# the array-native kernels must match the per-row evaluation of the lambdified derivatives
+for name in srsdf.AllEquations:
+  equation = srsdf.AllEquations[name]()
+  xs = equation.create_input_dataset(1000)
+  local_dict = equation.get_sympy_eq_local_dict()
+
+  for var in equation.get_vars():
+    derivative = sympy.Derivative(equation.sympy_eq, var).doit()
+
+    f_v = np.vectorize(sympy.lambdify(local_dict.keys(), derivative, "numpy"))
+    expected = f_v(*(xs.T))
+    actual = base.compile_constraint_kernel(derivative, local_dict.keys())(*(xs.T))
+
+    # the evaluation order differs, so the tolerance accounts for cancellation between the summands
+    summands = [np.vectorize(sympy.lambdify(local_dict.keys(), term, "numpy"))(*(xs.T)) for term in sympy.Add.make_args(derivative)]
+    scale = np.sum(np.abs(summands), axis = 0)
+
+    assert actual.shape == (len(xs),)
+    assert np.all(np.isclose(expected, actual, rtol=1e-6, atol=0, equal_nan=True) | (np.abs(expected - actual) <= 1e-9 * scale)), f'{name} d/d{var.name}'
+
+# derivatives that simplify to an integer constant are evaluated as floats, also on single precision datasets
+x0 = sympy.Symbol('x0')
+assert base.compile_constraint_kernel(sympy.Integer(1), [x0])(np.ones(3, dtype=np.float32)).dtype.kind == 'f'
+
+from SCRBenchmark import Benchmark
+ICh6Eq20 = Benchmark(srsdf.FeynmanICh6Eq20)
+ICh6Eq20_32 = Benchmark(srsdf.FeynmanICh6Eq20, constraint_dtype = np.float32)
+for candidate in ['x0', 'x0*x1']:
+  assert ICh6Eq20_32.check_constraints(candidate) == ICh6Eq20.check_constraints(candidate), candidate
@@ -0,0 +1,62 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+import SCRBenchmark.SRSDFeynman as srsdf
+import SCRBenchmark.base as base
+import SCRBenchmark.storage as storage
+from SCRBenchmark import Benchmark
+
+# the running moments of blocks of different sizes match numpy's over all values
+rng = np.random.default_rng(0)
+blocks = [rng.normal(1.0e3, 2.0, size) for size in [1, 0, 999, 10_000, 3]]
+moments = base.RunningMoments()
+for block in blocks:
+  moments.add(block)
+values = np.concatenate(blocks)
+assert moments.count == len(values)
+assert np.isclose(moments.mean, np.mean(values), rtol=1e-12, atol=0)
+assert np.isclose(moments.get_std(), np.std(values), rtol=1e-9, atol=0)
+
+# writing block by block gives the same dataset as writing the whole dataframe at once
+columns = ['x0', 'x1', 'f']
+blocks = [rng.normal(size=(size, len(columns))) * 10.0 ** rng.uniform(-20, 20, size=(size, 1)) for size in [400, 1000, 7]]
+df = pd.DataFrame(np.concatenate(blocks), columns=columns)
+folder = tempfile.mkdtemp()
+for format in ['csv', 'npy', 'parquet', 'feather']:
+  if not storage.is_format_available(format):
+    print(f'{format} is not available, skipped')
+    continue
+  block_file = os.path.join(folder, f'blocks{storage.FILE_EXTENSIONS[format]}')
+  whole_file = os.path.join(folder, f'whole{storage.FILE_EXTENSIONS[format]}')
+  storage.write_dataset_blocks(iter(blocks), block_file, columns, len(df))
+  storage.write_dataframe(df, whole_file)
+  (from_blocks, whole) = (storage.read_dataframe(block_file), storage.read_dataframe(whole_file))
+  assert list(from_blocks.columns) == list(whole.columns) == columns, format
+  assert from_blocks.to_numpy().tobytes() == whole.to_numpy().tobytes() == df.to_numpy().tobytes(), format
+
+  # a wrong row count is an error and leaves no file behind
+  mismatch_file = os.path.join(folder, f'mismatch{storage.FILE_EXTENSIONS[format]}')
+  try:
+    storage.write_dataset_blocks(iter(blocks), mismatch_file, columns, len(df) + 1)
+    raise AssertionError(f'{format}: the row count mismatch was not detected')
+  except ValueError:
+    pass
+  assert not os.path.exists(mismatch_file), format
+  assert [file for file in os.listdir(folder) if file.endswith('.tmp')] == [], format
+
+# npz stores whole columns and cannot be written block by block
+try:
+  storage.write_dataset_blocks(iter(blocks), os.path.join(folder, 'blocks.npz'), columns, len(df))
+  raise AssertionError('npz was written block by block')
+except ValueError:
+  pass
+
+# write_training_dataset streams exactly the blocks of iter_training_dataset_blocks
+ICh6Eq20 = Benchmark(srsdf.FeynmanICh6Eq20, initialize_constraint_checking_datasets=False)
+file = os.path.join(folder, 'training.npy')
+ICh6Eq20.write_training_dataset(file, 2500, noise_level=0.1, seed=0, block_size=1000)
+expected = np.concatenate(list(ICh6Eq20.iter_training_dataset_blocks(2500, noise_level=0.1, seed=0, block_size=1000)))
+assert storage.read_dataframe(file).to_numpy().tobytes() == expected.tobytes()
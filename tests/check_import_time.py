@@ -0,0 +1,39 @@
+import statistics
+import subprocess
+import sys
+
+# import time regression check: every entry point is imported in a fresh interpreter, the heavy
+# dependencies must only be loaded by the code paths using them
+REPETITIONS = 5
+HEAVY_MODULES = ['jax', 'sympy.core', 'pandas.core', 'SCRBenchmark.SRSDFeynman.feynman']
+
+ENTRY_POINTS = {
+  'import SCRBenchmark': ('import SCRBenchmark', HEAVY_MODULES),
+  'import SCRBenchmark.SRSDFeynman': ('import SCRBenchmark.SRSDFeynman', HEAVY_MODULES),
+  'equation class': ('from SCRBenchmark.SRSDFeynman import FeynmanICh6Eq20', ['jax', 'sympy.core', 'pandas.core']),
+  'data generation': ('import SCRBenchmark.SRSDFeynman as srsdf\n'
+                      'from SCRBenchmark import Benchmark\n'
+                      'Benchmark(srsdf.FeynmanICh6Eq20, initialize_constraint_checking_datasets = False).create_training_dataset(100, seed = 0)',
+                      ['jax', 'sympy.core', 'pandas.core']),
+  # the capability probe of the optional JAX backend does not import JAX
+  'available libraries': ('from SCRBenchmark import get_available_libraries\n'
+                          'get_available_libraries()', ['jax']),
+}
+
+MEASURE = '''
+import sys, time
+start = time.perf_counter()
+exec({code!r})
+print(time.perf_counter() - start)
+print(','.join(module for module in {modules!r} if module in sys.modules))
+'''
+
+for (name, (code, absent_modules)) in ENTRY_POINTS.items():
+  seconds = []
+  for _ in range(REPETITIONS):
+    output = subprocess.run([sys.executable, '-c', MEASURE.format(code = code, modules = absent_modules)],
+                            check = True, capture_output = True, text = True).stdout.splitlines()
+    seconds.append(float(output[0]))
+    loaded_modules = [module for module in output[1].split(',') if module]
+    assert len(loaded_modules) == 0, f'{name} loaded {loaded_modules}'
+  print(f'{name}: {statistics.median(seconds) * 1000:.1f} ms (median of {REPETITIONS})')
@@ -0,0 +1,18 @@
+import os
+import tempfile
+
+import jax.numpy as jnp
+
+import SCRBenchmark.SRSDFeynman as srsdf
+from SCRBenchmark import Benchmark
+
+# the on-disk compilation cache is configured once per process, so this check runs in its own script
+cache_dir = tempfile.mkdtemp()
+ICh6Eq20 = Benchmark(srsdf.FeynmanICh6Eq20, jax_compilation_cache_dir = cache_dir)
+
+def f(x):
+  return jnp.exp(-(x[0] / x[1]) ** 2 / 2) / (jnp.sqrt(2 * jnp.pi) * x[1])
+
+ICh6Eq20.check_constraints(f, Library = "JAX")
+assert ICh6Eq20.jax_cache.info().compilations > 0
+assert len(os.listdir(cache_dir)) > 0, 'no compiled executable was written to the persistent cache'
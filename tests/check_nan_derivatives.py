@@ -0,0 +1,23 @@
+import numpy as np
+
+import SCRBenchmark.Constants.StringKeys as sk
+import SCRBenchmark.SRSDFeynman as srsdf
+import SCRBenchmark.base as base
+from SCRBenchmark import Benchmark
+
+# NaN gradients do not describe any monotonicity and contradict every expected descriptor
+assert base.get_constraint_descriptor_for_signs(set([1, np.nan])) == sk.EQUATION_CONSTRAINTS_DESCRIPTOR_UNKOWN_CONSTRAINT
+assert base.get_constraint_descriptor_for_gradients(np.array([np.nan, 1.0])) == sk.EQUATION_CONSTRAINTS_DESCRIPTOR_UNKOWN_CONSTRAINT
+statistics = base.ViolationStatistics.from_gradients(np.array([np.nan, 1.0, 2.0]), sk.EQUATION_CONSTRAINTS_DESCRIPTOR_MONOTONIC_INCREASING_CONSTRAINT)
+assert statistics.is_contradicted() and statistics.violating_samples == 1
+
+# sqrt(x2 - x3) is undefined for half of the sampled inputs
+ICh9Eq18 = Benchmark(srsdf.FeynmanICh9Eq18)
+with np.errstate(invalid='ignore'):
+  for chunk_size in [None, 100]:
+    (is_admissible, violated_constraints, statistics) = ICh9Eq18.check_constraints('sqrt(x2 - x3)', chunk_size = chunk_size, return_statistics = True)
+    assert not is_admissible
+    nan_constraints = [constraint for constraint in violated_constraints if statistics[constraint['id']].nan > 0]
+    assert len(nan_constraints) > 0
+    for constraint in nan_constraints:
+      assert statistics[constraint['id']].is_contradicted()
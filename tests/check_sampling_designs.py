@@ -0,0 +1,45 @@
+import numpy as np
+
+from SCRBenchmark.sampling import HaltonSampling, LatinHypercubeSampling, SobolSampling, sample_unit_design, UNIT_DESIGNS
+
+# every design stays in the value range of its sampler, with the configured signs and (log-)scaling
+sample_size = 4096
+for sampling_class in [SobolSampling, HaltonSampling, LatinHypercubeSampling]:
+  for log_scale in [False, True]:
+    for (uses_positive, uses_negative) in [(True, True), (True, False), (False, True)]:
+      (min_value, max_value) = (1.0e-2, 1.0e2) if log_scale else (1.0, 3.0)
+      sampling_obj = sampling_class(min_value, max_value, uses_positive, uses_negative, log_scale = log_scale)
+      values = sampling_obj(sample_size, rng = np.random.default_rng(0))
+      configuration = (sampling_class.__name__, log_scale, uses_positive, uses_negative)
+
+      magnitudes = np.abs(values)
+      assert values.shape == (sample_size,), configuration
+      assert np.all((min_value <= magnitudes) & (magnitudes <= max_value)), configuration
+      (low, high) = sampling_obj.get_value_range()
+      assert np.all((low <= values) & (values <= high)), configuration
+      positive_fraction = np.mean(values > 0)
+      expected_fraction = 0.5 if uses_positive and uses_negative else float(uses_positive)
+      assert abs(positive_fraction - expected_fraction) < 0.01, configuration
+
+      # the magnitudes are uniform in log space (log_scale) or in linear space
+      scaled = np.log10(magnitudes) if log_scale else magnitudes
+      (scaled_min, scaled_max) = (np.log10(min_value), np.log10(max_value)) if log_scale else (min_value, max_value)
+      unit = np.sort((scaled - scaled_min) / (scaled_max - scaled_min))
+      assert np.max(np.abs(unit - (np.arange(sample_size) + 0.5) / sample_size)) < 0.01, configuration
+
+# the unit designs cover [0, 1)^d and are stratified in every dimension
+for design in UNIT_DESIGNS:
+  unit_samples = sample_unit_design(design, 1024, 3, rng = np.random.default_rng(0))
+  assert unit_samples.shape == (1024, 3) and np.all((0 <= unit_samples) & (unit_samples < 1)), design
+  if design != 'uniform':
+    for dim in range(3):
+      counts = np.bincount((unit_samples[:, dim] * 16).astype(int), minlength = 16)
+      assert np.all(np.abs(counts - 64) <= 2), design
+
+# the default constraint sampling size is looked up when the Benchmark is created
+import SCRBenchmark.benchmark as benchmark
+import SCRBenchmark.SRSDFeynman as srsdf
+default_size = benchmark.CONSTRAINT_SAMPLING_SIZE
+benchmark.CONSTRAINT_SAMPLING_SIZE = 1000
+assert benchmark.Benchmark(srsdf.FeynmanICh6Eq20, initialize_constraint_checking_datasets = False).constraint_sampling_size == 1000
+benchmark.CONSTRAINT_SAMPLING_SIZE = default_size
@@ -0,0 +1,29 @@
+import numpy as np
+
+import SCRBenchmark.SRSDFeynman as srsdf
+from SCRBenchmark.sampling import SamplingPlan
+
+# the vectorized SamplingPlan draws every sampler configuration of the equations from the same
+# distribution as calling the sampler on its own (same range, signs and (log-)scale)
+sample_size = 20_000
+configurations = {}
+for name in srsdf.AllEquations:
+  for sampling_obj in srsdf.AllEquations[name]().sampling_objs:
+    configurations.setdefault((type(sampling_obj).__name__, sampling_obj.min_value, sampling_obj.max_value,
+                               sampling_obj.uses_positive, sampling_obj.uses_negative), sampling_obj)
+
+for (configuration, sampling_obj) in configurations.items():
+  planned = SamplingPlan([sampling_obj])(sample_size, rng = np.random.default_rng(0))[:, 0]
+  called = np.asarray(sampling_obj(sample_size, rng = np.random.default_rng(1)), dtype = float)
+
+  for sign in [-1, 1]:
+    assert abs(np.mean(np.sign(planned) == sign) - np.mean(np.sign(called) == sign)) < 0.02, configuration
+  if type(sampling_obj).__name__ == 'IntegerSampling':
+    assert set(np.unique(planned)) == set(np.unique(called)), configuration
+  else:
+    # quantiles of the (log-)magnitudes agree up to the sampling error, relative to the width of the range
+    log_scale = type(sampling_obj).__name__ == 'DefaultSampling'
+    (planned_magnitudes, called_magnitudes) = [np.log10(np.abs(values)) if log_scale else np.abs(values) for values in (planned, called)]
+    width = np.max(called_magnitudes) - np.min(called_magnitudes)
+    quantiles = [0.0, 0.1, 0.5, 0.9, 1.0]
+    assert np.allclose(np.quantile(planned_magnitudes, quantiles), np.quantile(called_magnitudes, quantiles), rtol = 0, atol = 0.02 * width), configuration
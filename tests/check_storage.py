@@ -0,0 +1,52 @@
+import os
+import tempfile
+import warnings
+
+import numpy as np
+import pandas as pd
+
+import SCRBenchmark.storage as storage
+
+# every dataset format round-trips the float64 columns bit-exactly and keeps the split column
+rng = np.random.default_rng(0)
+training = pd.DataFrame({'x0': 10.0 ** rng.uniform(-30, 30, 1000) * rng.choice([-1, 1], 1000), 'x1': rng.normal(size=1000)})
+training['f'] = training['x0'] * training['x1']
+test = training.iloc[:300].copy()
+training['split'] = 'training'
+test['split'] = 'test'
+df = pd.concat([training, test], ignore_index=True)
+
+folder = tempfile.mkdtemp()
+for format in storage.DATASET_FORMATS:
+  if not storage.is_format_available(format):
+    print(f'{format} is not available, skipped')
+    continue
+  file = os.path.join(folder, f'dataset{storage.FILE_EXTENSIONS[format]}')
+  storage.write_dataframe(df, file)
+  read = storage.read_dataframe(file)
+  assert list(read.columns) == list(df.columns), format
+  for column in ['x0', 'x1', 'f']:
+    assert read[column].to_numpy().tobytes() == df[column].to_numpy().tobytes(), f'{format} {column}'
+  assert list(read['split']) == list(df['split']), format
+
+# npz and npy store the split as one byte code into storage.SPLITS
+with np.load(os.path.join(folder, 'dataset.npz')) as arrays:
+  assert arrays['column3'].dtype == np.uint8
+assert np.load(os.path.join(folder, 'dataset.npy')).dtype['split'] == np.uint8
+
+# the arrow formats fall back to csv if pyarrow is not installed
+is_format_available = storage.is_format_available
+storage.is_format_available = lambda format: format not in storage.ARROW_FORMATS
+with warnings.catch_warnings(record=True) as caught:
+  warnings.simplefilter('always')
+  assert storage.resolve_format('parquet') == 'csv'
+  assert len(caught) == 1
+storage.is_format_available = is_format_available
+
+# unknown formats and file extensions are rejected
+for (call, argument) in [(storage.get_file_format, 'dataset.txt'), (storage.resolve_format, 'txt')]:
+  try:
+    call(argument)
+    raise AssertionError(f'{argument} was accepted')
+  except ValueError:
+    pass
@@ -0,0 +1,51 @@
+import os
+import shutil
+import tempfile
+
+from SCRBenchmark import BenchmarkSuite
+from SCRBenchmark.suite import MANIFEST_FILE_NAME
+from SCRBenchmark.storage import read_manifest
+
+# an interrupted run (truncated manifest line, truncated dataset file) is completed by rerunning
+# create_hard_instances, which only repeats the affected jobs and reproduces the same files
+folder = os.path.join(tempfile.mkdtemp(), 'suite')
+arguments = dict(Equations = ['FeynmanICh6Eq20a', 'FeynmanICh29Eq4'], sample_sizes = [100], noise_levels = [0, 0.1], repetitions = 2, progress = None)
+assert BenchmarkSuite.create_hard_instances(folder, **arguments) == []
+assert BenchmarkSuite.verify_manifest(folder) == []
+
+entries = read_manifest(os.path.join(folder, MANIFEST_FILE_NAME))
+assert len(entries) == 8
+reference = {}
+for entry in entries:
+  with open(os.path.join(folder, entry['file']), 'rb') as handle:
+    reference[entry['file']] = handle.read()
+
+# the last manifest line is cut in the middle, the dataset of the first entry is cut in half
+manifest_file = os.path.join(folder, MANIFEST_FILE_NAME)
+with open(manifest_file, 'rb+') as handle:
+  handle.truncate(os.path.getsize(manifest_file) - 20)
+truncated_file = os.path.join(folder, entries[0]['file'])
+with open(truncated_file, 'rb+') as handle:
+  handle.truncate(len(reference[entries[0]['file']]) // 2)
+assert len(read_manifest(manifest_file)) == 7
+assert [entry['file'] for entry in BenchmarkSuite.verify_manifest(folder)] == [entries[0]['file']]
+
+rerun_jobs = []
+arguments['progress'] = lambda completed, total, result: rerun_jobs.append(result.job)
+assert BenchmarkSuite.create_hard_instances(folder, **arguments) == []
+assert len(rerun_jobs) == 2
+assert BenchmarkSuite.verify_manifest(folder) == []
+for (file, content) in reference.items():
+  with open(os.path.join(folder, file), 'rb') as handle:
+    assert handle.read() == content, file
+
+# a file that keeps its size but not its content is reported by verify_manifest
+changed_file = os.path.join(folder, entries[1]['file'])
+with open(changed_file, 'rb+') as handle:
+  handle.seek(-2, os.SEEK_END)
+  byte = handle.read(1)
+  handle.seek(-2, os.SEEK_END)
+  handle.write(b'7' if byte != b'7' else b'8')
+assert [entry['file'] for entry in BenchmarkSuite.verify_manifest(folder)] == [entries[1]['file']]
+
+shutil.rmtree(os.path.dirname(folder))
@@ -0,0 +1,27 @@
+import numpy as np
+
+import SCRBenchmark.SRSDFeynman as srsdf
+
+# sampling within the declared validity domains keeps the joint distribution of plain rejection sampling
+# (same quantiles of every input column) and needs fewer draws
+sample_size = 50_000
+quantiles = [0.1, 0.25, 0.5, 0.75, 0.9]
+for name in srsdf.AllEquations:
+  equation = srsdf.AllEquations[name]()
+  if equation.validity_domain is None:
+    continue
+  (rejection, rejection_diagnostics) = equation.create_dataset(sample_size, return_diagnostics = True, rng = np.random.default_rng(0), use_validity_domain = False)
+  (bounded, bounded_diagnostics) = equation.create_dataset(sample_size, return_diagnostics = True, rng = np.random.default_rng(1))
+  assert bounded_diagnostics.acceptance_rate > rejection_diagnostics.acceptance_rate + 0.05, name
+
+  for i in range(rejection.shape[1]):
+    (expected, actual) = (rejection[:, i], bounded[:, i])
+    assert abs(np.mean(expected > 0) - np.mean(actual > 0)) < 0.02, f'{name} x{i}'
+    # log-magnitudes of the columns spanning orders of magnitude
+    (expected, actual) = [np.log10(np.abs(values[values != 0])) for values in (expected, actual)]
+    width = np.quantile(expected, 0.99) - np.quantile(expected, 0.01)
+    assert np.allclose(np.quantile(expected, quantiles), np.quantile(actual, quantiles), rtol = 0, atol = 0.02 * width + 1e-12), f'{name} x{i}'
+
+# the plan and the valid probabilities it estimates are built once per equation
+equation = srsdf.FeynmanIICh24Eq17()
+assert equation.get_sampling_plan() is equation.get_sampling_plan()
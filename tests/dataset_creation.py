@@ -1,6 +1,8 @@
 import numpy as np
 
 import SCRBenchmark.SRSDFeynman as srsdf
+import SCRBenchmark.base as base
+from SCRBenchmark.sampling import SamplingPlan, SimpleSampling
 from SCRBenchmark import Benchmark
 
 ICh6Eq20 = Benchmark(srsdf.FeynmanICh6Eq20)
@@ -13,3 +15,40 @@ test_df_to_np = test_df.to_numpy()
 
 assert((training==train_df_to_np).all())
 assert((test==test_df_to_np).all())
+
+
+# datasets only depend on their seed, not on the global np.random state or on earlier calls
+np.random.seed(1)
+ICh6Eq20.create_dataset(sample_size=500,noise_level = 0.1,seed = 1, patience= 10)
+(repeated_training, _) = ICh6Eq20.create_dataset(sample_size=1000,noise_level = 0,seed = 0, patience= 10)
+assert((training==repeated_training).all())
+
+training_only = ICh6Eq20.create_training_dataset(sample_size=1000,noise_level = 0,seed = 0, patience= 10)
+assert((training==training_only).all())
+
+# single precision datasets: same dtype for training and test data, outputs close to the double precision values
+(training32, test32) = ICh6Eq20.create_dataset(sample_size=1000,noise_level = 0,seed = 0, patience= 10, dtype = np.float32)
+assert(training32.dtype == np.float32 and test32.dtype == np.float32)
+y64 = ICh6Eq20.equation.eq_func([training32[:,i].astype(np.float64) for i in range(training32.shape[1]-1)])
+assert(np.allclose(training32[:,-1], y64, rtol = 1e-4))
+
+# a refill after a round without valid samples is drawn in chunks of at most MAX_REFILL_CHUNK_BYTES
+class RecordingPlan(SamplingPlan):
+  def __call__(self, sample_size, rng = None, dtype = np.float64):
+    self.draw_sizes.append(sample_size)
+    return super().__call__(sample_size, rng, dtype)
+
+plan = RecordingPlan([SimpleSampling(0, 1, uses_negative = False)] * 3)
+plan.draw_sizes = []
+calls = []
+def eq_func(x):
+  calls.append(len(x[0]))
+  # nothing is valid in the first round, 2% afterwards
+  return np.where(x[0] < (0 if len(calls) == 1 else 0.02), 1.0, np.nan)
+
+sample_size = 200_000
+(data, diagnostics) = base.create_dataset_from_sampling_objectives(plan, 'x', eq_func, lambda y, dtype = None: np.isfinite(y), sample_size,
+                                                                   return_diagnostics = True, rng = np.random.default_rng(0))
+assert(data.shape == (sample_size, 4) and np.isfinite(data).all())
+assert(max(plan.draw_sizes[1:]) <= max(sample_size, base.MAX_REFILL_CHUNK_BYTES // (8 * 4)))
+assert(diagnostics.rounds == 2)